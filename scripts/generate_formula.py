@@ -9,8 +9,14 @@ Usage:
 import json
 import sys
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Optional
 
+# Pinned versions are immutable on PyPI, so resolved sdists can be reused
+CACHE_FILE = Path(__file__).with_name(".pypi_cache.json")
+MAX_WORKERS = 8
+
 
 DEPENDENCIES = [
     # (pypi_name, version)
@@ -50,7 +56,7 @@ def get_pypi_info(package: str, version: str) -> Optional[dict]:
     url = f"https://pypi.org/pypi/{package}/{version}/json"
     try:
         with urllib.request.urlopen(url, timeout=10) as response:
-            return json.loads(response.read().decode())
+            return json.load(response)
     except Exception as e:
         print(f"  # Warning: Could not fetch {package}: {e}", file=sys.stderr)
         return None
@@ -64,6 +70,37 @@ def get_sdist_info(pypi_data: dict) -> Optional[tuple]:
     return None
 
 
+def load_cache() -> dict:
+    """Load cached sdist info keyed by "package==version"."""
+    try:
+        return json.loads(CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache: dict) -> None:
+    """Persist sdist cache, ignoring write failures."""
+    try:
+        CACHE_FILE.write_text(json.dumps(cache, indent=2, sort_keys=True))
+    except OSError:
+        pass
+
+
+def fetch_sdist(dep: tuple) -> tuple:
+    """Fetch sdist info for a (package, version) pair.
+
+    Returns (status, sdist) where status is "ok", "no-sdist" or "failed".
+    """
+    package, version = dep
+    info = get_pypi_info(package, version)
+    if not info:
+        return "failed", None
+    sdist = get_sdist_info(info)
+    if not sdist:
+        return "no-sdist", None
+    return "ok", sdist
+
+
 def generate_resource_block(name: str, url: str, sha256: str) -> str:
     """Generate a Homebrew resource block."""
     return f'''  resource "{name}" do
@@ -77,20 +114,35 @@ def main():
     print("# Fetching PyPI package information...", file=sys.stderr)
     print("# This may take a moment...\n", file=sys.stderr)
 
+    cache = load_cache()
+    pending = [dep for dep in DEPENDENCIES if f"{dep[0]}=={dep[1]}" not in cache]
+
+    # Fetch uncached packages concurrently; map() preserves input order
+    fetched = {}
+    if pending:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            fetched = dict(zip(pending, executor.map(fetch_sdist, pending)))
+
     resources = []
     for package, version in DEPENDENCIES:
-        info = get_pypi_info(package, version)
-        if info:
-            sdist = get_sdist_info(info)
-            if sdist:
-                url, sha256 = sdist
-                resources.append(generate_resource_block(package, url, sha256))
-                print(f"  # Found: {package} {version}", file=sys.stderr)
-            else:
-                resources.append(f'  # MANUAL: {package} {version} - no sdist found\n')
+        key = f"{package}=={version}"
+        if key in cache:
+            status, sdist = "ok", tuple(cache[key])
+        else:
+            status, sdist = fetched[(package, version)]
+
+        if status == "ok":
+            url, sha256 = sdist
+            cache[key] = [url, sha256]
+            resources.append(generate_resource_block(package, url, sha256))
+            print(f"  # Found: {package} {version}", file=sys.stderr)
+        elif status == "no-sdist":
+            resources.append(f'  # MANUAL: {package} {version} - no sdist found\n')
         else:
             resources.append(f'  # MANUAL: {package} {version} - fetch failed\n')
 
+    save_cache(cache)
+
     # Print the formula
     print('''# typed: false
 # frozen_string_literal: true
@@ -8,13 +8,34 @@ Defines the structured message format for AI-to-AI communication.
 Enables models to exchange context, reasoning, critiques, and synthesis.
 """
 
+import sys
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Optional
 from uuid import uuid4
 
 
+# Drop the per-instance __dict__ where supported (dataclass slots need 3.10+)
+_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+_PROMPT_TEMPLATE = (
+    "[AICL MESSAGE from {sender_model} as {role}]\n"
+    "Intent: {intent}\n"
+    "Confidence: {confidence:.0%}\n"
+    "\n"
+    "Content:\n"
+    "{content}{reasoning_part}{code_part}\n"
+    "[/AICL MESSAGE]"
+)
+
+
+def _now_iso() -> str:
+    """Current UTC time as a naive ISO-8601 string (the historical format)."""
+    return datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
+
+
 class AICLRole(str, Enum):
     """Role of the AI agent in the conversation."""
     INITIATOR = "initiator"      # Starts the task
@@ -63,7 +84,7 @@ class AICLIntent(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AICLContext:
     """
     Shared context between AI agents.
@@ -85,7 +106,7 @@ class AICLContext:
         self.artifacts[key] = {
             "value": value,
             "type": artifact_type,
-            "added_at": datetime.utcnow().isoformat(),
+            "added_at": _now_iso(),
         }
 
     def get_artifact(self, key: str) -> Any:
@@ -95,14 +116,14 @@ class AICLContext:
         return None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AICLMessage:
     """
     A single message in the AICL protocol.
     Structured for AI-to-AI understanding and processing.
     """
     id: str = field(default_factory=lambda: str(uuid4()))
-    timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = field(default_factory=_now_iso)
 
     # Identity
     sender_model: str = ""  # e.g., "claude-opus-4-5", "gpt-5.1-codex"
@@ -125,39 +146,44 @@ class AICLMessage:
     code_blocks: list[dict[str, str]] = field(default_factory=list)
     citations: list[dict[str, str]] = field(default_factory=list)
 
+    # Rendered to_prompt() output; messages are not modified once sent
+    _prompt_cache: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def to_prompt(self) -> str:
         """Convert to a prompt string for the receiving model."""
-        lines = [
-            f"[AICL MESSAGE from {self.sender_model} as {self.sender_role.value}]",
-            f"Intent: {self.intent.value}",
-            f"Confidence: {self.confidence:.0%}",
-            "",
-            "Content:",
-            self.content,
-        ]
-
-        if self.reasoning:
-            lines.extend(["", "Reasoning:", self.reasoning])
+        if self._prompt_cache is not None:
+            return self._prompt_cache
 
+        reasoning_part = f"\n\nReasoning:\n{self.reasoning}" if self.reasoning else ""
+        code_part = ""
         if self.code_blocks:
-            lines.append("")
-            for block in self.code_blocks:
-                lang = block.get("language", "")
-                code = block.get("code", "")
-                lines.append(f"```{lang}\n{code}\n```")
-
-        lines.append("[/AICL MESSAGE]")
-        return "\n".join(lines)
-
-
-@dataclass
+            code_part = "\n\n" + "\n".join(
+                f"```{block.get('language', '')}\n{block.get('code', '')}\n```"
+                for block in self.code_blocks
+            )
+
+        self._prompt_cache = _PROMPT_TEMPLATE.format_map({
+            "sender_model": self.sender_model,
+            "role": self.sender_role.value,
+            "intent": self.intent.value,
+            "confidence": self.confidence,
+            "content": self.content,
+            "reasoning_part": reasoning_part,
+            "code_part": code_part,
+        })
+        return self._prompt_cache
+
+
+@dataclass(**_SLOTS)
 class AICLConversation:
     """
     A complete AICL conversation between multiple AI agents.
     Tracks the full history and shared context.
     """
     id: str = field(default_factory=lambda: str(uuid4()))
-    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    created_at: str = field(default_factory=_now_iso)
 
     context: AICLContext = field(default_factory=AICLContext)
     messages: list[AICLMessage] = field(default_factory=list)
@@ -169,29 +195,52 @@ class AICLConversation:
     status: str = "active"  # active, paused, completed, failed
     final_output: Optional[str] = None
 
+    # Lookup indices maintained by add_message()
+    _by_model: dict[str, list[AICLMessage]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _by_intent: dict[AICLIntent, list[AICLMessage]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.reindex()
+
     def add_model(self, model_id: str, role: AICLRole, provider: str) -> None:
         """Register a participating model."""
         self.models[model_id] = {
             "role": role.value,
             "provider": provider,
-            "joined_at": datetime.utcnow().isoformat(),
+            "joined_at": _now_iso(),
             "message_count": 0,
         }
 
     def add_message(self, message: AICLMessage) -> None:
         """Add a message to the conversation."""
         self.messages.append(message)
+        self._index(message)
         if message.sender_model in self.models:
             self.models[message.sender_model]["message_count"] += 1
         self.context.current_iteration += 1
 
+    def _index(self, message: AICLMessage) -> None:
+        self._by_model.setdefault(message.sender_model, []).append(message)
+        self._by_intent.setdefault(message.intent, []).append(message)
+
+    def reindex(self) -> None:
+        """Rebuild lookup indices after `messages` is replaced wholesale."""
+        self._by_model = {}
+        self._by_intent = {}
+        for message in self.messages:
+            self._index(message)
+
     def get_messages_by_model(self, model_id: str) -> list[AICLMessage]:
         """Get all messages from a specific model."""
-        return [m for m in self.messages if m.sender_model == model_id]
+        return list(self._by_model.get(model_id, ()))
 
     def get_messages_by_intent(self, intent: AICLIntent) -> list[AICLMessage]:
         """Get all messages with a specific intent."""
-        return [m for m in self.messages if m.intent == intent]
+        return list(self._by_intent.get(intent, ()))
 
     def build_context_for_model(self, target_model: str) -> str:
         """
@@ -209,20 +258,19 @@ class AICLConversation:
             "Participating Models:",
         ]
 
-        for model_id, info in self.models.items():
-            marker = " (you)" if model_id == target_model else ""
-            lines.append(f"  - {model_id}{marker}: {info['role']}")
+        lines.extend(
+            f"  - {model_id}{' (you)' if model_id == target_model else ''}: {info['role']}"
+            for model_id, info in self.models.items()
+        )
 
         if self.context.constraints:
             lines.extend(["", "Constraints:"])
-            for c in self.context.constraints:
-                lines.append(f"  - {c}")
+            lines.extend(f"  - {c}" for c in self.context.constraints)
 
         lines.extend(["", "=== CONVERSATION HISTORY ===", ""])
 
         for msg in self.messages[-10:]:  # Last 10 messages for context
-            lines.append(msg.to_prompt())
-            lines.append("")
+            lines.extend((msg.to_prompt(), ""))
 
         lines.append("=== YOUR TURN ===")
         return "\n".join(lines)
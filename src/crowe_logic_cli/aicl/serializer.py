@@ -3,10 +3,9 @@
 
 """AICL Serialization - Convert AICL objects to/from JSON."""
 
-import json
-from dataclasses import asdict
 from typing import Any
 
+from ..jsonutil import dumps, loads
 from .protocol import (
     AICLMessage,
     AICLRole,
@@ -15,6 +14,10 @@ from .protocol import (
     AICLConversation,
 )
 
+# Direct value -> member maps; skips the Enum constructor on bulk loads
+_ROLES = AICLRole._value2member_map_
+_INTENTS = AICLIntent._value2member_map_
+
 
 class AICLSerializer:
     """Serialize and deserialize AICL protocol objects."""
@@ -22,22 +25,46 @@ class AICLSerializer:
     @staticmethod
     def message_to_dict(msg: AICLMessage) -> dict[str, Any]:
         """Convert an AICLMessage to a dictionary."""
-        d = asdict(msg)
-        d["sender_role"] = msg.sender_role.value
-        d["intent"] = msg.intent.value
-        return d
+        # Fields are referenced directly; JSON encoding copies them anyway
+        return {
+            "id": msg.id,
+            "timestamp": msg.timestamp,
+            "sender_model": msg.sender_model,
+            "sender_role": msg.sender_role.value,
+            "intent": msg.intent.value,
+            "content": msg.content,
+            "reasoning": msg.reasoning,
+            "confidence": msg.confidence,
+            "quality_signals": msg.quality_signals,
+            "references_message_id": msg.references_message_id,
+            "artifacts_modified": msg.artifacts_modified,
+            "code_blocks": msg.code_blocks,
+            "citations": msg.citations,
+        }
 
     @staticmethod
     def dict_to_message(d: dict[str, Any]) -> AICLMessage:
         """Convert a dictionary to an AICLMessage."""
-        d["sender_role"] = AICLRole(d["sender_role"])
-        d["intent"] = AICLIntent(d["intent"])
+        role, intent = d["sender_role"], d["intent"]
+        d["sender_role"] = _ROLES.get(role) or AICLRole(role)
+        d["intent"] = _INTENTS.get(intent) or AICLIntent(intent)
         return AICLMessage(**d)
 
     @staticmethod
     def context_to_dict(ctx: AICLContext) -> dict[str, Any]:
         """Convert an AICLContext to a dictionary."""
-        return asdict(ctx)
+        return {
+            "task_id": ctx.task_id,
+            "original_prompt": ctx.original_prompt,
+            "current_objective": ctx.current_objective,
+            "constraints": ctx.constraints,
+            "artifacts": ctx.artifacts,
+            "confidence_required": ctx.confidence_required,
+            "max_iterations": ctx.max_iterations,
+            "current_iteration": ctx.current_iteration,
+            "consensus_reached": ctx.consensus_reached,
+            "metadata": ctx.metadata,
+        }
 
     @staticmethod
     def dict_to_context(d: dict[str, Any]) -> AICLContext:
@@ -69,23 +96,24 @@ class AICLSerializer:
             final_output=d.get("final_output"),
         )
         conv.messages = [AICLSerializer.dict_to_message(m) for m in d["messages"]]
+        conv.reindex()
         return conv
 
     @staticmethod
     def to_json(obj: AICLConversation | AICLMessage | AICLContext, indent: int = 2) -> str:
         """Serialize an AICL object to JSON string."""
         if isinstance(obj, AICLConversation):
-            return json.dumps(AICLSerializer.conversation_to_dict(obj), indent=indent)
+            return dumps(AICLSerializer.conversation_to_dict(obj), indent)
         elif isinstance(obj, AICLMessage):
-            return json.dumps(AICLSerializer.message_to_dict(obj), indent=indent)
+            return dumps(AICLSerializer.message_to_dict(obj), indent)
         elif isinstance(obj, AICLContext):
-            return json.dumps(AICLSerializer.context_to_dict(obj), indent=indent)
+            return dumps(AICLSerializer.context_to_dict(obj), indent)
         raise TypeError(f"Cannot serialize {type(obj)}")
 
     @staticmethod
     def from_json(json_str: str, obj_type: str = "conversation") -> Any:
         """Deserialize a JSON string to an AICL object."""
-        d = json.loads(json_str)
+        d = loads(json_str)
         if obj_type == "conversation":
             return AICLSerializer.dict_to_conversation(d)
         elif obj_type == "message":
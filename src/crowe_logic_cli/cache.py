@@ -0,0 +1,126 @@
+"""On-disk cache for deterministic model responses.
+
+Opt-in with ``CROWE_CACHE=1``. Responses are stored under
+``~/.cache/crowelogic/responses`` keyed by a SHA-256 of the model and the
+messages sent, and expire after an hour by default.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional, Sequence
+
+from crowe_logic_cli.config import AppConfig
+from crowe_logic_cli.providers.base import Message
+
+
+DEFAULT_TTL = 3600
+# Reference answers (explain an algorithm, a concept) stay valid much longer
+REFERENCE_TTL = 7 * 24 * 3600
+
+
+def cache_enabled() -> bool:
+    """Whether response caching was requested via CROWE_CACHE."""
+    return os.environ.get("CROWE_CACHE", "").lower() in ("1", "true", "yes")
+
+
+def model_id(config: AppConfig) -> str:
+    """Identify the endpoint and model a config talks to, without secrets."""
+    settings = config.azure or config.azure_ai_inference or config.openai_compatible
+    fields = asdict(settings) if settings else {}
+    fields.pop("api_key", None)
+    return json.dumps({"provider": config.provider, **fields}, sort_keys=True)
+
+
+class LLMCache:
+    """File-backed cache of response text, one JSON file per key."""
+
+    def __init__(self, cache_dir: Optional[Path] = None, ttl: float = DEFAULT_TTL) -> None:
+        self.cache_dir = cache_dir or Path.home() / ".cache" / "crowelogic" / "responses"
+        self.ttl = ttl
+
+    @staticmethod
+    def key(model: str, messages: Sequence[Message], temperature: float = 0.0) -> str:
+        """Hash the request into a cache key."""
+        payload = json.dumps(
+            {"model": model, "messages": list(messages), "temperature": temperature},
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        """Return cached text for key, or None if missing or expired.
+
+        An expired entry is deleted, so the cache directory doesn't grow
+        without bound.
+        """
+        path = self._path(key)
+        try:
+            with path.open(encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry.get("created", 0) > self.ttl:
+            path.unlink(missing_ok=True)
+            return None
+        return entry.get("text")
+
+    def set(self, key: str, text: str) -> None:
+        """Store text under key, replacing any previous entry atomically."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # A unique temp file per writer, so concurrent sets of one key
+            # never write into the same file
+            fd, tmp = tempfile.mkstemp(prefix=f"{key}.", suffix=".tmp", dir=self.cache_dir)
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"created": time.time(), "text": text}, f)
+            os.replace(tmp, self._path(key))
+        except OSError:
+            Path(tmp).unlink(missing_ok=True)
+
+
+def cached_stream(
+    stream: Callable[[Sequence[Message]], Iterable[str]],
+    messages: Sequence[Message],
+    model: str,
+    temperature: float = 0.0,
+    cache: Optional[LLMCache] = None,
+    enabled: Optional[bool] = None,
+) -> Iterator[str]:
+    """Stream a response, serving it from the cache when possible.
+
+    A hit yields the stored text in one chunk. A miss streams from the
+    provider and stores the full response once the stream completes; an
+    interrupted stream is not cached. Caching is skipped unless enabled
+    (``enabled``, or CROWE_CACHE when it is None), and for sampled
+    (temperature > 0) requests.
+    """
+    if enabled is None:
+        enabled = cache_enabled()
+    if not enabled or temperature > 0:
+        yield from stream(messages)
+        return
+
+    cache = cache or LLMCache()
+    key = LLMCache.key(model, messages, temperature)
+    hit = cache.get(key)
+    if hit is not None:
+        yield hit
+        return
+
+    parts: list[str] = []
+    for chunk in stream(messages):
+        parts.append(chunk)
+        yield chunk
+    cache.set(key, "".join(parts))
@@ -1,18 +1,25 @@
 from __future__ import annotations
 
+import json
+import os
 import typer
 from pathlib import Path
-from rich.console import Console
-from rich.markdown import Markdown
-from rich.panel import Panel
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Set, Tuple
 
-from crowe_logic_cli.config import load_config
-from crowe_logic_cli.providers.factory import create_provider
+if TYPE_CHECKING:
+    from rich.console import Console
 
+# Rich rendering, config and provider SDK imports are deferred to command
+# bodies so `crowelogic --help` doesn't pay for them.
 
 app = typer.Typer(add_completion=False, help="Run agent files as structured prompts")
-console = Console()
+
+
+def _get_console() -> Console:
+    """Return the shared CLI console, importing Rich on first use."""
+    from ..output import get_console
+
+    return get_console()
 
 # Maximum file size for context files (1MB)
 MAX_FILE_SIZE_BYTES = 1 * 1024 * 1024
@@ -26,39 +33,138 @@ AGENTS_DIRS = [
 ]
 
 
+# Per-process index memo: str(agents_dir) -> (st_mtime_ns, name -> path)
+_AGENT_INDEX: Dict[str, Tuple[int, Dict[str, str]]] = {}
+# Agents directories walked by this process (a miss re-walks each at most once)
+_WALKED: Set[str] = set()
+
+
+def invalidate_agents_cache() -> None:
+    """Drop the in-process agent index so the next lookup reloads it."""
+    _AGENT_INDEX.clear()
+    _WALKED.clear()
+
+
+def _agent_index_file() -> Path:
+    """Location of the on-disk agent name index."""
+    return Path.home() / ".cache" / "crowelogic" / "agent_index.json"
+
+
+def _iter_md_files(agents_dir: Path) -> Iterator[Tuple[str, str, bool]]:
+    """Yield ``(root, filename, top_level)`` for every markdown file, in one walk."""
+    base = str(agents_dir)
+    for root, dirs, files in os.walk(agents_dir):
+        dirs.sort()
+        top_level = root == base
+        for filename in sorted(files):
+            if filename.endswith(".md"):
+                yield root, filename, top_level
+
+
+def _build_agent_index(agents_dir: Path) -> Dict[str, str]:
+    """Map agent names to files with a single walk of an agents directory.
+
+    Name priority mirrors the original lookup order: top-level ``<name>.md``,
+    then nested ``<name>.md``, then ``<name>/agent.md``, then ``<name>-agent.md``.
+    Hyphen/underscore spellings (``code_reviewer`` for ``code-reviewer``) are
+    added as lowest-priority aliases.
+    """
+    ranked: Dict[str, tuple] = {}
+
+    def add(name: str, rank: int, path: str) -> None:
+        current = ranked.get(name)
+        if current is None or (rank, path) < current:
+            ranked[name] = (rank, path)
+
+    for root, filename, top_level in _iter_md_files(agents_dir):
+        path = os.path.join(root, filename)
+        stem = filename[:-3]
+        add(stem, 0 if top_level else 1, path)
+        if stem == "agent" and not top_level:
+            add(os.path.basename(root), 2, path)
+        if stem.endswith("-agent"):
+            add(stem[: -len("-agent")], 3, path)
+
+    for name, (rank, path) in list(ranked.items()):
+        for alias in (name.replace("_", "-"), name.replace("-", "_")):
+            if alias != name:
+                add(alias, rank + 4, path)
+
+    return {name: path for name, (_, path) in ranked.items()}
+
+
+def _load_agent_index(agents_dir: Path, refresh: bool = False) -> Dict[str, str]:
+    """Load the agent index for a directory, rebuilding it when the mtime changes.
+
+    Checks the in-process memo first, then the on-disk cache, then walks.
+    """
+    key = str(agents_dir)
+    mtime_ns = agents_dir.stat().st_mtime_ns
+    memo = _AGENT_INDEX.get(key)
+    if not refresh and memo is not None and memo[0] == mtime_ns:
+        return memo[1]
+
+    index_file = _agent_index_file()
+
+    try:
+        cache = json.loads(index_file.read_text())
+    except (OSError, ValueError):
+        cache = {}
+
+    entry = cache.get(key)
+    if not refresh and entry and entry.get("mtime_ns") == mtime_ns:
+        _AGENT_INDEX[key] = (mtime_ns, entry["agents"])
+        return entry["agents"]
+
+    agents = _build_agent_index(agents_dir)
+    _WALKED.add(key)
+    _AGENT_INDEX[key] = (mtime_ns, agents)
+    cache[key] = {"mtime_ns": mtime_ns, "agents": agents}
+    try:
+        index_file.parent.mkdir(parents=True, exist_ok=True)
+        index_file.write_text(json.dumps(cache))
+    except OSError:
+        pass
+    return agents
+
+
 def _find_agent_file(name: str) -> Optional[Path]:
     """Find an agent file by name, searching common locations."""
-    # Direct path
-    if Path(name).exists():
+    # Direct path (only stat names that look like paths, not bare agent names)
+    if ("/" in name or "\\" in name or name.endswith(".md")) and Path(name).exists():
         return Path(name)
 
-    # Search in agent directories
-    for agents_dir in AGENTS_DIRS:
-        if not agents_dir.exists():
+    # Search every directory's cached index before walking any of them
+    agents_dirs = [d for d in AGENTS_DIRS if d.exists()]
+    stale: List[Path] = []
+    for agents_dir in agents_dirs:
+        match = _load_agent_index(agents_dir).get(name)
+        if match is None:
             continue
-        for pattern in [
-            f"{name}.md",
-            f"**/{name}.md",
-            f"**/{name}/agent.md",
-            f"**/agents/{name}.md",
-            f"**/{name}-agent.md",
-        ]:
-            matches = list(agents_dir.glob(pattern))
-            if matches:
-                return matches[0]
+        if os.path.exists(match):
+            return Path(match)
+        stale.append(agents_dir)
+
+    # Nested changes don't touch the root mtime: re-walk a directory whose
+    # cached path has gone, or one not yet walked by this process
+    for agents_dir in agents_dirs:
+        if agents_dir in stale or str(agents_dir) not in _WALKED:
+            match = _load_agent_index(agents_dir, refresh=True).get(name)
+            if match is not None:
+                return Path(match)
 
     return None
 
 
 def _load_agent_prompt(path: Path) -> str:
     """Load agent system prompt from a markdown file."""
-    content = path.read_text()
+    content = path.read_bytes().decode("utf-8", errors="replace")
 
     # If the file has YAML frontmatter, skip it
     if content.startswith("---"):
-        parts = content.split("---", 2)
-        if len(parts) >= 3:
-            content = parts[2].strip()
+        end = content.find("---", 3)
+        if end != -1:
+            content = content[end + 3 :].strip()
 
     return content
 
@@ -80,6 +186,15 @@ def run(
         crowelogic agent run code-reviewer "Review this code" -f src/main.py
         crowelogic agent run ./my-agent.md "Help me with this task"
     """
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+
+    from crowe_logic_cli.config import load_config
+    from crowe_logic_cli.output import print_stream
+    from crowe_logic_cli.providers.factory import get_shared_provider
+
+    console = _get_console()
+
     # Find the agent file
     agent_path = _find_agent_file(agent_name)
     if not agent_path:
@@ -95,26 +210,33 @@ def run(
     # Build the user message
     user_content = prompt
     if file:
-        if not file.exists():
+        try:
+            fp = open(file, "rb")
+        except FileNotFoundError:
             console.print(f"[red]File not found: {file}[/red]")
             raise typer.Exit(1)
 
-        # Check file size to prevent memory issues and API limits
-        file_size = file.stat().st_size
-        if file_size > MAX_FILE_SIZE_BYTES:
-            console.print(
-                f"[red]File too large: {file_size / (1024 * 1024):.2f}MB "
-                f"(max: {MAX_FILE_SIZE_MB:.0f}MB)[/red]"
-            )
-            console.print("[dim]Consider splitting the file or using a smaller excerpt.[/dim]")
-            raise typer.Exit(1)
+        with fp:
+            # Check file size (fstat on the open handle) before reading anything
+            file_size = os.fstat(fp.fileno()).st_size
+            if file_size > MAX_FILE_SIZE_BYTES:
+                console.print(
+                    f"[red]File too large: {file_size / (1024 * 1024):.2f}MB "
+                    f"(max: {MAX_FILE_SIZE_MB:.0f}MB)[/red]"
+                )
+                console.print("[dim]Consider splitting the file or using a smaller excerpt.[/dim]")
+                raise typer.Exit(1)
+
+            file_content = fp.read().decode("utf-8", errors="replace")
 
-        file_content = file.read_text()
-        user_content = f"{prompt}\n\n---\n\nFile: {file.name}\n```\n{file_content}\n```"
+        # Join the parts in a single copy
+        user_content = "".join(
+            (prompt, "\n\n---\n\nFile: ", file.name, "\n```\n", file_content, "\n```")
+        )
 
     # Create provider and send request
     config = load_config()
-    provider = create_provider(config)
+    provider = get_shared_provider(config)
 
     messages = [
         {"role": "system", "content": system_prompt},
@@ -129,17 +251,12 @@ def run(
                 response = provider.chat(messages)
             console.print(Markdown(response.content))
         else:
-            # Stream response
-            full_response = ""
             try:
-                for chunk in provider.chat_stream(messages):
-                    console.print(chunk, end="")
-                    full_response += chunk
+                print_stream(provider.chat_stream(messages), console)
             except NotImplementedError:
                 with console.status("[cyan]Agent thinking...[/cyan]", spinner="dots"):
                     response = provider.chat(messages)
                 console.print(Markdown(response.content))
-            console.print()
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
         raise typer.Exit(1)
@@ -148,29 +265,36 @@ def run(
 @app.command("list")
 def list_agents() -> None:
     """List available agents."""
+    from rich.panel import Panel
+
+    console = _get_console()
     console.print(Panel("[bold]Available Agents[/bold]", border_style="blue"))
 
-    # Find all .md files that look like agents
-    agent_files = []
+    # Find all .md files that look like agents: top-level files, agent.md,
+    # anything under an agents/ folder, and *-agent.md. The first file seen
+    # for a name wins, walking each directory in sorted order.
+    agents: Dict[str, Tuple[str, Path]] = {}
     for agents_dir in AGENTS_DIRS:
         if not agents_dir.exists():
             continue
-        for pattern in ["*.md", "**/agent.md", "**/agents/*.md", "**/*-agent.md"]:
-            for match in agents_dir.glob(pattern):
-                agent_files.append((match, agents_dir))
+        for root, filename, top_level in _iter_md_files(agents_dir):
+            stem = filename[:-3]
+            if stem == "agent":
+                name = os.path.basename(root)
+            elif stem.endswith("-agent"):
+                name = stem[: -len("-agent")]
+            elif top_level or os.path.basename(root) == "agents":
+                name = stem
+            else:
+                continue
+            if name not in agents:
+                agents[name] = (os.path.join(root, filename), agents_dir)
 
-    if not agent_files:
+    if not agents:
         console.print("[dim]No agents found[/dim]")
         return
 
-    seen = set()
-    for agent_path, base_dir in sorted(agent_files, key=lambda x: x[0].name):
-        name = agent_path.stem if agent_path.stem != "agent" else agent_path.parent.name
-        if name in seen:
-            continue
-        seen.add(name)
-        try:
-            rel_path = agent_path.relative_to(base_dir)
-        except ValueError:
-            rel_path = agent_path.name
+    for name in sorted(agents):
+        agent_path, base_dir = agents[name]
+        rel_path = os.path.relpath(agent_path, base_dir)
         console.print(f"  [cyan]{name}[/cyan] - [dim]{rel_path}[/dim]")
@@ -7,56 +7,87 @@ AICL CLI Commands
 Commands for multi-model orchestration using AICL protocol.
 """
 
+from __future__ import annotations
+
 import asyncio
-from typing import Optional
+import atexit
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional
 
 import typer
-from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from rich.text import Text
 
-from ..aicl import AICLMessage
-from ..orchestrator import (
-    OrchestrationEngine,
-    OrchestrationMode,
-    create_default_engine,
-)
-from ..orchestrator.multi_client import (
-    ModelConfig,
-    Provider,
-    CLAUDE_OPUS_45,
-    GPT_51_CODEX,
-)
-from ..ui import LiveOrchestration
-from ..ui.diff import DiffView
+from ..output import get_console
+
+# The AICL, orchestrator and UI stacks are imported inside each command so
+# that registering this sub-app (e.g. for `crowelogic --help`) stays cheap.
+if TYPE_CHECKING:
+    from ..aicl import AICLConversation
+    from ..orchestrator.engine import OrchestrationEngine
 
 app = typer.Typer(
     name="aicl",
     help="Multi-model orchestration using AICL (AI Communication Language)",
 )
 
-console = Console()
+console = get_console()
+
+
+CLAUDE_MODEL = "claude-opus-4-5-20251101"
+CODEX_MODEL = "gpt-5.1-codex"
+DEFAULT_MODELS = f"{CLAUDE_MODEL},{CODEX_MODEL}"
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
 
 
 def get_engine() -> OrchestrationEngine:
     """Get or create the orchestration engine."""
+    from ..orchestrator.engine import create_default_engine
+
     return create_default_engine()
 
 
-@app.command()
-def debate(
-    topic: str = typer.Argument(..., help="Topic to debate"),
-    rounds: int = typer.Option(3, "--rounds", "-r", help="Number of debate rounds"),
-    model_a: str = typer.Option("claude-opus-4-5-20251101", "--model-a", "-a", help="First model (argues FOR)"),
-    model_b: str = typer.Option("gpt-5.1-codex", "--model-b", "-b", help="Second model (argues AGAINST)"),
-    live: bool = typer.Option(True, "--live/--no-live", help="Show live updates"),
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create a uvloop loop when the optional dependency is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the event loop shared by every AICL command in this process."""
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = _new_event_loop()
+        atexit.register(_loop.close)
+    return _loop
+
+
+def _run(body: Callable[..., Awaitable[None]], *args: Any) -> None:
+    """Run a command body with its own engine on the shared event loop."""
+    loop = _get_loop()
+    engine = get_engine()
+    try:
+        loop.run_until_complete(body(engine, *args))
+    finally:
+        loop.run_until_complete(engine.close())
+
+
+async def _debate(
+    engine: OrchestrationEngine,
+    topic: str,
+    rounds: int = 3,
+    model_a: str = CLAUDE_MODEL,
+    model_b: str = CODEX_MODEL,
+    live: bool = True,
 ) -> None:
-    """
-    Start a debate between two AI models.
+    from ..aicl import AICLMessage
+    from ..orchestrator.engine import OrchestrationMode
+    from ..ui.live import LiveOrchestration
 
-    One model argues FOR the topic, the other AGAINST.
-    After rounds of argument and counter-argument, a synthesis is produced.
-    """
     console.print(Panel(
         f"[bold]Topic:[/] {topic}\n"
         f"[green]{model_a}[/] (FOR) vs [red]{model_b}[/] (AGAINST)\n"
@@ -65,57 +96,97 @@ def debate(
         border_style="bright_cyan",
     ))
 
-    async def run_debate() -> None:
-        engine = get_engine()
+    if live:
+        display = LiveOrchestration(console)
+        display.setup(OrchestrationMode.DEBATE, [model_a, model_b])
 
-        # Ensure models are registered
-        if "claude" in model_a.lower():
-            engine.register_model(CLAUDE_OPUS_45)
-        if "gpt" in model_b.lower():
-            engine.register_model(GPT_51_CODEX)
+        result = await display.run_with_display(
+            engine.orchestrate,
+            topic,
+            OrchestrationMode.DEBATE,
+            [model_a, model_b],
+            on_message=display.on_message,
+            on_progress=display.on_progress,
+            rounds=rounds,
+        )
 
-        if live:
-            display = LiveOrchestration(console)
-            display.setup(OrchestrationMode.DEBATE, [model_a, model_b])
+        display.print_final_output()
+    else:
+        def on_message(msg: AICLMessage) -> None:
+            color = "magenta" if "claude" in msg.sender_model.lower() else "green"
+            console.print(f"\n[{color}]{msg.sender_model}[/] [{msg.intent.value}]")
+            text = msg.content[:500] + "..." if len(msg.content) > 500 else msg.content
+            console.print(text, markup=False, highlight=False, emoji=False)
+
+        result = await engine.orchestrate(
+            topic,
+            OrchestrationMode.DEBATE,
+            [model_a, model_b],
+            on_message=on_message,
+            rounds=rounds,
+        )
 
-            result = await display.run_with_display(
-                engine.orchestrate,
-                topic,
-                OrchestrationMode.DEBATE,
-                [model_a, model_b],
-                on_message=display.on_message,
-                on_progress=display.on_progress,
-                rounds=rounds,
-            )
+        console.print(Panel(Text(result.final_output), title="[bold]Synthesis[/]"))
 
-            display.print_final_output()
-        else:
-            def on_message(msg: AICLMessage) -> None:
-                color = "magenta" if "claude" in msg.sender_model.lower() else "green"
-                console.print(f"\n[{color}]{msg.sender_model}[/] [{msg.intent.value}]")
-                console.print(msg.content[:500] + "..." if len(msg.content) > 500 else msg.content)
 
-            result = await engine.orchestrate(
-                topic,
-                OrchestrationMode.DEBATE,
-                [model_a, model_b],
-                on_message=on_message,
-                rounds=rounds,
-            )
+@app.command()
+def debate(
+    topic: str = typer.Argument(..., help="Topic to debate"),
+    rounds: int = typer.Option(3, "--rounds", "-r", help="Number of debate rounds"),
+    model_a: str = typer.Option(CLAUDE_MODEL, "--model-a", "-a", help="First model (argues FOR)"),
+    model_b: str = typer.Option(CODEX_MODEL, "--model-b", "-b", help="Second model (argues AGAINST)"),
+    live: bool = typer.Option(True, "--live/--no-live", help="Show live updates"),
+) -> None:
+    """
+    Start a debate between two AI models.
 
-            console.print(Panel(result.final_output, title="[bold]Synthesis[/]"))
+    One model argues FOR the topic, the other AGAINST.
+    After rounds of argument and counter-argument, a synthesis is produced.
+    """
+    _run(_debate, topic, rounds, model_a, model_b, live)
 
-        await engine.close()
 
-    asyncio.run(run_debate())
+async def _verify(
+    engine: OrchestrationEngine,
+    task: str,
+    iterations: int = 3,
+    creator: str = CODEX_MODEL,
+    validator: str = CLAUDE_MODEL,
+) -> None:
+    from ..orchestrator.engine import OrchestrationMode
+    from ..ui.live import LiveOrchestration
+
+    console.print(Panel(
+        f"[bold]Task:[/] {task}\n"
+        f"[green]Creator:[/] {creator}\n"
+        f"[cyan]Validator:[/] {validator}",
+        title="[bold bright_cyan]AICL Verify Mode[/]",
+        border_style="bright_cyan",
+    ))
+
+    display = LiveOrchestration(console)
+    display.setup(OrchestrationMode.VERIFY, [creator, validator])
+
+    result = await display.run_with_display(
+        engine.orchestrate,
+        task,
+        OrchestrationMode.VERIFY,
+        [creator, validator],
+        on_message=display.on_message,
+        on_progress=display.on_progress,
+        max_iterations=iterations,
+    )
+
+    console.print(f"\n[bold]Validation {'Passed' if result.consensus_reached else 'Did Not Pass'}[/]")
+    display.print_final_output()
 
 
 @app.command()
 def verify(
     task: str = typer.Argument(..., help="Task to create and verify"),
     iterations: int = typer.Option(3, "--iterations", "-i", help="Max verification iterations"),
-    creator: str = typer.Option("gpt-5.1-codex", "--creator", "-c", help="Creator model"),
-    validator: str = typer.Option("claude-opus-4-5-20251101", "--validator", "-v", help="Validator model"),
+    creator: str = typer.Option(CODEX_MODEL, "--creator", "-c", help="Creator model"),
+    validator: str = typer.Option(CLAUDE_MODEL, "--validator", "-v", help="Validator model"),
 ) -> None:
     """
     Create and verify with two models.
@@ -123,43 +194,71 @@ def verify(
     One model creates the output, the other validates it.
     Iterates until validation passes or max iterations reached.
     """
+    _run(_verify, task, iterations, creator, validator)
+
+
+def _first_responses(conversation: AICLConversation, models: list[str]) -> dict[str, str]:
+    """Map each requested model to its first RESPONSE message.
+
+    Failed models (ERROR) and the evaluator's SYNTHESIS are left out.
+    """
+    from ..aicl import AICLIntent
+
+    wanted = frozenset(models)
+    responses: dict[str, str] = {}
+    for msg in conversation.get_messages_by_intent(AICLIntent.RESPONSE):
+        if msg.sender_model in wanted and msg.sender_model not in responses:
+            responses[msg.sender_model] = msg.content
+            if len(responses) == len(wanted):
+                break
+    return responses
+
+
+async def _parallel(
+    engine: OrchestrationEngine,
+    task: str,
+    models: str = DEFAULT_MODELS,
+    compare: bool = True,
+) -> None:
+    from ..orchestrator.engine import OrchestrationMode
+    from ..ui.diff import DiffView
+    from ..ui.live import LiveOrchestration
+
+    model_list = [m.strip() for m in models.split(",")]
+
     console.print(Panel(
         f"[bold]Task:[/] {task}\n"
-        f"[green]Creator:[/] {creator}\n"
-        f"[cyan]Validator:[/] {validator}",
-        title="[bold bright_cyan]AICL Verify Mode[/]",
+        f"[bold]Models:[/] {', '.join(model_list)}",
+        title="[bold bright_cyan]AICL Parallel Mode[/]",
         border_style="bright_cyan",
     ))
 
-    async def run_verify() -> None:
-        engine = get_engine()
-
-        display = LiveOrchestration(console)
-        display.setup(OrchestrationMode.VERIFY, [creator, validator])
+    display = LiveOrchestration(console)
+    display.setup(OrchestrationMode.PARALLEL, model_list)
 
-        result = await display.run_with_display(
-            engine.orchestrate,
-            task,
-            OrchestrationMode.VERIFY,
-            [creator, validator],
-            on_message=display.on_message,
-            on_progress=display.on_progress,
-            max_iterations=iterations,
-        )
-
-        console.print(f"\n[bold]Validation {'Passed' if result.consensus_reached else 'Did Not Pass'}[/]")
-        display.print_final_output()
+    result = await display.run_with_display(
+        engine.orchestrate,
+        task,
+        OrchestrationMode.PARALLEL,
+        model_list,
+        on_message=display.on_message,
+        on_progress=display.on_progress,
+    )
 
-        await engine.close()
+    if compare:
+        responses = _first_responses(result.conversation, model_list)
+        if responses:
+            diff = DiffView(console)
+            diff.compare_responses(responses)
 
-    asyncio.run(run_verify())
+    display.print_final_output()
 
 
 @app.command()
 def parallel(
     task: str = typer.Argument(..., help="Task to solve in parallel"),
     models: str = typer.Option(
-        "claude-opus-4-5-20251101,gpt-5.1-codex",
+        DEFAULT_MODELS,
         "--models", "-m",
         help="Comma-separated list of models",
     ),
@@ -171,52 +270,49 @@ def parallel(
     All models work simultaneously on the same task.
     Results are compared and the best output is selected.
     """
+    _run(_parallel, task, models, compare)
+
+
+async def _chain(
+    engine: OrchestrationEngine,
+    task: str,
+    models: str = DEFAULT_MODELS,
+    instructions: Optional[str] = None,
+) -> None:
+    from ..orchestrator.engine import OrchestrationMode
+    from ..ui.live import LiveOrchestration
+
     model_list = [m.strip() for m in models.split(",")]
+    instruction_list = [i.strip() for i in instructions.split(",")] if instructions else []
 
     console.print(Panel(
         f"[bold]Task:[/] {task}\n"
-        f"[bold]Models:[/] {', '.join(model_list)}",
-        title="[bold bright_cyan]AICL Parallel Mode[/]",
+        f"[bold]Chain:[/] {' -> '.join(model_list)}",
+        title="[bold bright_cyan]AICL Chain Mode[/]",
         border_style="bright_cyan",
     ))
 
-    async def run_parallel() -> None:
-        engine = get_engine()
-
-        display = LiveOrchestration(console)
-        display.setup(OrchestrationMode.PARALLEL, model_list)
-
-        result = await display.run_with_display(
-            engine.orchestrate,
-            task,
-            OrchestrationMode.PARALLEL,
-            model_list,
-            on_message=display.on_message,
-            on_progress=display.on_progress,
-        )
-
-        if compare:
-            responses = {
-                msg.sender_model: msg.content
-                for msg in result.conversation.messages
-                if msg.sender_model in model_list
-            }
-            if responses:
-                diff = DiffView(console)
-                diff.compare_responses(responses)
+    display = LiveOrchestration(console)
+    display.setup(OrchestrationMode.CHAIN, model_list)
 
-        display.print_final_output()
-
-        await engine.close()
+    await display.run_with_display(
+        engine.orchestrate,
+        task,
+        OrchestrationMode.CHAIN,
+        model_list,
+        on_message=display.on_message,
+        on_progress=display.on_progress,
+        chain_instructions=instruction_list,
+    )
 
-    asyncio.run(run_parallel())
+    display.print_final_output()
 
 
 @app.command()
 def chain(
     task: str = typer.Argument(..., help="Task to process through chain"),
     models: str = typer.Option(
-        "claude-opus-4-5-20251101,gpt-5.1-codex",
+        DEFAULT_MODELS,
         "--models", "-m",
         help="Comma-separated list of models (in order)",
     ),
@@ -232,37 +328,16 @@ def chain(
     Each model processes the output of the previous one.
     Useful for iterative refinement.
     """
-    model_list = [m.strip() for m in models.split(",")]
-    instruction_list = [i.strip() for i in instructions.split(",")] if instructions else []
+    _run(_chain, task, models, instructions)
 
-    console.print(Panel(
-        f"[bold]Task:[/] {task}\n"
-        f"[bold]Chain:[/] {' -> '.join(model_list)}",
-        title="[bold bright_cyan]AICL Chain Mode[/]",
-        border_style="bright_cyan",
-    ))
 
-    async def run_chain() -> None:
-        engine = get_engine()
-
-        display = LiveOrchestration(console)
-        display.setup(OrchestrationMode.CHAIN, model_list)
-
-        result = await display.run_with_display(
-            engine.orchestrate,
-            task,
-            OrchestrationMode.CHAIN,
-            model_list,
-            on_message=display.on_message,
-            on_progress=display.on_progress,
-            chain_instructions=instruction_list,
-        )
-
-        display.print_final_output()
-
-        await engine.close()
-
-    asyncio.run(run_chain())
+# Slash commands available in interactive mode: name -> (handler, argument name)
+_COMMANDS: dict[str, tuple[Callable[[OrchestrationEngine, str], Awaitable[None]], str]] = {
+    "/debate": (_debate, "topic"),
+    "/verify": (_verify, "task"),
+    "/parallel": (_parallel, "task"),
+    "/chain": (_chain, "task"),
+}
 
 
 @app.command()
@@ -286,47 +361,46 @@ def interactive() -> None:
         border_style="bright_cyan",
     ))
 
-    while True:
-        try:
-            user_input = Prompt.ask("\n[bold cyan]AICL[/]")
-
-            if user_input.startswith("/quit"):
-                console.print("[dim]Goodbye![/]")
-                break
-
-            elif user_input.startswith("/models"):
-                console.print("\n[bold]Available Models:[/]")
-                console.print("  [magenta]claude-opus-4-5-20251101[/] - Claude Opus 4.5 (Anthropic)")
-                console.print("  [green]gpt-5.1-codex[/] - GPT-5.1 Codex (OpenAI)")
-                console.print("  [green]gpt-5-turbo[/] - GPT-5 Turbo (OpenAI)")
-
-            elif user_input.startswith("/debate "):
-                topic = user_input[8:].strip()
-                if topic:
-                    debate(topic)
-
-            elif user_input.startswith("/verify "):
-                task = user_input[8:].strip()
-                if task:
-                    verify(task)
-
-            elif user_input.startswith("/parallel "):
-                task = user_input[10:].strip()
-                if task:
-                    parallel(task)
-
-            elif user_input.startswith("/chain "):
-                task = user_input[7:].strip()
-                if task:
-                    chain(task)
-
-            else:
-                console.print("[dim]Use a command like /debate, /verify, /parallel, or /chain[/]")
-
-        except KeyboardInterrupt:
-            console.print("\n[dim]Use /quit to exit[/]")
-        except Exception as e:
-            console.print(f"[red]Error: {e}[/]")
+    # One engine for the whole session so the HTTP connection pool
+    # survives between commands
+    loop = _get_loop()
+    engine = get_engine()
+
+    try:
+        while True:
+            try:
+                user_input = Prompt.ask("\n[bold cyan]AICL[/]")
+
+                cmd, _, rest = user_input.strip().partition(" ")
+                entry = _COMMANDS.get(cmd)
+
+                if cmd == "/quit":
+                    console.print("[dim]Goodbye![/]")
+                    break
+
+                elif cmd == "/models":
+                    console.print("\n[bold]Available Models:[/]")
+                    console.print("  [magenta]claude-opus-4-5-20251101[/] - Claude Opus 4.5 (Anthropic)")
+                    console.print("  [green]gpt-5.1-codex[/] - GPT-5.1 Codex (OpenAI)")
+                    console.print("  [green]gpt-5-turbo[/] - GPT-5 Turbo (OpenAI)")
+
+                elif entry is not None:
+                    handler, arg_name = entry
+                    arg = rest.strip()
+                    if arg:
+                        loop.run_until_complete(handler(engine, arg))
+                    else:
+                        console.print(f"[yellow]Missing {arg_name}. Usage: {cmd} <{arg_name}>[/]")
+
+                else:
+                    console.print("[dim]Use a command like /debate, /verify, /parallel, or /chain[/]")
+
+            except KeyboardInterrupt:
+                console.print("\n[dim]Use /quit to exit[/]")
+            except Exception as e:
+                console.print(f"[red]Error: {e}[/]")
+    finally:
+        loop.run_until_complete(engine.close())
 
 
 @app.command()
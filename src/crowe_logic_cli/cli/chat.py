@@ -1,19 +1,17 @@
 from __future__ import annotations
 
 import typer
-from rich.console import Console
 from typing import Optional
 
 from crowe_logic_cli.config import load_config
-from crowe_logic_cli.cost_tracker import get_tracker
-from crowe_logic_cli.output import OutputFormat, copy_to_clipboard, print_output
+from crowe_logic_cli.output import OutputFormat, copy_to_clipboard, get_console, print_output
 from crowe_logic_cli.providers.base import coerce_messages
-from crowe_logic_cli.providers.factory import create_provider
-from crowe_logic_cli.retry import RetryConfig, with_retry
 
 
 app = typer.Typer(add_completion=False, help="Chat with the configured model provider")
-console = Console()
+console = get_console()
+
+_OUTPUT_FORMAT_VALUES = frozenset(f.value for f in OutputFormat)
 
 
 @app.command()
@@ -36,6 +34,10 @@ def run(
     ),
 ) -> None:
     """Send a chat message and get a response."""
+    from crowe_logic_cli.cost_tracker import get_tracker
+    from crowe_logic_cli.providers.factory import create_provider
+    from crowe_logic_cli.retry import RetryConfig, with_retry
+
     config = load_config()
     provider = create_provider(config)
     messages = coerce_messages(prompt, system=system)
@@ -49,22 +51,9 @@ def run(
 
     response = do_chat()
 
-    # Track usage
-    if response.usage:
-        tracker = get_tracker()
-        tracker.record(
-            model=getattr(config.azure, "deployment", None)
-            or getattr(config.azure_ai_inference, "model", None)
-            or getattr(config.openai_compatible, "model", None)
-            or "unknown",
-            provider=provider.name(),
-            input_tokens=response.usage.input_tokens,
-            output_tokens=response.usage.output_tokens,
-            command="chat",
-        )
-
     # Format output
-    output_format = OutputFormat(output.lower()) if output.lower() in [f.value for f in OutputFormat] else OutputFormat.TEXT
+    output_key = output.lower()
+    output_format = OutputFormat(output_key) if output_key in _OUTPUT_FORMAT_VALUES else OutputFormat.TEXT
 
     if output_format == OutputFormat.JSON:
         data = {
@@ -76,10 +65,24 @@ def run(
         }
         print_output(data, output_format, console=console)
     else:
-        console.print(response.content)
+        console.print(response.content, markup=False, highlight=False, emoji=False)
 
     if copy:
         if copy_to_clipboard(response.content):
             console.print("[dim green]✓ Copied to clipboard[/dim green]")
         else:
             console.print("[dim red]✗ Failed to copy to clipboard[/dim red]")
+
+    # Track usage once the answer is on screen, so the write never delays it
+    if response.usage:
+        tracker = get_tracker()
+        tracker.record(
+            model=getattr(config.azure, "deployment", None)
+            or getattr(config.azure_ai_inference, "model", None)
+            or getattr(config.openai_compatible, "model", None)
+            or "unknown",
+            provider=provider.name(),
+            input_tokens=response.usage.input_tokens,
+            output_tokens=response.usage.output_tokens,
+            command="chat",
+        )
@@ -1,18 +1,61 @@
 from __future__ import annotations
 
+import os
+
 import typer
 from pathlib import Path
-from rich.console import Console
+from rich.markup import escape
 from rich.panel import Panel
-from typing import Optional
+from typing import IO, Iterable, Iterator, Optional
 
+from crowe_logic_cli.cache import cached_stream, model_id
 from crowe_logic_cli.config import load_config
-from crowe_logic_cli.providers.base import coerce_messages
-from crowe_logic_cli.providers.factory import create_provider
+from crowe_logic_cli.files import looks_binary, read_head
+from crowe_logic_cli.output import get_console, print_stream
+from crowe_logic_cli.providers.base import Message, coerce_messages
 
 
 app = typer.Typer(add_completion=False, help="Code analysis and generation")
-console = Console()
+console = get_console()
+
+# Maximum characters of a source file included in a prompt
+MAX_SOURCE_CHARS = 6000
+
+# Prompt instruction for each `code explain --detail` level
+DETAIL_INSTRUCTIONS = {
+    "brief": "Provide a concise 2-3 sentence explanation.",
+    "medium": "Provide a paragraph explanation covering main functionality.",
+    "detailed": "Provide a comprehensive explanation of all components.",
+}
+
+
+def _stream(messages: list[Message]) -> Iterator[str]:
+    """Stream a response, through the response cache when CROWE_CACHE is set."""
+    from crowe_logic_cli.providers.factory import get_shared_provider
+
+    config = load_config()
+    provider = get_shared_provider(config)
+    return cached_stream(provider.stream, messages, model_id(config))
+
+
+def _tee(chunks: Iterable[str], fh: IO[str]) -> Iterator[str]:
+    """Yield chunks unchanged, writing each to fh as it passes through."""
+    for chunk in chunks:
+        fh.write(chunk)
+        yield chunk
+
+
+def _load_source(file: Path) -> str:
+    """Read the head of a source file, exiting on missing or binary files."""
+    if not file.exists():
+        console.print(f"[red]Error: File not found: {escape(str(file))}[/red]")
+        raise typer.Exit(1)
+
+    content = read_head(file, MAX_SOURCE_CHARS)
+    if looks_binary(content):
+        console.print(f"[red]Error: {escape(str(file))} appears to be a binary file[/red]")
+        raise typer.Exit(1)
+    return content
 
 
 @app.command()
@@ -24,36 +67,25 @@ def explain(
     ),
 ) -> None:
     """Explain what a piece of code does."""
-    if not file.exists():
-        console.print(f"[red]Error: File not found: {file}[/red]")
-        raise typer.Exit(1)
-
-    content = file.read_text()
+    content = _load_source(file)
     language = file.suffix.lstrip(".") or "unknown"
 
-    detail_instruction = {
-        "brief": "Provide a concise 2-3 sentence explanation.",
-        "medium": "Provide a paragraph explanation covering main functionality.",
-        "detailed": "Provide a comprehensive explanation of all components.",
-    }.get(detail, "Provide a paragraph explanation covering main functionality.")
+    detail_instruction = DETAIL_INSTRUCTIONS.get(detail, DETAIL_INSTRUCTIONS["medium"])
 
     prompt = f"""Explain this {language} code.
 {detail_instruction}
 
 ```{language}
-{content[:6000]}
+{content}
 ```
 """
 
-    config = load_config()
-    provider = create_provider(config)
     messages = coerce_messages(prompt)
+    stream = _stream(messages)
 
-    console.print(Panel(f"[bold cyan]Code Explanation: {file.name}[/bold cyan]"))
+    console.print(Panel(f"[bold cyan]Code Explanation: {escape(file.name)}[/bold cyan]"))
 
-    for chunk in provider.stream(messages):
-        console.print(chunk, end="")
-    console.print()
+    print_stream(stream, console)
 
 
 @app.command()
@@ -65,11 +97,7 @@ def review(
     ),
 ) -> None:
     """Review code for quality, security, and best practices."""
-    if not file.exists():
-        console.print(f"[red]Error: File not found: {file}[/red]")
-        raise typer.Exit(1)
-
-    content = file.read_text()
+    content = _load_source(file)
     language = file.suffix.lstrip(".") or "unknown"
 
     focus_instruction = ""
@@ -87,19 +115,16 @@ Provide:
 5. Code style observations
 
 ```{language}
-{content[:6000]}
+{content}
 ```
 """
 
-    config = load_config()
-    provider = create_provider(config)
     messages = coerce_messages(prompt)
+    stream = _stream(messages)
 
-    console.print(Panel(f"[bold cyan]Code Review: {file.name}[/bold cyan]"))
+    console.print(Panel(f"[bold cyan]Code Review: {escape(file.name)}[/bold cyan]"))
 
-    for chunk in provider.stream(messages):
-        console.print(chunk, end="")
-    console.print()
+    print_stream(stream, console)
 
 
 @app.command()
@@ -111,11 +136,7 @@ def refactor(
     ),
 ) -> None:
     """Suggest refactoring improvements for code."""
-    if not file.exists():
-        console.print(f"[red]Error: File not found: {file}[/red]")
-        raise typer.Exit(1)
-
-    content = file.read_text()
+    content = _load_source(file)
     language = file.suffix.lstrip(".") or "unknown"
 
     prompt = f"""Suggest refactoring improvements for this {language} code.
@@ -128,19 +149,16 @@ Provide:
 4. Expected benefits
 
 ```{language}
-{content[:6000]}
+{content}
 ```
 """
 
-    config = load_config()
-    provider = create_provider(config)
     messages = coerce_messages(prompt)
+    stream = _stream(messages)
 
-    console.print(Panel(f"[bold cyan]Refactoring Suggestions: {file.name}[/bold cyan]"))
+    console.print(Panel(f"[bold cyan]Refactoring Suggestions: {escape(file.name)}[/bold cyan]"))
 
-    for chunk in provider.stream(messages):
-        console.print(chunk, end="")
-    console.print()
+    print_stream(stream, console)
 
 
 @app.command()
@@ -168,21 +186,25 @@ Requirements:
 5. Follow best practices for {language}
 """
 
-    config = load_config()
-    provider = create_provider(config)
     messages = coerce_messages(prompt)
+    stream = _stream(messages)
 
-    console.print(Panel(f"[bold cyan]Code Generation ({language})[/bold cyan]"))
-
-    generated_code = ""
-    for chunk in provider.stream(messages):
-        console.print(chunk, end="")
-        generated_code += chunk
-    console.print()
+    console.print(Panel(f"[bold cyan]Code Generation ({escape(language)})[/bold cyan]"))
 
     if output:
-        output.write_text(generated_code)
-        console.print(f"\n[green]Code saved to: {output}[/green]")
+        # Write chunks as they arrive to a temp file next to the target, and
+        # only replace the target once the whole stream has succeeded
+        tmp = output.with_name(output.name + ".tmp")
+        try:
+            with tmp.open("w", encoding="utf-8") as fh:
+                print_stream(_tee(stream, fh), console)
+            os.replace(tmp, output)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        console.print(f"\n[green]Code saved to: {escape(str(output))}[/green]")
+    else:
+        print_stream(stream, console)
 
 
 @app.command()
@@ -194,11 +216,7 @@ def test(
     ),
 ) -> None:
     """Generate unit tests for code."""
-    if not file.exists():
-        console.print(f"[red]Error: File not found: {file}[/red]")
-        raise typer.Exit(1)
-
-    content = file.read_text()
+    content = _load_source(file)
     language = file.suffix.lstrip(".") or "unknown"
 
     prompt = f"""Generate comprehensive unit tests for this {language} code using {framework}.
@@ -211,16 +229,13 @@ Include:
 5. Clear test names and docstrings
 
 ```{language}
-{content[:6000]}
+{content}
 ```
 """
 
-    config = load_config()
-    provider = create_provider(config)
     messages = coerce_messages(prompt)
+    stream = _stream(messages)
 
-    console.print(Panel(f"[bold cyan]Test Generation: {file.name}[/bold cyan]"))
+    console.print(Panel(f"[bold cyan]Test Generation: {escape(file.name)}[/bold cyan]"))
 
-    for chunk in provider.stream(messages):
-        console.print(chunk, end="")
-    console.print()
+    print_stream(stream, console)
@@ -0,0 +1,36 @@
+"""Helpers shared by the one-shot prompt commands (research, molecular, quantum, select)."""
+from __future__ import annotations
+
+from typing import Optional
+
+from rich.markup import escape
+from rich.panel import Panel
+
+from crowe_logic_cli.output import get_console, print_stream
+from crowe_logic_cli.providers.base import coerce_messages
+
+
+def run_prompt(title: str, prompt: str, use_cache: Optional[bool] = None) -> str:
+    """Show a title panel, then stream the configured model's answer to prompt.
+
+    The provider is shared across calls in this process. Responses go
+    through the response cache when CROWE_CACHE is set; ``use_cache`` forces
+    it on (with the longer reference TTL) or off. Returns the full response
+    text.
+    """
+    from crowe_logic_cli.cache import REFERENCE_TTL, LLMCache, cached_stream, model_id
+    from crowe_logic_cli.config import load_config
+    from crowe_logic_cli.providers.factory import get_shared_provider
+
+    config = load_config()
+    provider = get_shared_provider(config)
+    console = get_console()
+    console.print(Panel(f"[bold cyan]{escape(title)}[/bold cyan]"))
+    cache = LLMCache(ttl=REFERENCE_TTL) if use_cache else None
+    chunks = cached_stream(
+        provider.stream, coerce_messages(prompt), model_id(config),
+        cache=cache, enabled=use_cache,
+    )
+    # Consumed inline: print_stream's raw writes take microseconds, so a reader
+    # thread would not overlap anything meaningful with network waits
+    return print_stream(chunks, console)
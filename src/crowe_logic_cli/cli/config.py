@@ -4,13 +4,13 @@ from pathlib import Path
 from typing import Optional
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Prompt, Confirm
+
+from ..config_file import home_config_path, write_config_file
+from ..output import get_console
 
 
 app = typer.Typer(add_completion=False, help="Interactive configuration wizard")
-console = Console()
+console = get_console()
 
 
 @app.command()
@@ -20,7 +20,9 @@ def run(
     ),
 ) -> None:
     """Run interactive configuration wizard to set up the CLI."""
-    
+    from rich.panel import Panel
+    from rich.prompt import Prompt, Confirm
+
     console.print(Panel(
         "[bold green]Crowe Logic CLI Configuration Wizard[/bold green]\n\n"
         "This wizard will help you set up your connection to Azure AI endpoints.",
@@ -112,29 +114,36 @@ def run(
     
     # Determine output path
     if output is None:
-        output = Path.home() / ".crowelogic.toml"
+        output = home_config_path()
     
     # Show preview
     console.print("\n[bold]Configuration Preview:[/bold]")
     console.print(Panel("\n".join(config_lines), border_style="blue"))
     
-    # Confirm and write
-    if output.exists():
+    # Write, confirming first if the file already exists
+    config_text = "\n".join(config_lines) + "\n"
+    try:
+        write_config_file(output, config_text)
+    except FileExistsError:
         overwrite = Confirm.ask(f"\n[yellow]{output} already exists. Overwrite?[/yellow]", default=False)
         if not overwrite:
             console.print("[red]Configuration cancelled.[/red]")
             raise typer.Exit(1)
-    
-    output.write_text("\n".join(config_lines) + "\n")
+        write_config_file(output, config_text, overwrite=True)
     console.print(f"\n[green]✓ Configuration saved to {output}[/green]")
     
     # Test connection
     test = Confirm.ask("\nTest connection now?", default=True)
     if test:
         console.print("\n[dim]Running: crowelogic doctor run[/dim]")
-        import subprocess
-        result = subprocess.run(["crowelogic", "doctor", "run"], capture_output=False)
-        if result.returncode == 0:
+        from .doctor import run as doctor_run
+
+        try:
+            doctor_run()
+            exit_code = 0
+        except typer.Exit as e:
+            exit_code = e.exit_code
+        if exit_code == 0:
             console.print("\n[green]✓ Setup complete! Try: crowelogic interactive run[/green]")
         else:
             console.print("\n[yellow]Connection test failed. Check your configuration.[/yellow]")
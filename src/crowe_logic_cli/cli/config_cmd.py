@@ -1,22 +1,41 @@
 from __future__ import annotations
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from pathlib import Path
 
-from crowe_logic_cli.config import load_config
-from crowe_logic_cli.config_file import _find_config_file, load_config_file
+from crowe_logic_cli.config_file import (
+    _find_config_file,
+    home_config_path,
+    load_config_file,
+    write_config_file,
+)
+from crowe_logic_cli.output import mask_secret
 
 
+# Rich and the config loader are imported inside the commands that use them
+# so that `config path` stays a plain, fast lookup.
 app = typer.Typer(add_completion=False, help="Manage CLI configuration")
-console = Console()
+
+
+def _mask(key: str) -> str:
+    if key.startswith("keyvault://"):
+        return key  # a reference, not the secret itself
+    return mask_secret(key)
 
 
 @app.command()
-def show() -> None:
+def show(
+    resolve: bool = typer.Option(
+        False, "--resolve",
+        help="Show the effective configuration (environment overrides, Key Vault secrets)",
+    ),
+) -> None:
     """Show current configuration."""
+    from rich.markup import escape
+    from rich.table import Table
+
+    from crowe_logic_cli.output import get_console
+
+    console = get_console()
     config_path = _find_config_file()
     
     table = Table(title="Crowe Logic CLI Configuration", show_header=True)
@@ -27,7 +46,28 @@ def show() -> None:
         table.add_row("Config file", str(config_path))
     else:
         table.add_row("Config file", "[dim]Not found[/dim]")
+
+    if not resolve:
+        # File values as written: no env lookups, no Key Vault round-trips
+        try:
+            data = load_config_file(config_path) if config_path else {}
+        except Exception as e:
+            table.add_row("Error", f"[red]{escape(str(e))}[/red]")
+            data = {}
+        for section, values in data.items():
+            items = values.items() if isinstance(values, dict) else [(None, values)]
+            for key, value in items:
+                setting = f"{section}.{key}" if key else section
+                text = str(value)
+                if key and "key" in key.lower():
+                    text = _mask(text)
+                table.add_row(setting, escape(text))
+        console.print(table)
+        console.print("[dim]Use --resolve to include environment overrides and Key Vault secrets.[/dim]")
+        return
     
+    from crowe_logic_cli.config import load_config
+
     try:
         config = load_config()
         table.add_row("Provider", config.provider)
@@ -36,10 +76,7 @@ def show() -> None:
             table.add_row("Azure endpoint", config.azure.endpoint)
             table.add_row("Azure deployment", config.azure.deployment)
             table.add_row("Azure API version", config.azure.api_version)
-            # Mask API key
-            key = config.azure.api_key
-            masked = key[:4] + "*" * (len(key) - 8) + key[-4:] if len(key) > 8 else "****"
-            table.add_row("Azure API key", masked)
+            table.add_row("Azure API key", _mask(config.azure.api_key))
         
         if config.openai_compatible:
             table.add_row("Base URL", config.openai_compatible.base_url)
@@ -53,12 +90,10 @@ def show() -> None:
 @app.command()
 def init() -> None:
     """Create a new configuration file."""
-    config_path = Path.home() / ".crowelogic.toml"
-    
-    if config_path.exists():
-        console.print(f"[yellow]Config already exists: {config_path}[/yellow]")
-        if not typer.confirm("Overwrite?"):
-            raise typer.Exit(0)
+    from crowe_logic_cli.output import get_console
+
+    console = get_console()
+    config_path = home_config_path()
     
     template = '''# Crowe Logic CLI Configuration
 
@@ -74,7 +109,13 @@ api_version = "2024-02-15-preview"
 # api_key = "keyvault://your-vault/secret-name"
 '''
     
-    config_path.write_text(template)
+    try:
+        write_config_file(config_path, template)
+    except FileExistsError:
+        console.print(f"[yellow]Config already exists: {config_path}[/yellow]")
+        if not typer.confirm("Overwrite?"):
+            raise typer.Exit(0)
+        write_config_file(config_path, template, overwrite=True)
     console.print(f"[green]Created config file: {config_path}[/green]")
     console.print("[dim]Edit the file to add your Azure credentials.[/dim]")
 
@@ -84,7 +125,7 @@ def path() -> None:
     """Show path to config file."""
     config_path = _find_config_file()
     if config_path:
-        console.print(str(config_path))
+        print(config_path)
     else:
-        console.print("[dim]No config file found[/dim]")
-        console.print(f"[dim]Expected: ~/.crowelogic.toml[/dim]")
+        print("No config file found")
+        print("Expected: ~/.crowelogic.toml")
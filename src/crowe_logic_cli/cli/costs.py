@@ -4,13 +4,20 @@ from __future__ import annotations
 from typing import Optional
 
 import typer
-from rich.console import Console
 
-from crowe_logic_cli.cost_tracker import get_tracker
-from crowe_logic_cli.output import OutputFormat, print_output
+from crowe_logic_cli.cost_tracker import UsageSummary, get_tracker, has_usage
+from crowe_logic_cli.output import OutputFormat, get_console, print_output
 
 app = typer.Typer(help="View and manage usage costs")
-console = Console()
+console = get_console()
+
+
+def _print_period(days: Optional[int]) -> None:
+    """Print the text summary, skipping the tracker when nothing is recorded."""
+    if not has_usage():
+        console.print("[yellow]No usage recorded yet.[/yellow]")
+        return
+    get_tracker().print_summary(console=console, days=days)
 
 
 @app.command("summary")
@@ -19,10 +26,8 @@ def show_summary(
     output: str = typer.Option("text", "--output", "-o", help="Output format: text, json"),
 ) -> None:
     """Show usage cost summary."""
-    tracker = get_tracker()
-
     if output.lower() == "json":
-        summary = tracker.get_summary(days=days)
+        summary = get_tracker().get_summary(days=days) if has_usage() else UsageSummary()
         data = {
             "total_input_tokens": summary.total_input_tokens,
             "total_output_tokens": summary.total_output_tokens,
@@ -33,7 +38,7 @@ def show_summary(
         }
         print_output(data, OutputFormat.JSON, console=console)
     else:
-        tracker.print_summary(console=console, days=days)
+        _print_period(days)
 
 
 @app.command("clear")
@@ -55,19 +60,16 @@ def clear_usage(
 @app.command("today")
 def show_today() -> None:
     """Show today's usage."""
-    tracker = get_tracker()
-    tracker.print_summary(console=console, days=1)
+    _print_period(1)
 
 
 @app.command("week")
 def show_week() -> None:
     """Show this week's usage."""
-    tracker = get_tracker()
-    tracker.print_summary(console=console, days=7)
+    _print_period(7)
 
 
 @app.command("month")
 def show_month() -> None:
     """Show this month's usage."""
-    tracker = get_tracker()
-    tracker.print_summary(console=console, days=30)
+    _print_period(30)
@@ -1,25 +1,21 @@
 from __future__ import annotations
 
 import typer
-from rich.console import Console
 
 from crowe_logic_cli.config import load_config
-from crowe_logic_cli.providers.factory import create_provider
-from crowe_logic_cli.diagnostics import diagnose_connection_error, format_validation_error
+from crowe_logic_cli.output import get_console, mask_secret
 
 
 app = typer.Typer(add_completion=False, help="Validate provider configuration and connectivity")
-console = Console()
-
-
-def _mask(value: str, show_last: int = 4) -> str:
-    if len(value) <= show_last:
-        return "*" * len(value)
-    return "*" * (len(value) - show_last) + value[-show_last:]
+console = get_console()
 
 
 @app.command()
 def run() -> None:
+    # Provider SDKs (httpx etc.) are only needed once the command runs
+    from crowe_logic_cli.diagnostics import diagnose_connection_error, format_validation_error
+    from crowe_logic_cli.providers.factory import create_provider
+
     try:
         config = load_config()
     except ValueError as e:
@@ -39,18 +35,18 @@ def run() -> None:
         console.print(f"Azure endpoint: {config.azure.endpoint}")
         console.print(f"Azure deployment: {config.azure.deployment}")
         console.print(f"Azure api-version: {config.azure.api_version}")
-        console.print(f"Azure api-key: {_mask(config.azure.api_key)}")
+        console.print(f"Azure api-key: {mask_secret(config.azure.api_key)}")
 
     if config.openai_compatible:
         console.print(f"Base URL: {config.openai_compatible.base_url}")
         console.print(f"Model: {config.openai_compatible.model}")
-        console.print(f"API key: {_mask(config.openai_compatible.api_key)}")
+        console.print(f"API key: {mask_secret(config.openai_compatible.api_key)}")
 
     if config.azure_ai_inference:
         console.print(f"Azure AI endpoint: {config.azure_ai_inference.endpoint}")
         console.print(f"Azure AI model: {config.azure_ai_inference.model}")
         console.print(f"Azure AI api-version: {config.azure_ai_inference.api_version}")
-        console.print(f"Azure AI api-key: {_mask(config.azure_ai_inference.api_key)}")
+        console.print(f"Azure AI api-key: {mask_secret(config.azure_ai_inference.api_key)}")
 
     # Best-effort healthcheck if provider implements it
     healthcheck = getattr(provider, "healthcheck", None)
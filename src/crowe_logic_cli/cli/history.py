@@ -1,34 +1,71 @@
 from __future__ import annotations
 
-import json
+import functools
+import os
+import re
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Prompt
-from rich.table import Table
 
-from crowe_logic_cli.config import load_config
-from crowe_logic_cli.providers.base import Message
-from crowe_logic_cli.providers.factory import create_provider
+from crowe_logic_cli.jsonutil import dump_line, loads
+from crowe_logic_cli.output import get_console, print_stream
+
+# Rich widgets and the provider stack are imported inside the commands;
+# save/load are also used by `interactive` and need neither.
+if TYPE_CHECKING:
+    from crowe_logic_cli.providers.base import Message
 
 
 app = typer.Typer(add_completion=False, help="Manage conversation history")
-console = Console()
+console = get_console()
 
 
+@functools.lru_cache(maxsize=None)
 def get_history_dir() -> Path:
-    """Get the directory for storing conversation history."""
+    """Get the directory for storing conversation history.
+
+    Resolved and created once per process.
+    """
     history_dir = Path.home() / ".crowelogic" / "history"
     history_dir.mkdir(parents=True, exist_ok=True)
     return history_dir
 
 
+HISTORY_SCHEMA = "jsonl-v1"
+_UNSAFE_NAME_CHARS = re.compile(r"[^\w-]")
+META_SUFFIX = ".meta.json"
+
+# Panel (title, border style) for each role shown by `history load`
+_ROLE_STYLE: Dict[str, Tuple[str, str]] = {
+    "system": ("[dim]System[/dim]", "dim"),
+    "user": ("[bold yellow]User[/bold yellow]", "yellow"),
+    "assistant": ("[bold cyan]Assistant[/bold cyan]", "cyan"),
+}
+
+# Message lists saved in this process, keyed by file, with how many of their
+# messages are already on disk. Saving the same list again only appends the
+# new tail instead of rewriting the whole conversation.
+_saved: Dict[Path, Tuple[List[Message], int]] = {}
+
+
+def _replace_file(path: Path, data: bytes) -> None:
+    """Write path atomically: a crash leaves the old file, never a partial one."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
 def save_conversation(messages: List[Message], name: Optional[str] = None) -> Path:
-    """Save a conversation to disk."""
+    """Save a conversation to disk as JSON Lines.
+
+    The first line is a header with the creation timestamp and schema, followed
+    by one message per line. Re-saving a list that was saved (or loaded) before
+    appends only the messages added since; anything else replaces the file
+    atomically.
+    """
     history_dir = get_history_dir()
     
     if name is None:
@@ -37,36 +74,161 @@ def save_conversation(messages: List[Message], name: Optional[str] = None) -> Pa
         name = f"conversation_{timestamp}"
     
     # Sanitize filename
-    safe_name = "".join(c if c.isalnum() or c in "_-" else "_" for c in name)
-    filepath = history_dir / f"{safe_name}.json"
-    
-    data = {
-        "timestamp": datetime.now().isoformat(),
-        "messages": messages,
-    }
-    
-    with open(filepath, "w") as f:
-        json.dump(data, f, indent=2)
-    
+    safe_name = _UNSAFE_NAME_CHARS.sub("_", name)
+    filepath = history_dir / f"{safe_name}.jsonl"
+
+    previous, written = _saved.get(filepath, (None, 0))
+    if previous is messages and written <= len(messages) and filepath.exists():
+        with open(filepath, "r+b") as f:
+            end = f.seek(0, os.SEEK_END)
+            if end:
+                # Don't extend a torn last line that load_conversation skipped
+                f.seek(end - 1)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+            f.writelines(dump_line(msg) for msg in messages[written:])
+    else:
+        header = {"timestamp": datetime.now().isoformat(), "schema": HISTORY_SCHEMA}
+        _replace_file(
+            filepath, b"".join([dump_line(header), *(dump_line(msg) for msg in messages)])
+        )
+        # The JSONL file supersedes a legacy single-document save
+        filepath.with_suffix(".json").unlink(missing_ok=True)
+
+    _saved[filepath] = (messages, len(messages))
+    _write_meta(filepath, len(messages))
     return filepath
 
 
-def load_conversation(name: str) -> List[Message]:
-    """Load a conversation from disk."""
+def _meta_path(conv_file: Path) -> Path:
+    return conv_file.with_name(conv_file.stem + META_SUFFIX)
+
+
+def _write_meta(conv_file: Path, count: int) -> None:
+    """Record the last save time and message count next to a conversation."""
+    meta = {"timestamp": datetime.now().isoformat(), "count": count}
+    try:
+        _replace_file(_meta_path(conv_file), dump_line(meta))
+    except OSError:
+        pass
+
+
+def _find_conversation(name: str) -> Path:
+    """Return the saved file for a conversation name.
+
+    Only ``<name>.jsonl`` and ``<name>.json`` directly inside the history
+    directory are considered; names with path separators, names that would
+    escape the directory, and metadata sidecars are never matched.
+    """
     history_dir = get_history_dir()
-    
-    # Try exact match
-    filepath = history_dir / f"{name}.json"
-    if not filepath.exists():
-        # Try without .json extension
-        filepath = history_dir / name
-        if not filepath.exists():
-            raise FileNotFoundError(f"Conversation not found: {name}")
-    
-    with open(filepath) as f:
-        data = json.load(f)
-    
-    return data["messages"]
+    separators = {"/", "\\", os.sep, os.altsep} - {None}
+    if name and name not in (".", "..") and not any(sep in name for sep in separators):
+        root = history_dir.resolve()
+        for candidate in (f"{name}.jsonl", f"{name}.json"):
+            filepath = history_dir / candidate
+            if (
+                not candidate.endswith(META_SUFFIX)
+                and filepath.resolve().parent == root
+                and filepath.is_file()
+            ):
+                return filepath
+    raise FileNotFoundError(f"Conversation not found: {name}")
+
+
+def _split_jsonl(data: bytes) -> Tuple[bytes, List[bytes]]:
+    """Split a JSONL history file into its header and message lines."""
+    header, *lines = data.splitlines() or [b""]
+    return header, [line for line in lines if line.strip()]
+
+
+def load_conversation(name: str) -> List[Message]:
+    """Load a conversation from disk (JSON Lines or the legacy JSON format)."""
+    filepath = _find_conversation(name)
+    data = filepath.read_bytes()
+
+    if filepath.suffix != ".jsonl":
+        return loads(data)["messages"]
+
+    # Parse all message lines in one call, as a single JSON array
+    _, lines = _split_jsonl(data)
+    try:
+        messages: List[Message] = loads(b"[" + b",".join(lines) + b"]")
+    except ValueError:
+        # An append cut short by a crash can leave a torn line; skip it
+        messages = []
+        for line in lines:
+            try:
+                messages.append(loads(line))
+            except ValueError:
+                continue
+
+    # A later save of this list under the same name only appends
+    _saved[filepath] = (messages, len(messages))
+    return messages
+
+
+def _conversation_summary(conv_file: Path) -> Tuple[str, int]:
+    """Return (timestamp, message count) for a saved conversation.
+
+    Reads the small metadata sidecar written by save_conversation; files
+    saved before sidecars existed fall back to scanning the conversation.
+    """
+    try:
+        meta = loads(_meta_path(conv_file).read_bytes())
+        return meta["timestamp"], int(meta["count"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    data = conv_file.read_bytes()
+    if conv_file.suffix != ".jsonl":
+        conversation = loads(data)
+        return conversation.get("timestamp", "Unknown"), len(conversation.get("messages", []))
+
+    header, lines = _split_jsonl(data)
+    try:
+        timestamp = loads(header).get("timestamp", "Unknown")
+    except (ValueError, AttributeError):
+        timestamp = "Unknown"
+    return timestamp, len(lines)
+
+
+# Context sent with each request in interactive and resumed sessions
+DEFAULT_CONTEXT_TURNS = 20
+DEFAULT_CONTEXT_CHARS = 32_000
+
+
+def trim_context(
+    messages: Sequence[Message],
+    max_turns: int = DEFAULT_CONTEXT_TURNS,
+    max_chars: int = DEFAULT_CONTEXT_CHARS,
+) -> Sequence[Message]:
+    """Return the system prompt plus the most recent turns that fit.
+
+    Keeps at most ``max_turns`` user/assistant pairs and drops the oldest
+    of those while the total exceeds ``max_chars``. The newest message is
+    always kept, and a trimmed window starts on a user message. Returns
+    ``messages`` itself when nothing is dropped; ``max_turns <= 0`` sends
+    the whole conversation.
+    """
+    if max_turns <= 0:
+        return messages
+
+    head = list(messages[:1]) if messages and messages[0]["role"] == "system" else []
+    body = messages[len(head):]
+    tail = body[-2 * max_turns:]
+
+    budget = max_chars - sum(len(m["content"]) for m in head)
+    used = sum(len(m["content"]) for m in tail)
+    start = 0
+    while start < len(tail) - 1 and used > budget:
+        used -= len(tail[start]["content"])
+        start += 1
+
+    if start == 0 and len(tail) == len(body):
+        return messages
+    while start < len(tail) - 1 and tail[start]["role"] != "user":
+        start += 1
+    return head + list(tail[start:])
 
 
 @app.command("save")
@@ -82,21 +244,20 @@ def load_cmd(
     name: str = typer.Argument(..., help="Name of conversation to load"),
 ) -> None:
     """Load and display a saved conversation."""
+    from rich.panel import Panel
+    from rich.text import Text
+
     try:
         messages = load_conversation(name)
         
         console.print(Panel(f"[bold]Loaded: {name}[/bold]", border_style="green"))
         
         for msg in messages:
-            role = msg["role"]
-            content = msg["content"]
-            
-            if role == "system":
-                console.print(Panel(content, title="[dim]System[/dim]", border_style="dim"))
-            elif role == "user":
-                console.print(Panel(content, title="[bold yellow]User[/bold yellow]", border_style="yellow"))
-            elif role == "assistant":
-                console.print(Panel(content, title="[bold cyan]Assistant[/bold cyan]", border_style="cyan"))
+            style = _ROLE_STYLE.get(msg["role"])
+            if style is not None:
+                title, border_style = style
+                # Message text is shown verbatim, not parsed as Rich markup
+                console.print(Panel(Text(msg["content"]), title=title, border_style=border_style))
         
         console.print(f"\n[dim]To resume this conversation, use: crowelogic history resume {name}[/dim]")
     
@@ -108,8 +269,18 @@ def load_cmd(
 @app.command("list")
 def list_conversations() -> None:
     """List all saved conversations."""
-    history_dir = get_history_dir()
-    conversations = sorted(history_dir.glob("*.json"), reverse=True)
+    from rich.table import Table
+
+    # One directory pass; DirEntry caches the stat used for sorting
+    with os.scandir(get_history_dir()) as it:
+        conversations = [
+            (entry.stat().st_mtime, Path(entry.path))
+            for entry in it
+            if entry.name.endswith((".jsonl", ".json"))
+            and not entry.name.endswith(META_SUFFIX)
+            and entry.is_file()
+        ]
+    conversations.sort(key=lambda item: item[0], reverse=True)
     
     if not conversations:
         console.print("[yellow]No saved conversations found.[/yellow]")
@@ -120,19 +291,15 @@ def list_conversations() -> None:
     table.add_column("Date", style="dim")
     table.add_column("Messages", justify="right")
     
-    for conv_file in conversations:
-        with open(conv_file) as f:
-            data = json.load(f)
-        
+    for mtime, conv_file in conversations:
         name = conv_file.stem
-        timestamp = data.get("timestamp", "Unknown")
+        timestamp, message_count = _conversation_summary(conv_file)
         try:
             dt = datetime.fromisoformat(timestamp)
-            date_str = dt.strftime("%Y-%m-%d %H:%M")
         except (ValueError, TypeError):
-            date_str = timestamp
-        
-        message_count = len(data.get("messages", []))
+            # No usable saved timestamp; fall back to the file's mtime
+            dt = datetime.fromtimestamp(mtime)
+        date_str = dt.strftime("%Y-%m-%d %H:%M")
         
         table.add_row(name, date_str, str(message_count))
     
@@ -145,8 +312,19 @@ def list_conversations() -> None:
 def resume_conversation(
     name: str = typer.Argument(..., help="Name of conversation to resume"),
     no_stream: bool = typer.Option(False, "--no-stream", help="Disable streaming"),
+    max_turns: int = typer.Option(
+        DEFAULT_CONTEXT_TURNS, "--max-turns",
+        help="Most recent turns sent with each request (0 = whole conversation)",
+    ),
 ) -> None:
     """Resume a saved conversation in interactive mode."""
+    from rich.panel import Panel
+    from rich.prompt import Prompt
+    from rich.text import Text
+
+    from crowe_logic_cli.config import load_config
+    from crowe_logic_cli.providers.factory import get_shared_provider
+
     try:
         messages = load_conversation(name)
         
@@ -163,13 +341,15 @@ def resume_conversation(
             content = msg["content"][:100] + "..." if len(msg["content"]) > 100 else msg["content"]
             
             if role == "user":
-                console.print(f"[yellow]You:[/yellow] {content}")
+                console.print(Text.assemble(("You:", "yellow"), " ", content))
             elif role == "assistant":
-                console.print(f"[cyan]Assistant:[/cyan] {content}")
+                console.print(Text.assemble(("Assistant:", "cyan"), " ", content))
         
         # Start interactive session with loaded messages
         config = load_config()
-        provider = create_provider(config)
+        provider = get_shared_provider(config)
+        # Decided once per session; cleared if the provider turns out not to stream
+        chat_stream = None if no_stream else getattr(provider, "chat_stream", None)
         
         console.print("\n[dim]Continue the conversation below. Type /exit to quit, /save to save.[/dim]\n")
         
@@ -202,24 +382,22 @@ def resume_conversation(
             messages.append({"role": "user", "content": user_input})
             
             # Get response
+            context = trim_context(messages, max_turns)
             try:
-                if no_stream or not hasattr(provider, "chat_stream"):
+                if chat_stream is None:
                     with console.status("[cyan]Thinking...[/cyan]", spinner="dots"):
-                        response = provider.chat(messages)
-                    console.print(f"[cyan]Assistant:[/cyan] {response.content}")
+                        response = provider.chat(context)
+                    console.print(Text.assemble(("Assistant:", "cyan"), " ", response.content))
                     messages.append({"role": "assistant", "content": response.content})
                 else:
                     console.print("[cyan]Assistant:[/cyan] ", end="")
-                    full_response = ""
                     try:
-                        for chunk in provider.chat_stream(messages):
-                            console.print(chunk, end="")
-                            full_response += chunk
+                        full_response = print_stream(chat_stream(context), console)
                     except NotImplementedError:
-                        response = provider.chat(messages)
+                        chat_stream = None
+                        response = provider.chat(context)
                         full_response = response.content
                         console.print(full_response)
-                    console.print()
                     messages.append({"role": "assistant", "content": full_response})
             
             except Exception as e:
@@ -236,12 +414,13 @@ def delete_conversation(
     name: str = typer.Argument(..., help="Name of conversation to delete"),
 ) -> None:
     """Delete a saved conversation."""
-    history_dir = get_history_dir()
-    filepath = history_dir / f"{name}.json"
-    
-    if not filepath.exists():
+    try:
+        filepath = _find_conversation(name)
+    except FileNotFoundError:
         console.print(f"[red]Conversation not found: {name}[/red]")
         raise typer.Exit(1)
     
     filepath.unlink()
+    _meta_path(filepath).unlink(missing_ok=True)
+    _saved.pop(filepath, None)
     console.print(f"[green]Deleted: {name}[/green]")
@@ -1,26 +1,27 @@
 from __future__ import annotations
 
 import typer
-from rich.console import Console
-from rich.markdown import Markdown
-from rich.panel import Panel
-from rich.prompt import Prompt
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional, List
 
-from crowe_logic_cli.config import load_config
-from crowe_logic_cli.providers.base import Message
-from crowe_logic_cli.providers.factory import create_provider
-from crowe_logic_cli.cli.history import save_conversation
+from crowe_logic_cli.cli.history import DEFAULT_CONTEXT_TURNS, save_conversation, trim_context
+from crowe_logic_cli.output import get_console, print_stream
+
+# Rich widgets and the provider stack are imported when a session starts
+if TYPE_CHECKING:
+    from crowe_logic_cli.providers.base import Message
 
 
 app = typer.Typer(add_completion=False, help="Interactive multi-turn chat session")
-console = Console()
+console = get_console()
 
 SYSTEM_PROMPT = """You are a helpful AI assistant for Crowe Logic. You assist with software engineering tasks, code review, architecture decisions, and developer productivity. Be concise and actionable."""
 
 
 def _render_response(content: str) -> None:
     """Render assistant response as markdown in a panel."""
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+
     md = Markdown(content)
     console.print(Panel(md, title="[bold cyan]Assistant[/bold cyan]", border_style="cyan"))
 
@@ -33,10 +34,20 @@ def run(
     no_stream: bool = typer.Option(
         False, "--no-stream", help="Disable streaming responses"
     ),
+    max_turns: int = typer.Option(
+        DEFAULT_CONTEXT_TURNS, "--max-turns",
+        help="Most recent turns sent with each request (0 = whole conversation)",
+    ),
 ) -> None:
     """Start an interactive chat session."""
+    from rich.panel import Panel
+    from rich.prompt import Prompt
+
+    from crowe_logic_cli.config import load_config
+    from crowe_logic_cli.providers.factory import get_shared_provider
+
     config = load_config()
-    provider = create_provider(config)
+    provider = get_shared_provider(config)
 
     console.print(
         Panel(
@@ -56,6 +67,11 @@ def run(
     
     total_input_tokens = 0
     total_output_tokens = 0
+    # Characters across all messages, kept in step with `messages`
+    input_chars = len(system_prompt)
+
+    # Decided once per session; cleared if the provider turns out not to stream
+    chat_stream = None if no_stream else getattr(provider, "chat_stream", None)
 
     while True:
         try:
@@ -76,6 +92,7 @@ def run(
             break
         if user_input.lower() == "/clear":
             messages = [{"role": "system", "content": system_prompt}]
+            input_chars = len(system_prompt)
             console.print("[dim]Conversation cleared.[/dim]")
             continue
         if user_input.lower() == "/save":
@@ -89,13 +106,19 @@ def run(
 
         # Add user message
         messages.append({"role": "user", "content": user_input})
+        input_chars += len(user_input)
+
+        # Send the recent window; the window is small, so measuring it is cheap
+        context = trim_context(messages, max_turns)
+        sent_chars = input_chars if context is messages else sum(len(m["content"]) for m in context)
 
         # Get response (streaming or non-streaming)
         try:
-            if no_stream or not hasattr(provider, "chat_stream"):
+            if chat_stream is None:
                 with console.status("[cyan]Thinking...[/cyan]", spinner="dots"):
-                    response = provider.chat(messages)
+                    response = provider.chat(context)
                 messages.append({"role": "assistant", "content": response.content})
+                input_chars += len(response.content)
                 _render_response(response.content)
                 
                 # Track usage
@@ -110,22 +133,20 @@ def run(
             else:
                 # Stream response
                 console.print("\n[bold cyan]Assistant[/bold cyan]")
-                full_response = ""
                 fallback_usage = None
                 try:
-                    for chunk in provider.chat_stream(messages):
-                        console.print(chunk, end="")
-                        full_response += chunk
+                    full_response = print_stream(chat_stream(context), console)
                 except NotImplementedError:
-                    # Fallback to non-streaming
+                    # Fallback to non-streaming for the rest of the session
+                    chat_stream = None
                     with console.status("[cyan]Thinking...[/cyan]", spinner="dots"):
-                        response = provider.chat(messages)
+                        response = provider.chat(context)
                     full_response = response.content
                     fallback_usage = response.usage
                     console.print(full_response)
 
-                console.print()  # New line after streaming
                 messages.append({"role": "assistant", "content": full_response})
+                input_chars += len(full_response)
 
                 # Track usage - use actual if available from fallback, otherwise estimate
                 if fallback_usage:
@@ -140,8 +161,7 @@ def run(
                     # Estimate tokens for streaming (rough approximation: ~4 chars per token)
                     # Note: Streaming APIs don't return usage info; this is an estimate
                     estimated_output = len(full_response) // 4
-                    input_chars = sum(len(m["content"]) for m in messages[:-1])
-                    estimated_input = input_chars // 4
+                    estimated_input = sent_chars // 4
                     total_input_tokens += estimated_input
                     total_output_tokens += estimated_output
                     console.print(f"[dim]Tokens (est): ~{estimated_input} in / ~{estimated_output} out[/dim]")
@@ -149,4 +169,4 @@ def run(
         except Exception as e:
             console.print(f"[red]Error: {e}[/red]")
             # Remove the failed user message
-            messages.pop()
+            input_chars -= len(messages.pop()["content"])
@@ -4,13 +4,15 @@ from __future__ import annotations
 from typing import Optional
 
 import typer
-from rich.console import Console
 
-from crowe_logic_cli.licensing import get_license_manager
-from crowe_logic_cli.output import OutputFormat, print_output
+from crowe_logic_cli.output import OutputFormat, get_console, print_output
 
 app = typer.Typer(help="Manage your Crowe Logic license")
-console = Console()
+console = get_console()
+
+# Cells of the `license features` table
+_CHECK = "[green]✓[/green]"
+_DASH = "[dim]–[/dim]"
 
 
 @app.command("status")
@@ -18,6 +20,8 @@ def show_status(
     output: str = typer.Option("text", "--output", "-o", help="Output format: text, json"),
 ) -> None:
     """Show current license status."""
+    from crowe_logic_cli.licensing import get_license_manager
+
     manager = get_license_manager()
 
     if output.lower() == "json":
@@ -40,6 +44,8 @@ def activate_license(
     license_key: str = typer.Argument(..., help="Your license key"),
 ) -> None:
     """Activate a license key."""
+    from crowe_logic_cli.licensing import get_license_manager
+
     manager = get_license_manager()
     success, message = manager.activate(license_key)
 
@@ -56,6 +62,8 @@ def deactivate_license(
     force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation"),
 ) -> None:
     """Deactivate current license."""
+    from crowe_logic_cli.licensing import get_license_manager
+
     if not force:
         confirm = typer.confirm("Are you sure you want to deactivate your license?")
         if not confirm:
@@ -108,10 +116,9 @@ def show_upgrade() -> None:
 def list_features() -> None:
     """List all available features by tier."""
     from crowe_logic_cli.licensing import (
+        ALL_FEATURES,
         FREE_FEATURES,
-        PRO_FEATURES,
-        ENTERPRISE_ONLY_FEATURES,
-        LicenseTier,
+        PRO_OR_FREE_FEATURES,
     )
     from rich.table import Table
 
@@ -121,12 +128,9 @@ def list_features() -> None:
     table.add_column("Pro", justify="center")
     table.add_column("Enterprise", justify="center")
 
-    all_features = sorted(FREE_FEATURES | PRO_FEATURES | ENTERPRISE_ONLY_FEATURES)
-
-    for feature in all_features:
-        free = "[green]✓[/green]" if feature in FREE_FEATURES else "[dim]–[/dim]"
-        pro = "[green]✓[/green]" if feature in FREE_FEATURES or feature in PRO_FEATURES else "[dim]–[/dim]"
-        enterprise = "[green]✓[/green]"  # Enterprise has all features
-        table.add_row(feature, free, pro, enterprise)
+    for feature in ALL_FEATURES:
+        free = _CHECK if feature in FREE_FEATURES else _DASH
+        pro = _CHECK if feature in PRO_OR_FREE_FEATURES else _DASH
+        table.add_row(feature, free, pro, _CHECK)  # Enterprise has all features
 
     console.print(table)
@@ -1,12 +1,45 @@
 """MCP command for Model Context Protocol operations."""
+import io
 import json
+from typing import Iterator
 import typer
-from rich.console import Console
-from rich.table import Table
 from rich.panel import Panel
 
+from ..jsonutil import dump_line, loads
+from ..output import get_console
+
 app = typer.Typer(help="Model Context Protocol (MCP) operations")
-console = Console()
+console = get_console()
+
+# Client config snippet printed by `mcp config`; it never changes, so render it once
+_MCP_CONFIG_JSON = json.dumps(
+    {"mcpServers": {"crowe-logic": {"command": "crowelogic", "args": ["mcp", "serve"]}}},
+    indent=2,
+)
+
+
+def _read_lines(stream: io.BufferedIOBase, chunk_size: int = 65536) -> Iterator[bytearray]:
+    """Yield newline-delimited messages from a binary stream.
+
+    Input is read in large chunks into one reusable buffer and split on
+    newlines, rather than decoding and allocating a fresh line per readline().
+    A final message without a trailing newline is still yielded.
+    """
+    buf = bytearray()
+    while True:
+        chunk = stream.read1(chunk_size)
+        if not chunk:
+            if buf:
+                yield buf
+            return
+        buf += chunk
+        start = 0
+        end = buf.find(b"\n")
+        while end != -1:
+            yield buf[start:end]
+            start = end + 1
+            end = buf.find(b"\n", start)
+        del buf[:start]
 
 
 @app.command("serve")
@@ -14,7 +47,7 @@ def serve():
     """Start Crowe Logic as an MCP server (stdio)."""
     import sys
     from ..config import load_config
-    from ..providers.factory import create_provider
+    from ..providers.factory import get_shared_provider
     
     tools = {
         "quantum_reason": {
@@ -35,6 +68,12 @@ def serve():
         }
     }
     
+    out = sys.stdout.buffer
+
+    def send(message):
+        out.write(dump_line(message))
+        out.flush()
+
     def handle_request(request):
         method = request.get("method", "")
         params = request.get("params", {})
@@ -60,9 +99,6 @@ def serve():
             name = params.get("name")
             args = params.get("arguments", {})
             
-            config = load_config()
-            provider = create_provider(config)
-            
             if name == "quantum_reason":
                 prompt = f"Apply 4-stage reasoning:\n{args.get('problem')}"
             elif name == "code_review":
@@ -70,9 +106,19 @@ def serve():
             else:
                 return {"jsonrpc": "2.0", "id": req_id, "error": {"code": -32601, "message": "Unknown tool"}}
             
-            result = ""
+            # One provider (and its HTTP connection pool) serves every call
+            provider = get_shared_provider(load_config())
+            # Clients that pass a progress token hear about each chunk as it arrives
+            token = (params.get("_meta") or {}).get("progressToken")
+            parts = []
             for chunk in provider.chat_completion_stream([{"role": "user", "content": prompt}]):
-                result += chunk
+                parts.append(chunk)
+                if token is not None:
+                    send({
+                        "jsonrpc": "2.0", "method": "notifications/progress",
+                        "params": {"progressToken": token, "progress": len(parts)},
+                    })
+            result = "".join(parts)
             
             return {
                 "jsonrpc": "2.0", "id": req_id,
@@ -81,26 +127,25 @@ def serve():
         
         return {"jsonrpc": "2.0", "id": req_id, "error": {"code": -32601, "message": "Unknown method"}}
     
-    console.print("[dim]MCP server started (stdio)[/dim]", err=True)
+    # stdout carries the JSON-RPC stream, so status goes to stderr
+    typer.echo("MCP server started (stdio)", err=True)
     
-    while True:
-        try:
-            line = sys.stdin.readline()
-            if not line:
-                break
-            request = json.loads(line)
-            response = handle_request(request)
-            sys.stdout.write(json.dumps(response) + "\n")
-            sys.stdout.flush()
-        except json.JSONDecodeError:
-            continue
-        except KeyboardInterrupt:
-            break
+    try:
+        for line in _read_lines(sys.stdin.buffer):
+            try:
+                request = loads(line)
+            except ValueError:  # json and orjson decode errors both subclass it
+                continue
+            send(handle_request(request))
+    except KeyboardInterrupt:
+        pass
 
 
 @app.command("tools")
 def list_tools():
     """List available MCP tools."""
+    from rich.table import Table
+
     table = Table(title="MCP Tools")
     table.add_column("Tool", style="cyan")
     table.add_column("Description")
@@ -114,17 +159,8 @@ def list_tools():
 @app.command("config")
 def show_config():
     """Show MCP config for Claude Desktop."""
-    config = {
-        "mcpServers": {
-            "crowe-logic": {
-                "command": "crowelogic",
-                "args": ["mcp", "serve"]
-            }
-        }
-    }
-    
     console.print(Panel(
-        json.dumps(config, indent=2),
+        _MCP_CONFIG_JSON,
         title="[bold cyan]Claude Desktop MCP Config[/bold cyan]",
         subtitle="Add to ~/Library/Application Support/Claude/claude_desktop_config.json"
     ))
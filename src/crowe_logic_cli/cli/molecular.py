@@ -2,36 +2,18 @@ from __future__ import annotations
 
 import typer
 from pathlib import Path
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 from typing import Optional
 
-from crowe_logic_cli.config import load_config
-from crowe_logic_cli.providers.base import coerce_messages
-from crowe_logic_cli.providers.factory import create_provider
+from crowe_logic_cli.cli.common import run_prompt
+from crowe_logic_cli.files import read_head
+from crowe_logic_cli.output import get_console
 
 
 app = typer.Typer(add_completion=False, help="Molecular dynamics and chemistry analysis")
-console = Console()
+console = get_console()
 
 
-@app.command()
-def analyze(
-    file: Path = typer.Argument(..., help="Molecular structure or trajectory file"),
-    format: Optional[str] = typer.Option(
-        None, "--format", "-f", help="File format (pdb, mol2, xyz, sdf)"
-    ),
-) -> None:
-    """Analyze molecular structure or dynamics trajectory."""
-    if not file.exists():
-        console.print(f"[red]Error: File not found: {file}[/red]")
-        raise typer.Exit(1)
-
-    content = file.read_text()
-    detected_format = format or file.suffix.lstrip(".")
-
-    prompt = f"""Analyze this molecular structure file ({detected_format} format).
+_ANALYZE_PROMPT = """Analyze this molecular structure file ({detected_format} format).
 
 Provide:
 1. Molecule identification
@@ -41,32 +23,31 @@ Provide:
 5. Any notable properties
 
 File content:
-{content[:5000]}
+{content}
 """
 
-    config = load_config()
-    provider = create_provider(config)
-    messages = coerce_messages(prompt)
-
-    console.print(Panel(f"[bold cyan]Molecular Analysis: {file.name}[/bold cyan]"))
-
-    for chunk in provider.stream(messages):
-        console.print(chunk, end="")
-    console.print()
-
 
 @app.command()
-def validate_structure(
-    file: Path = typer.Argument(..., help="Molecular structure file to validate"),
+def analyze(
+    file: Path = typer.Argument(..., help="Molecular structure or trajectory file"),
+    format: Optional[str] = typer.Option(
+        None, "--format", "-f", help="File format (pdb, mol2, xyz, sdf)"
+    ),
 ) -> None:
-    """Validate molecular structure for errors and inconsistencies."""
+    """Analyze molecular structure or dynamics trajectory."""
     if not file.exists():
         console.print(f"[red]Error: File not found: {file}[/red]")
         raise typer.Exit(1)
 
-    content = file.read_text()
+    content = read_head(file, 5000)
+    detected_format = format or file.suffix.lstrip(".")
+
+    prompt = _ANALYZE_PROMPT.format(detected_format=detected_format, content=content)
+
+    run_prompt(f"Molecular Analysis: {file.name}", prompt)
+
 
-    prompt = f"""Validate this molecular structure for errors and inconsistencies.
+_VALIDATE_STRUCTURE_PROMPT = """Validate this molecular structure for errors and inconsistencies.
 
 Check for:
 1. Invalid bond lengths or angles
@@ -76,26 +57,27 @@ Check for:
 5. Format compliance
 
 Structure content:
-{content[:5000]}
+{content}
 """
 
-    config = load_config()
-    provider = create_provider(config)
-    messages = coerce_messages(prompt)
 
-    console.print(Panel("[bold cyan]Structure Validation[/bold cyan]"))
+@app.command()
+def validate_structure(
+    file: Path = typer.Argument(..., help="Molecular structure file to validate"),
+) -> None:
+    """Validate molecular structure for errors and inconsistencies."""
+    if not file.exists():
+        console.print(f"[red]Error: File not found: {file}[/red]")
+        raise typer.Exit(1)
+
+    content = read_head(file, 5000)
+
+    prompt = _VALIDATE_STRUCTURE_PROMPT.format(content=content)
 
-    for chunk in provider.stream(messages):
-        console.print(chunk, end="")
-    console.print()
+    run_prompt("Structure Validation", prompt)
 
 
-@app.command()
-def pubchem(
-    cid: int = typer.Argument(..., help="PubChem Compound ID (CID)"),
-) -> None:
-    """Look up compound information from PubChem."""
-    prompt = f"""Provide detailed information about PubChem compound CID {cid}.
+_PUBCHEM_PROMPT = """Provide detailed information about PubChem compound CID {cid}.
 
 Include:
 1. Chemical name and synonyms
@@ -107,23 +89,18 @@ Include:
 7. Common uses
 """
 
-    config = load_config()
-    provider = create_provider(config)
-    messages = coerce_messages(prompt)
 
-    console.print(Panel(f"[bold cyan]PubChem: CID {cid}[/bold cyan]"))
+@app.command()
+def pubchem(
+    cid: int = typer.Argument(..., help="PubChem Compound ID (CID)"),
+) -> None:
+    """Look up compound information from PubChem."""
+    prompt = _PUBCHEM_PROMPT.format(cid=cid)
 
-    for chunk in provider.stream(messages):
-        console.print(chunk, end="")
-    console.print()
+    run_prompt(f"PubChem: CID {cid}", prompt)
 
 
-@app.command()
-def drugbank(
-    drug_id: str = typer.Argument(..., help="DrugBank ID (e.g., DB00945)"),
-) -> None:
-    """Look up drug information from DrugBank."""
-    prompt = f"""Provide detailed information about DrugBank compound {drug_id}.
+_DRUGBANK_PROMPT = """Provide detailed information about DrugBank compound {drug_id}.
 
 Include:
 1. Drug name and classification
@@ -134,24 +111,18 @@ Include:
 6. Chemical properties
 """
 
-    config = load_config()
-    provider = create_provider(config)
-    messages = coerce_messages(prompt)
 
-    console.print(Panel(f"[bold cyan]DrugBank: {drug_id}[/bold cyan]"))
+@app.command()
+def drugbank(
+    drug_id: str = typer.Argument(..., help="DrugBank ID (e.g., DB00945)"),
+) -> None:
+    """Look up drug information from DrugBank."""
+    prompt = _DRUGBANK_PROMPT.format(drug_id=drug_id)
 
-    for chunk in provider.stream(messages):
-        console.print(chunk, end="")
-    console.print()
+    run_prompt(f"DrugBank: {drug_id}", prompt)
 
 
-@app.command()
-def compare(
-    molecule1: str = typer.Argument(..., help="First molecule (name, SMILES, or formula)"),
-    molecule2: str = typer.Argument(..., help="Second molecule (name, SMILES, or formula)"),
-) -> None:
-    """Compare two molecules."""
-    prompt = f"""Compare these two molecules:
+_COMPARE_PROMPT = """Compare these two molecules:
 
 Molecule 1: {molecule1}
 Molecule 2: {molecule2}
@@ -164,12 +135,13 @@ Provide:
 5. Any notable relationships (isomers, analogs, etc.)
 """
 
-    config = load_config()
-    provider = create_provider(config)
-    messages = coerce_messages(prompt)
 
-    console.print(Panel("[bold cyan]Molecule Comparison[/bold cyan]"))
+@app.command()
+def compare(
+    molecule1: str = typer.Argument(..., help="First molecule (name, SMILES, or formula)"),
+    molecule2: str = typer.Argument(..., help="Second molecule (name, SMILES, or formula)"),
+) -> None:
+    """Compare two molecules."""
+    prompt = _COMPARE_PROMPT.format(molecule1=molecule1, molecule2=molecule2)
 
-    for chunk in provider.stream(messages):
-        console.print(chunk, end="")
-    console.print()
+    run_prompt("Molecule Comparison", prompt)
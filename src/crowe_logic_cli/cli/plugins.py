@@ -5,13 +5,14 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 import typer
-from rich.console import Console
-from rich.table import Table
 from rich.panel import Panel
 
+from ..files import read_head
+from ..output import get_console
+
 
 app = typer.Typer(add_completion=False, help="Discover available plugins, agents, and commands")
-console = Console()
+console = get_console()
 
 
 def _find_plugins_dir() -> Optional[Path]:
@@ -29,7 +30,11 @@ def _find_plugins_dir() -> Optional[Path]:
 
 
 def _scan_plugin(plugin_path: Path) -> Dict[str, List[str]]:
-    """Scan a plugin directory for agents, commands, skills, hooks."""
+    """Scan a plugin directory for agents, commands, skills, hooks.
+
+    Uses os.scandir so directory checks come from the directory listing
+    rather than a stat() per entry.
+    """
     result: Dict[str, List[str]] = {
         "agents": [],
         "commands": [],
@@ -37,12 +42,15 @@ def _scan_plugin(plugin_path: Path) -> Dict[str, List[str]]:
         "hooks": [],
     }
 
-    for category in result.keys():
-        category_dir = plugin_path / category
-        if category_dir.is_dir():
-            for item in category_dir.iterdir():
-                if item.suffix == ".md" or item.is_dir():
-                    result[category].append(item.stem)
+    with os.scandir(plugin_path) as entries:
+        category_dirs = [e for e in entries if e.name in result and e.is_dir()]
+
+    for category_dir in category_dirs:
+        with os.scandir(category_dir.path) as items:
+            for item in items:
+                stem, suffix = os.path.splitext(item.name)
+                if suffix == ".md" or item.is_dir():
+                    result[category_dir.name].append(stem)
 
     return result
 
@@ -50,6 +58,8 @@ def _scan_plugin(plugin_path: Path) -> Dict[str, List[str]]:
 @app.command("list")
 def list_plugins() -> None:
     """List all available plugins and their contents."""
+    from rich.table import Table
+
     plugins_dir = _find_plugins_dir()
 
     if plugins_dir is None:
@@ -60,7 +70,10 @@ def list_plugins() -> None:
     console.print(Panel(f"[bold]Plugins Directory[/bold]: {plugins_dir}", border_style="blue"))
 
     # Scan each plugin
-    plugins = sorted([p for p in plugins_dir.iterdir() if p.is_dir() and not p.name.startswith(".")])
+    with os.scandir(plugins_dir) as entries:
+        plugins = sorted(
+            Path(e.path) for e in entries if not e.name.startswith(".") and e.is_dir()
+        )
 
     table = Table(title="Available Plugins", show_header=True, header_style="bold cyan")
     table.add_column("Plugin", style="green")
@@ -105,8 +118,8 @@ def show_plugin(
     # Show README if exists
     readme = plugin_path / "README.md"
     if readme.is_file():
-        with open(readme) as f:
-            first_lines = "".join(f.readlines()[:10])
+        # 4 KiB covers ten lines of any ordinary README without reading it all
+        first_lines = "\n".join(read_head(readme, 4096).splitlines()[:10])
         console.print(Panel(first_lines.strip(), title="README (first 10 lines)", border_style="dim"))
 
     # Show contents
@@ -2,29 +2,18 @@ from __future__ import annotations
 
 import typer
 from pathlib import Path
-from rich.console import Console
-from rich.panel import Panel
 from typing import Optional
 
-from crowe_logic_cli.config import load_config
-from crowe_logic_cli.providers.base import coerce_messages
-from crowe_logic_cli.providers.factory import create_provider
+from crowe_logic_cli.cli.common import run_prompt
+from crowe_logic_cli.files import read_head
+from crowe_logic_cli.output import get_console
 
 
 app = typer.Typer(add_completion=False, help="Quantum-enhanced reasoning and analysis")
-console = Console()
+console = get_console()
 
 
-@app.command()
-def reason(
-    problem: str = typer.Argument(..., help="Problem to solve using quantum-inspired reasoning"),
-    domain: str = typer.Option(
-        "molecular", "--domain", "-d",
-        help="Domain context: molecular, physics, optimization, general"
-    ),
-) -> None:
-    """Apply Crowe Logic 4-stage quantum-inspired reasoning."""
-    prompt = f"""Using Crowe Logic 4-stage quantum-inspired reasoning, solve this problem:
+_REASON_PROMPT = """Using Crowe Logic 4-stage quantum-inspired reasoning, solve this problem:
 
 Problem: {problem}
 Domain: {domain}
@@ -57,23 +46,22 @@ Format your response as:
 </answer>
 """
 
-    config = load_config()
-    provider = create_provider(config)
-    messages = coerce_messages(prompt)
 
-    console.print(Panel(f"[bold cyan]Quantum Reasoning: {domain}[/bold cyan]"))
+@app.command()
+def reason(
+    problem: str = typer.Argument(..., help="Problem to solve using quantum-inspired reasoning"),
+    domain: str = typer.Option(
+        "molecular", "--domain", "-d",
+        help="Domain context: molecular, physics, optimization, general"
+    ),
+) -> None:
+    """Apply Crowe Logic 4-stage quantum-inspired reasoning."""
+    prompt = _REASON_PROMPT.format(problem=problem, domain=domain)
 
-    for chunk in provider.stream(messages):
-        console.print(chunk, end="")
-    console.print()
+    run_prompt(f"Quantum Reasoning: {domain}", prompt)
 
 
-@app.command()
-def vqe(
-    hamiltonian: str = typer.Argument(..., help="Hamiltonian description or molecule"),
-) -> None:
-    """Discuss Variational Quantum Eigensolver for a system."""
-    prompt = f"""Explain how to apply VQE (Variational Quantum Eigensolver) to: {hamiltonian}
+_VQE_PROMPT = """Explain how to apply VQE (Variational Quantum Eigensolver) to: {hamiltonian}
 
 Include:
 1. Hamiltonian encoding
@@ -83,23 +71,18 @@ Include:
 5. Practical implementation considerations
 """
 
-    config = load_config()
-    provider = create_provider(config)
-    messages = coerce_messages(prompt)
 
-    console.print(Panel(f"[bold cyan]VQE Analysis: {hamiltonian}[/bold cyan]"))
+@app.command()
+def vqe(
+    hamiltonian: str = typer.Argument(..., help="Hamiltonian description or molecule"),
+) -> None:
+    """Discuss Variational Quantum Eigensolver for a system."""
+    prompt = _VQE_PROMPT.format(hamiltonian=hamiltonian)
 
-    for chunk in provider.stream(messages):
-        console.print(chunk, end="")
-    console.print()
+    run_prompt(f"VQE Analysis: {hamiltonian}", prompt)
 
 
-@app.command()
-def qaoa(
-    problem: str = typer.Argument(..., help="Optimization problem description"),
-) -> None:
-    """Discuss QAOA for a combinatorial optimization problem."""
-    prompt = f"""Explain how to apply QAOA (Quantum Approximate Optimization Algorithm) to: {problem}
+_QAOA_PROMPT = """Explain how to apply QAOA (Quantum Approximate Optimization Algorithm) to: {problem}
 
 Include:
 1. Problem encoding as QUBO/Ising model
@@ -109,29 +92,18 @@ Include:
 5. Expected solution quality
 """
 
-    config = load_config()
-    provider = create_provider(config)
-    messages = coerce_messages(prompt)
-
-    console.print(Panel(f"[bold cyan]QAOA Analysis: {problem}[/bold cyan]"))
-
-    for chunk in provider.stream(messages):
-        console.print(chunk, end="")
-    console.print()
-
 
 @app.command()
-def analyze_circuit(
-    file: Path = typer.Argument(..., help="Quantum circuit file (QASM, Qiskit, etc.)"),
+def qaoa(
+    problem: str = typer.Argument(..., help="Optimization problem description"),
 ) -> None:
-    """Analyze a quantum circuit."""
-    if not file.exists():
-        console.print(f"[red]Error: File not found: {file}[/red]")
-        raise typer.Exit(1)
+    """Discuss QAOA for a combinatorial optimization problem."""
+    prompt = _QAOA_PROMPT.format(problem=problem)
+
+    run_prompt(f"QAOA Analysis: {problem}", prompt)
 
-    content = file.read_text()
 
-    prompt = f"""Analyze this quantum circuit.
+_ANALYZE_CIRCUIT_PROMPT = """Analyze this quantum circuit.
 
 Provide:
 1. Circuit description and purpose
@@ -142,18 +114,37 @@ Provide:
 6. Expected behavior/output
 
 Circuit content:
-{content[:5000]}
+{content}
 """
 
-    config = load_config()
-    provider = create_provider(config)
-    messages = coerce_messages(prompt)
 
-    console.print(Panel(f"[bold cyan]Quantum Circuit Analysis: {file.name}[/bold cyan]"))
+@app.command()
+def analyze_circuit(
+    file: Path = typer.Argument(..., help="Quantum circuit file (QASM, Qiskit, etc.)"),
+) -> None:
+    """Analyze a quantum circuit."""
+    if not file.exists():
+        console.print(f"[red]Error: File not found: {file}[/red]")
+        raise typer.Exit(1)
+
+    content = read_head(file, 5000)
+
+    prompt = _ANALYZE_CIRCUIT_PROMPT.format(content=content)
 
-    for chunk in provider.stream(messages):
-        console.print(chunk, end="")
-    console.print()
+    run_prompt(f"Quantum Circuit Analysis: {file.name}", prompt)
+
+
+_EXPLAIN_PROMPT = """Explain the quantum concept: {concept}
+
+{level_instruction}
+
+Include:
+1. Core definition
+2. Key principles involved
+3. Mathematical representation (appropriate to level)
+4. Practical applications
+5. Common misconceptions
+"""
 
 
 @app.command()
@@ -163,6 +154,9 @@ def explain(
         "intermediate", "--level", "-l",
         help="Explanation level: beginner, intermediate, advanced"
     ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Ask the model again instead of reusing a saved answer"
+    ),
 ) -> None:
     """Explain a quantum computing or quantum mechanics concept."""
     level_instruction = {
@@ -171,27 +165,23 @@ def explain(
         "advanced": "Use full mathematical formalism and assume graduate-level physics background.",
     }.get(level, "Include some mathematical notation and assume basic physics knowledge.")
 
-    prompt = f"""Explain the quantum concept: {concept}
+    prompt = _EXPLAIN_PROMPT.format(concept=concept, level_instruction=level_instruction)
 
-{level_instruction}
+    run_prompt(f"Quantum Concept: {concept}", prompt, use_cache=not no_cache)
 
-Include:
-1. Core definition
-2. Key principles involved
-3. Mathematical representation (appropriate to level)
-4. Practical applications
-5. Common misconceptions
-"""
 
-    config = load_config()
-    provider = create_provider(config)
-    messages = coerce_messages(prompt)
+_CHEMISTRY_PROMPT = """Discuss quantum chemistry calculations for: {molecule}
 
-    console.print(Panel(f"[bold cyan]Quantum Concept: {concept}[/bold cyan]"))
+Using method: {method}
 
-    for chunk in provider.stream(messages):
-        console.print(chunk, end="")
-    console.print()
+Cover:
+1. Appropriate basis set recommendations
+2. Expected computational cost
+3. Properties that can be calculated
+4. Accuracy expectations
+5. Practical considerations for running the calculation
+6. Recommended software packages
+"""
 
 
 @app.command()
@@ -203,36 +193,12 @@ def chemistry(
     ),
 ) -> None:
     """Discuss quantum chemistry calculations for a molecule."""
-    prompt = f"""Discuss quantum chemistry calculations for: {molecule}
-
-Using method: {method.upper()}
-
-Cover:
-1. Appropriate basis set recommendations
-2. Expected computational cost
-3. Properties that can be calculated
-4. Accuracy expectations
-5. Practical considerations for running the calculation
-6. Recommended software packages
-"""
-
-    config = load_config()
-    provider = create_provider(config)
-    messages = coerce_messages(prompt)
+    prompt = _CHEMISTRY_PROMPT.format(molecule=molecule, method=method.upper())
 
-    console.print(Panel(f"[bold cyan]Quantum Chemistry: {molecule}[/bold cyan]"))
+    run_prompt(f"Quantum Chemistry: {molecule}", prompt)
 
-    for chunk in provider.stream(messages):
-        console.print(chunk, end="")
-    console.print()
 
-
-@app.command()
-def algorithm(
-    name: str = typer.Argument(..., help="Quantum algorithm name (e.g., grover, shor, vqe)"),
-) -> None:
-    """Explain a quantum algorithm."""
-    prompt = f"""Explain the quantum algorithm: {name}
+_ALGORITHM_PROMPT = """Explain the quantum algorithm: {name}
 
 Include:
 1. Purpose and problem it solves
@@ -244,26 +210,21 @@ Include:
 7. Real-world applications
 """
 
-    config = load_config()
-    provider = create_provider(config)
-    messages = coerce_messages(prompt)
-
-    console.print(Panel(f"[bold cyan]Quantum Algorithm: {name}[/bold cyan]"))
-
-    for chunk in provider.stream(messages):
-        console.print(chunk, end="")
-    console.print()
-
 
 @app.command()
-def error_correction(
-    code: str = typer.Option(
-        "surface", "--code", "-c",
-        help="Error correction code: surface, steane, shor, repetition"
+def algorithm(
+    name: str = typer.Argument(..., help="Quantum algorithm name (e.g., grover, shor, vqe)"),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Ask the model again instead of reusing a saved answer"
     ),
 ) -> None:
-    """Explain quantum error correction codes."""
-    prompt = f"""Explain the {code} quantum error correction code.
+    """Explain a quantum algorithm."""
+    prompt = _ALGORITHM_PROMPT.format(name=name)
+
+    run_prompt(f"Quantum Algorithm: {name}", prompt, use_cache=not no_cache)
+
+
+_ERROR_CORRECTION_PROMPT = """Explain the {code} quantum error correction code.
 
 Include:
 1. Basic principles
@@ -274,12 +235,18 @@ Include:
 6. Current experimental status
 """
 
-    config = load_config()
-    provider = create_provider(config)
-    messages = coerce_messages(prompt)
 
-    console.print(Panel(f"[bold cyan]Quantum Error Correction: {code.title()} Code[/bold cyan]"))
+@app.command()
+def error_correction(
+    code: str = typer.Option(
+        "surface", "--code", "-c",
+        help="Error correction code: surface, steane, shor, repetition"
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Ask the model again instead of reusing a saved answer"
+    ),
+) -> None:
+    """Explain quantum error correction codes."""
+    prompt = _ERROR_CORRECTION_PROMPT.format(code=code)
 
-    for chunk in provider.stream(messages):
-        console.print(chunk, end="")
-    console.print()
+    run_prompt(f"Quantum Error Correction: {code.title()} Code", prompt, use_cache=not no_cache)
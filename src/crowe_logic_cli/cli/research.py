@@ -2,17 +2,30 @@ from __future__ import annotations
 
 import typer
 from pathlib import Path
-from rich.console import Console
-from rich.panel import Panel
 from typing import Optional
 
-from crowe_logic_cli.config import load_config
-from crowe_logic_cli.providers.base import coerce_messages
-from crowe_logic_cli.providers.factory import create_provider
+from crowe_logic_cli.cli.common import run_prompt
+from crowe_logic_cli.files import read_head
+from crowe_logic_cli.output import get_console
 
 
 app = typer.Typer(add_completion=False, help="Research paper analysis and review")
-console = Console()
+console = get_console()
+
+
+_REVIEW_PROMPT = """Review this research paper for scientific rigor, methodology, and completeness.
+{focus_instruction}
+
+Paper content:
+{content}
+
+Provide:
+1. Summary of the research
+2. Methodology assessment
+3. Results validity
+4. Strengths and weaknesses
+5. Recommendations for improvement
+"""
 
 
 @app.command()
@@ -27,32 +40,20 @@ def review(
         console.print(f"[red]Error: File not found: {file}[/red]")
         raise typer.Exit(1)
 
-    content = file.read_text()
+    content = read_head(file, 8000)
 
     focus_instruction = f"\nFocus particularly on: {focus}" if focus else ""
-    prompt = f"""Review this research paper for scientific rigor, methodology, and completeness.
-{focus_instruction}
-
-Paper content:
-{content[:8000]}
+    prompt = _REVIEW_PROMPT.format(focus_instruction=focus_instruction, content=content)
 
-Provide:
-1. Summary of the research
-2. Methodology assessment
-3. Results validity
-4. Strengths and weaknesses
-5. Recommendations for improvement
-"""
+    run_prompt(f"Research Review: {file.name}", prompt)
 
-    config = load_config()
-    provider = create_provider(config)
-    messages = coerce_messages(prompt)
 
-    console.print(Panel(f"[bold cyan]Research Review: {file.name}[/bold cyan]"))
+_SUMMARIZE_PROMPT = """Summarize this research paper.
+{length_instruction}
 
-    for chunk in provider.stream(messages):
-        console.print(chunk, end="")
-    console.print()
+Paper content:
+{content}
+"""
 
 
 @app.command()
@@ -67,7 +68,7 @@ def summarize(
         console.print(f"[red]Error: File not found: {file}[/red]")
         raise typer.Exit(1)
 
-    content = file.read_text()
+    content = read_head(file, 8000)
 
     length_instruction = {
         "brief": "Provide a 2-3 sentence summary.",
@@ -75,22 +76,22 @@ def summarize(
         "detailed": "Provide a comprehensive summary covering all major sections.",
     }.get(length, "Provide a 1-2 paragraph summary.")
 
-    prompt = f"""Summarize this research paper.
-{length_instruction}
+    prompt = _SUMMARIZE_PROMPT.format(length_instruction=length_instruction, content=content)
 
-Paper content:
-{content[:8000]}
-"""
+    run_prompt(f"Summary: {file.name}", prompt)
 
-    config = load_config()
-    provider = create_provider(config)
-    messages = coerce_messages(prompt)
 
-    console.print(Panel(f"[bold cyan]Summary: {file.name}[/bold cyan]"))
+_EXTRACT_CITATIONS_PROMPT = """Extract all citations and references from this research paper.
+List them in a structured format with:
+- Authors
+- Title
+- Publication/Journal
+- Year
+- DOI if available
 
-    for chunk in provider.stream(messages):
-        console.print(chunk, end="")
-    console.print()
+Paper content:
+{content}
+"""
 
 
 @app.command()
@@ -102,26 +103,8 @@ def extract_citations(
         console.print(f"[red]Error: File not found: {file}[/red]")
         raise typer.Exit(1)
 
-    content = file.read_text()
-
-    prompt = f"""Extract all citations and references from this research paper.
-List them in a structured format with:
-- Authors
-- Title
-- Publication/Journal
-- Year
-- DOI if available
-
-Paper content:
-{content[:10000]}
-"""
-
-    config = load_config()
-    provider = create_provider(config)
-    messages = coerce_messages(prompt)
+    content = read_head(file, 10000)
 
-    console.print(Panel("[bold cyan]Extracted Citations[/bold cyan]"))
+    prompt = _EXTRACT_CITATIONS_PROMPT.format(content=content)
 
-    for chunk in provider.stream(messages):
-        console.print(chunk, end="")
-    console.print()
+    run_prompt("Extracted Citations", prompt)
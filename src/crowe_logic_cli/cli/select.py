@@ -1,21 +1,31 @@
 from __future__ import annotations
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
 from typing import Optional
 
-from crowe_logic_cli.config import load_config
-from crowe_logic_cli.providers.base import coerce_messages
-from crowe_logic_cli.providers.factory import create_provider
+from crowe_logic_cli.cli.common import run_prompt
+from crowe_logic_cli.files import truncate_to_tokens
+from crowe_logic_cli.output import get_console
 
+try:
+    import pyperclip
+except ImportError:  # optional, see the "clipboard" extra
+    pyperclip = None  # type: ignore[assignment]
 
 app = typer.Typer(add_completion=False, help="Interactive selection and clipboard operations")
-console = Console()
+console = get_console()
+
+# Clipboard content sent to the model; about the 6000 characters sent before
+CLIPBOARD_TOKENS = 1500
 
 
 def get_clipboard_content() -> str:
     """Get content from system clipboard."""
+    if pyperclip is not None:
+        try:
+            return pyperclip.paste()
+        except pyperclip.PyperclipException:
+            pass  # no usable backend; try the platform tools below
     try:
         import subprocess
         import sys
@@ -28,7 +38,7 @@ def get_clipboard_content() -> str:
                                    capture_output=True, text=True)
             return result.stdout
         elif sys.platform == "win32":
-            result = subprocess.run(["powershell", "-command", "Get-Clipboard"],
+            result = subprocess.run(["powershell", "-NoProfile", "-Command", "Get-Clipboard"],
                                    capture_output=True, text=True)
             return result.stdout
         else:
@@ -39,6 +49,12 @@ def get_clipboard_content() -> str:
 
 def set_clipboard_content(content: str) -> bool:
     """Set content to system clipboard."""
+    if pyperclip is not None:
+        try:
+            pyperclip.copy(content)
+            return True
+        except pyperclip.PyperclipException:
+            pass
     try:
         import subprocess
         import sys
@@ -51,8 +67,12 @@ def set_clipboard_content(content: str) -> bool:
                           input=content, text=True, check=True)
             return True
         elif sys.platform == "win32":
-            subprocess.run(["powershell", "-command", f"Set-Clipboard -Value '{content}'"],
-                          check=True)
+            # Content goes in on stdin, never into the PowerShell command line
+            subprocess.run(
+                ["powershell", "-NoProfile", "-Command",
+                 "Set-Clipboard -Value ([Console]::In.ReadToEnd())"],
+                input=content, text=True, check=True,
+            )
             return True
         else:
             return False
@@ -83,18 +103,10 @@ def clipboard(
 
     prompt = f"""{action_prompts.get(action, action_prompts["explain"])}
 
-{content[:6000]}
+{truncate_to_tokens(content, CLIPBOARD_TOKENS)}
 """
 
-    config = load_config()
-    provider = create_provider(config)
-    messages = coerce_messages(prompt)
-
-    console.print(Panel(f"[bold cyan]Clipboard Analysis ({action})[/bold cyan]"))
-
-    for chunk in provider.stream(messages):
-        console.print(chunk, end="")
-    console.print()
+    run_prompt(f"Clipboard Analysis ({action})", prompt)
 
 
 @app.command()
@@ -116,22 +128,12 @@ def transform(
 "{instruction}"
 
 Content to transform:
-{content[:6000]}
+{truncate_to_tokens(content, CLIPBOARD_TOKENS)}
 
 Provide only the transformed result, no explanation.
 """
 
-    config = load_config()
-    provider = create_provider(config)
-    messages = coerce_messages(prompt)
-
-    console.print(Panel("[bold cyan]Transformation Result[/bold cyan]"))
-
-    result = ""
-    for chunk in provider.stream(messages):
-        console.print(chunk, end="")
-        result += chunk
-    console.print()
+    result = run_prompt("Transformation Result", prompt)
 
     if copy_result and result:
         if set_clipboard_content(result):
@@ -162,15 +164,7 @@ def diff(
 What changed, why might it matter, and are there any potential issues?
 
 Diff:
-{content[:6000]}
+{truncate_to_tokens(content, CLIPBOARD_TOKENS)}
 """
 
-    config = load_config()
-    provider = create_provider(config)
-    messages = coerce_messages(prompt)
-
-    console.print(Panel("[bold cyan]Diff Explanation[/bold cyan]"))
-
-    for chunk in provider.stream(messages):
-        console.print(chunk, end="")
-    console.print()
+    run_prompt("Diff Explanation", prompt)
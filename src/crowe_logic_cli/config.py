@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import functools
+import os
 from dataclasses import dataclass
-from typing import Literal, Optional
+from typing import Any, Literal, Optional, Tuple
 
+from crowe_logic_cli import config_file
 from crowe_logic_cli.config_file import get_config_value
 
 
@@ -40,101 +43,80 @@ class AppConfig:
     openai_compatible: Optional[OpenAICompatibleConfig] = None
 
 
+def _config_cache_key() -> Tuple[Any, ...]:
+    """Everything load_config() reads: the config file's identity and CROWE_* env vars."""
+    path = config_file._find_config_file()
+    file_key: Optional[Tuple[str, int, int]] = None
+    if path is not None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            pass
+        else:
+            file_key = (str(path), st.st_mtime_ns, st.st_size)
+    env_key = tuple(sorted(
+        (name, value) for name, value in os.environ.items() if name.startswith("CROWE_")
+    ))
+    return file_key, env_key
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(key: Tuple[Any, ...]) -> AppConfig:
+    return _load_config()
+
+
 def load_config() -> AppConfig:
     """
     Load config with precedence: env vars > .crowelogic.toml > defaults.
+
+    Results are cached until the config file or a CROWE_* env var changes;
+    call load_config.cache_clear() to force a reload.
     """
+    return _load_config_cached(_config_cache_key())
+
+
+load_config.cache_clear = _load_config_cached.cache_clear  # type: ignore[attr-defined]
+
+
+# Per provider: its settings class, the name used in errors, and its fields as
+# (field, env var, default). Fields without a default are required.
+_PROVIDER_SPECS: dict[str, tuple[type, str, tuple[tuple[str, str, Optional[str]], ...]]] = {
+    "azure": (AzureConfig, "Azure provider", (
+        ("endpoint", "CROWE_AZURE_ENDPOINT", None),
+        ("deployment", "CROWE_AZURE_DEPLOYMENT", None),
+        ("api_key", "CROWE_AZURE_API_KEY", None),
+        ("api_version", "CROWE_AZURE_API_VERSION", "2024-02-15-preview"),
+    )),
+    "azure_ai_inference": (AzureAIInferenceConfig, "Azure AI inference provider", (
+        ("endpoint", "CROWE_AZURE_AI_ENDPOINT", None),
+        ("model", "CROWE_AZURE_AI_MODEL", None),
+        ("api_key", "CROWE_AZURE_AI_API_KEY", None),
+        ("api_version", "CROWE_AZURE_AI_API_VERSION", "2024-05-01-preview"),
+    )),
+    "openai_compatible": (OpenAICompatibleConfig, "openai_compatible provider", (
+        ("base_url", "CROWE_OPENAI_BASE_URL", None),
+        ("api_key", "CROWE_OPENAI_API_KEY", None),
+        ("model", "CROWE_OPENAI_MODEL", None),
+    )),
+}
+
+
+def _load_config() -> AppConfig:
     provider = (get_config_value("provider", "CROWE_PROVIDER") or "azure").lower()
-    if provider not in ("azure", "azure_ai_inference", "openai_compatible"):
+    if provider not in _PROVIDER_SPECS:
         raise ValueError(
             "Unsupported provider. Use 'azure', 'azure_ai_inference', or 'openai_compatible'."
         )
 
-    if provider == "azure":
-        endpoint = get_config_value("azure.endpoint", "CROWE_AZURE_ENDPOINT")
-        deployment = get_config_value("azure.deployment", "CROWE_AZURE_DEPLOYMENT")
+    settings_cls, label, fields = _PROVIDER_SPECS[provider]
+    values: dict[str, Optional[str]] = {}
+    missing = []
+    for name, env_var, default in fields:
         # api_key supports keyvault:// URLs via resolve_secret in get_config_value
-        api_key = get_config_value("azure.api_key", "CROWE_AZURE_API_KEY")
-        api_version = get_config_value("azure.api_version", "CROWE_AZURE_API_VERSION", "2024-02-15-preview")
-
-        missing = [
-            name
-            for name, value in (
-                ("azure.endpoint / CROWE_AZURE_ENDPOINT", endpoint),
-                ("azure.deployment / CROWE_AZURE_DEPLOYMENT", deployment),
-                ("azure.api_key / CROWE_AZURE_API_KEY", api_key),
-            )
-            if not value
-        ]
-        if missing:
-            raise ValueError(
-                "Missing required config for Azure provider: " + ", ".join(missing)
-            )
-
-        return AppConfig(
-            provider="azure",
-            azure=AzureConfig(
-                endpoint=endpoint,  # type: ignore
-                api_key=api_key,  # type: ignore
-                deployment=deployment,  # type: ignore
-                api_version=api_version,  # type: ignore
-            ),
-        )
-
-    if provider == "azure_ai_inference":
-        endpoint = get_config_value("azure_ai_inference.endpoint", "CROWE_AZURE_AI_ENDPOINT")
-        model = get_config_value("azure_ai_inference.model", "CROWE_AZURE_AI_MODEL")
-        api_key = get_config_value("azure_ai_inference.api_key", "CROWE_AZURE_AI_API_KEY")
-        api_version = get_config_value("azure_ai_inference.api_version", "CROWE_AZURE_AI_API_VERSION", "2024-05-01-preview")
-
-        missing = [
-            name
-            for name, value in (
-                ("azure_ai_inference.endpoint / CROWE_AZURE_AI_ENDPOINT", endpoint),
-                ("azure_ai_inference.model / CROWE_AZURE_AI_MODEL", model),
-                ("azure_ai_inference.api_key / CROWE_AZURE_AI_API_KEY", api_key),
-            )
-            if not value
-        ]
-        if missing:
-            raise ValueError(
-                "Missing required config for Azure AI inference provider: " + ", ".join(missing)
-            )
-
-        return AppConfig(
-            provider="azure_ai_inference",
-            azure_ai_inference=AzureAIInferenceConfig(
-                endpoint=endpoint,  # type: ignore
-                api_key=api_key,  # type: ignore
-                model=model,  # type: ignore
-                api_version=api_version,  # type: ignore
-            ),
-        )
-
-    base_url = get_config_value("openai_compatible.base_url", "CROWE_OPENAI_BASE_URL")
-    api_key = get_config_value("openai_compatible.api_key", "CROWE_OPENAI_API_KEY")
-    model = get_config_value("openai_compatible.model", "CROWE_OPENAI_MODEL")
-
-    missing = [
-        name
-        for name, value in (
-            ("openai_compatible.base_url / CROWE_OPENAI_BASE_URL", base_url),
-            ("openai_compatible.api_key / CROWE_OPENAI_API_KEY", api_key),
-            ("openai_compatible.model / CROWE_OPENAI_MODEL", model),
-        )
-        if not value
-    ]
+        values[name] = get_config_value(f"{provider}.{name}", env_var, default)
+        if not values[name]:
+            missing.append(f"{provider}.{name} / {env_var}")
     if missing:
-        raise ValueError(
-            "Missing required config for openai_compatible provider: "
-            + ", ".join(missing)
-        )
+        raise ValueError(f"Missing required config for {label}: " + ", ".join(missing))
 
-    return AppConfig(
-        provider="openai_compatible",
-        openai_compatible=OpenAICompatibleConfig(
-            base_url=base_url,  # type: ignore
-            api_key=api_key,  # type: ignore
-            model=model,  # type: ignore
-        ),
-    )
+    return AppConfig(provider=provider, **{provider: settings_cls(**values)})  # type: ignore[arg-type]
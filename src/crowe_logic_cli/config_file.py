@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import os
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -15,6 +16,12 @@ from crowe_logic_cli.keyvault import resolve_secret
 CONFIG_FILENAME = ".crowelogic.toml"
 
 
+@functools.lru_cache(maxsize=None)
+def home_config_path() -> Path:
+    """Path of the per-user config file (~/.crowelogic.toml)."""
+    return Path.home() / CONFIG_FILENAME
+
+
 def _find_config_file() -> Optional[Path]:
     """Search for config file in cwd and parent directories, then home."""
     cwd = Path.cwd()
@@ -23,23 +30,57 @@ def _find_config_file() -> Optional[Path]:
         if candidate.is_file():
             return candidate
 
-    home_config = Path.home() / CONFIG_FILENAME
+    home_config = home_config_path()
     if home_config.is_file():
         return home_config
 
     return None
 
 
-def load_config_file() -> Dict[str, Any]:
-    """Load config from .crowelogic.toml if it exists."""
-    path = _find_config_file()
-    if path is None:
-        return {}
+def write_config_file(path: Path, text: str, overwrite: bool = False) -> None:
+    """Write a config file readable only by the current user (mode 0600).
 
+    Without ``overwrite`` the file is created exclusively and FileExistsError
+    is raised if it already exists, so callers can ask before replacing it
+    without a separate exists() check. With ``overwrite`` the new contents
+    go to a temp file that atomically replaces the old one.
+    """
+    if not overwrite:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        return
+
+    tmp = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_config_file(path: Path, mtime_ns: int, size: int) -> Dict[str, Any]:
+    # mtime_ns and size are part of the cache key so an edited file is reparsed
     with open(path, "rb") as f:
         return tomllib.load(f)
 
 
+def load_config_file(path: Optional[Path] = None) -> Dict[str, Any]:
+    """Load config from .crowelogic.toml if it exists.
+
+    Values are returned as written; Key Vault references are not resolved.
+    The parsed file is cached until its mtime or size changes, so the
+    returned dict is shared and must not be modified.
+    """
+    if path is None:
+        path = _find_config_file()
+    if path is None:
+        return {}
+
+    st = os.stat(path)
+    return _parse_config_file(Path(path), st.st_mtime_ns, st.st_size)
+
+
 def get_config_value(key: str, env_var: str, default: Optional[str] = None) -> Optional[str]:
     """
     Get a config value with precedence: env var > config file > default.
@@ -1,8 +1,11 @@
 """Token usage and cost tracking."""
 from __future__ import annotations
 
+import functools
 import json
 import os
+import time
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -11,6 +14,9 @@ from typing import Any, Optional
 from rich.console import Console
 from rich.table import Table
 
+from crowe_logic_cli.jsonutil import dump_line, loads
+from crowe_logic_cli.output import get_console
+
 
 # Pricing per 1M tokens (as of 2024 - update as needed)
 MODEL_PRICING: dict[str, dict[str, float]] = {
@@ -31,6 +37,11 @@ MODEL_PRICING: dict[str, dict[str, float]] = {
     "default": {"input": 3.00, "output": 15.00},
 }
 
+# Longest first, so "gpt-4o-mini" wins over "gpt-4o" and "gpt-4"
+_PRICING_KEYS_BY_LENGTH: tuple[str, ...] = tuple(
+    sorted((k for k in MODEL_PRICING if k != "default"), key=len, reverse=True)
+)
+
 
 @dataclass
 class UsageRecord:
@@ -42,6 +53,15 @@ class UsageRecord:
     output_tokens: int
     cost_usd: float
     command: Optional[str] = None
+    # Parsed once from timestamp; None when it is not valid ISO-8601
+    timestamp_epoch: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        try:
+            parsed = datetime.fromisoformat(self.timestamp.replace("Z", "+00:00"))
+        except ValueError:
+            return
+        self.timestamp_epoch = parsed.timestamp()
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -80,9 +100,13 @@ class UsageSummary:
     by_day: dict[str, dict[str, Any]] = field(default_factory=dict)
 
 
+@functools.lru_cache(maxsize=256)
 def get_model_pricing(model: str) -> dict[str, float]:
     """Get pricing for a model.
 
+    Partial matches prefer the most specific (longest) known name. Results
+    are memoized per model string; treat the returned dict as read-only.
+
     Args:
         model: Model name/identifier
 
@@ -96,9 +120,9 @@ def get_model_pricing(model: str) -> dict[str, float]:
         return MODEL_PRICING[model_lower]
 
     # Check for partial matches
-    for key, pricing in MODEL_PRICING.items():
+    for key in _PRICING_KEYS_BY_LENGTH:
         if key in model_lower:
-            return pricing
+            return MODEL_PRICING[key]
 
     return MODEL_PRICING["default"]
 
@@ -124,6 +148,23 @@ def calculate_cost(
     return input_cost + output_cost
 
 
+USAGE_FILENAME = "usage.jsonl"
+# Single-document store ({"records": [...]}) written by earlier versions
+LEGACY_USAGE_FILENAME = "usage.json"
+
+# An empty legacy store ({"records": []}) is well under this; any record is over it
+_EMPTY_STORE_MAX_BYTES = 64
+
+
+def _zero_stats() -> dict[str, Any]:
+    return {"input_tokens": 0, "output_tokens": 0, "cost_usd": 0.0, "count": 0}
+
+
+def default_data_dir() -> Path:
+    """Directory where usage records are stored by default."""
+    return Path.home() / ".crowelogic" / "usage"
+
+
 class CostTracker:
     """Track and persist usage costs."""
 
@@ -134,28 +175,86 @@ class CostTracker:
             data_dir: Directory for storing usage data
         """
         if data_dir is None:
-            data_dir = Path.home() / ".crowelogic" / "usage"
+            data_dir = default_data_dir()
         self.data_dir = data_dir
         self.data_dir.mkdir(parents=True, exist_ok=True)
-        self._usage_file = self.data_dir / "usage.json"
-        self._records: list[UsageRecord] = []
-        self._load()
-
-    def _load(self) -> None:
-        """Load usage records from disk."""
-        if self._usage_file.exists():
+        self._usage_file = self.data_dir / USAGE_FILENAME
+        # Read lazily, and again only when the log's (mtime, size) changes
+        self._records: Optional[list[UsageRecord]] = None
+        self._loaded_stat: Optional[tuple[int, int]] = None
+
+    def _stat(self) -> Optional[tuple[int, int]]:
+        try:
+            st = self._usage_file.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _get_records(self) -> list[UsageRecord]:
+        """Usage records, loading the log on first use or after it changed."""
+        current = self._stat()
+        if self._records is None or current != self._loaded_stat:
+            self._records = self._load()
+            self._loaded_stat = self._stat()
+        return self._records
+
+    def _load(self) -> list[UsageRecord]:
+        """Read usage records from disk, migrating a legacy usage.json once."""
+        try:
+            with open(self._usage_file, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return self._migrate_legacy()
+
+        lines = [line for line in data.splitlines() if line.strip()]
+        try:
+            # Parse every line in one call, as a single JSON array
+            return [UsageRecord.from_dict(r) for r in loads(b"[" + b",".join(lines) + b"]")]
+        except (ValueError, KeyError, TypeError):
+            pass
+
+        records = []
+        for line in lines:
             try:
-                with open(self._usage_file, "r") as f:
-                    data = json.load(f)
-                    self._records = [UsageRecord.from_dict(r) for r in data.get("records", [])]
-            except (json.JSONDecodeError, KeyError):
-                self._records = []
-
-    def _save(self) -> None:
-        """Save usage records to disk."""
-        data = {"records": [r.to_dict() for r in self._records]}
-        with open(self._usage_file, "w") as f:
-            json.dump(data, f, indent=2)
+                records.append(UsageRecord.from_dict(loads(line)))
+            except (ValueError, KeyError, TypeError):
+                # A torn append from a crash, or a malformed record
+                continue
+        return records
+
+    def _migrate_legacy(self) -> list[UsageRecord]:
+        """Convert usage.json to the JSONL log, then remove it."""
+        legacy_file = self.data_dir / LEGACY_USAGE_FILENAME
+        try:
+            with open(legacy_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            records = [UsageRecord.from_dict(r) for r in data.get("records", [])]
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            # Missing or unreadable: leave it in place and start a fresh log
+            return []
+        self._save(records)
+        legacy_file.unlink(missing_ok=True)
+        return records
+
+    def _save(self, records: list[UsageRecord]) -> None:
+        """Rewrite the whole usage log atomically."""
+        tmp = self._usage_file.with_name(self._usage_file.name + ".tmp")
+        with open(tmp, "wb") as f:
+            f.writelines(dump_line(r.to_dict()) for r in records)
+        os.replace(tmp, self._usage_file)
+
+    def _append(self, record: UsageRecord) -> None:
+        """Append one record to the usage log."""
+        # Encode first, so a record that cannot be serialized leaves no file behind
+        line = dump_line(record.to_dict())
+        with open(self._usage_file, "a+b") as f:
+            end = f.seek(0, os.SEEK_END)
+            if end:
+                # Don't extend a torn last line that _load skipped
+                f.seek(end - 1)
+                if f.read(1) != b"\n":
+                    line = b"\n" + line
+            f.write(line)
 
     def record(
         self,
@@ -187,8 +286,16 @@ class CostTracker:
             cost_usd=cost,
             command=command,
         )
-        self._records.append(record)
-        self._save()
+        if self._records is None and self._stat() is None:
+            # Migrate a legacy usage.json before the new log exists
+            self._get_records()
+
+        # Appending needs no read; keep loaded records in step if they are current
+        in_step = self._records is not None and self._stat() == self._loaded_stat
+        self._append(record)
+        if in_step and self._records is not None:
+            self._records.append(record)
+            self._loaded_stat = self._stat()
         return record
 
     def get_summary(
@@ -206,64 +313,48 @@ class CostTracker:
             Usage summary
         """
         summary = UsageSummary()
-        now = datetime.now(timezone.utc)
-
-        for record in self._records:
-            # Parse timestamp
-            try:
-                record_time = datetime.fromisoformat(record.timestamp.replace("Z", "+00:00"))
-            except ValueError:
+        by_model: defaultdict[str, dict[str, Any]] = defaultdict(_zero_stats)
+        by_day: defaultdict[str, dict[str, Any]] = defaultdict(_zero_stats)
+        # Same window as before: records less than days + 1 whole days old
+        cutoff = None if days is None else time.time() - (days + 1) * 86400
+        model_filter = None if model is None else model.lower()
+
+        for record in self._get_records():
+            epoch = record.timestamp_epoch
+            if epoch is None:
                 continue
-
-            # Filter by days
-            if days is not None:
-                delta = now - record_time
-                if delta.days > days:
-                    continue
-
-            # Filter by model
-            if model is not None and model.lower() not in record.model.lower():
+            if cutoff is not None and epoch <= cutoff:
+                continue
+            if model_filter is not None and model_filter not in record.model.lower():
                 continue
 
-            # Aggregate totals
             summary.total_input_tokens += record.input_tokens
             summary.total_output_tokens += record.output_tokens
             summary.total_cost_usd += record.cost_usd
             summary.request_count += 1
 
-            # Aggregate by model
-            if record.model not in summary.by_model:
-                summary.by_model[record.model] = {
-                    "input_tokens": 0,
-                    "output_tokens": 0,
-                    "cost_usd": 0.0,
-                    "count": 0,
-                }
-            summary.by_model[record.model]["input_tokens"] += record.input_tokens
-            summary.by_model[record.model]["output_tokens"] += record.output_tokens
-            summary.by_model[record.model]["cost_usd"] += record.cost_usd
-            summary.by_model[record.model]["count"] += 1
-
-            # Aggregate by day
-            day_key = record_time.strftime("%Y-%m-%d")
-            if day_key not in summary.by_day:
-                summary.by_day[day_key] = {
-                    "input_tokens": 0,
-                    "output_tokens": 0,
-                    "cost_usd": 0.0,
-                    "count": 0,
-                }
-            summary.by_day[day_key]["input_tokens"] += record.input_tokens
-            summary.by_day[day_key]["output_tokens"] += record.output_tokens
-            summary.by_day[day_key]["cost_usd"] += record.cost_usd
-            summary.by_day[day_key]["count"] += 1
+            # ISO timestamps start with the record's own YYYY-MM-DD
+            for stats in (by_model[record.model], by_day[record.timestamp[:10]]):
+                stats["input_tokens"] += record.input_tokens
+                stats["output_tokens"] += record.output_tokens
+                stats["cost_usd"] += record.cost_usd
+                stats["count"] += 1
 
+        summary.by_model = dict(by_model)
+        summary.by_day = dict(by_day)
         return summary
 
+    def is_empty(self) -> bool:
+        """Whether no usage has been recorded."""
+        if self._records is None:
+            return not has_usage(self.data_dir)
+        return not self._get_records()
+
     def clear(self) -> None:
         """Clear all usage records."""
         self._records = []
-        self._save()
+        self._save(self._records)
+        self._loaded_stat = self._stat()
 
     def print_summary(
         self,
@@ -277,7 +368,7 @@ class CostTracker:
             days: Limit to last N days
         """
         if console is None:
-            console = Console()
+            console = get_console()
 
         summary = self.get_summary(days=days)
 
@@ -340,6 +431,33 @@ class CostTracker:
 _tracker: Optional[CostTracker] = None
 
 
+def has_usage(data_dir: Optional[Path] = None) -> bool:
+    """Check for recorded usage without loading the records.
+
+    Uses the global tracker when it already exists; otherwise any content
+    in the usage log counts. A legacy usage.json that has not been migrated
+    yet is parsed only when it is small enough to be an empty store.
+    """
+    if _tracker is not None and data_dir is None:
+        return not _tracker.is_empty()
+
+    data_dir = data_dir or default_data_dir()
+    try:
+        return (data_dir / USAGE_FILENAME).stat().st_size > 0
+    except OSError:
+        pass
+
+    legacy_file = data_dir / LEGACY_USAGE_FILENAME
+    try:
+        size = legacy_file.stat().st_size
+        if size > _EMPTY_STORE_MAX_BYTES:
+            return True
+        with open(legacy_file, "r") as f:
+            return bool(json.load(f).get("records"))
+    except (OSError, ValueError, AttributeError):
+        return False
+
+
 def get_tracker() -> CostTracker:
     """Get or create global cost tracker instance."""
     global _tracker
@@ -1,9 +1,78 @@
 from __future__ import annotations
 
+import re
 from typing import Optional
-from rich.console import Console
 
-console = Console()
+from crowe_logic_cli.output import get_console
+
+console = get_console()
+
+
+def _pattern(*needles: str) -> re.Pattern[str]:
+    """Match any of the given substrings."""
+    return re.compile("|".join(map(re.escape, needles)))
+
+
+_NOT_FOUND = _pattern("404", "not found")
+
+# Endpoint format hints shown with a 404, by provider
+_ENDPOINT_HINTS: dict[str, tuple[str, ...]] = {
+    "azure_ai_inference": (
+        "  • Expected format: [dim]https://<resource>.cognitiveservices.azure.com[/dim]",
+        "  • The API path is constructed as: [dim]/models/{model}/messages[/dim]",
+    ),
+    "azure": ("  • Expected format: [dim]https://<resource>.openai.azure.com[/dim]",),
+}
+
+# Checked in order against the lowercased error message; the first match wins.
+# Each entry is (pattern, summary, steps to try).
+_DIAGNOSES: tuple[tuple[re.Pattern[str], str, tuple[str, ...]], ...] = (
+    (_NOT_FOUND, "404 Not Found - The endpoint path may be incorrect", (
+        "Verify your endpoint URL in Azure Portal",
+        "Check that your deployment name matches exactly",
+        "Run: [cyan]az cognitiveservices account show --name <resource>[/cyan]",
+    )),
+    (_pattern("401", "403", "unauthorized"),
+     "Authentication failed - Invalid or missing API key", (
+        "Verify your API key in Azure Portal → Keys and Endpoint",
+        "Check Key Vault access if using keyvault:// reference",
+        "Ensure you're authenticated: [cyan]az login[/cyan]",
+        "Regenerate keys if compromised",
+    )),
+    (_pattern("429", "rate limit"), "Rate limit exceeded - Too many requests", (
+        "Wait a few seconds and try again",
+        "Check your quota in Azure Portal",
+        "Consider upgrading your tier",
+    )),
+    (_pattern("500", "502", "503"),
+     "Server error - Azure service may be temporarily unavailable", (
+        "Wait a moment and retry",
+        "Check Azure Status: [cyan]https://status.azure.com[/cyan]",
+    )),
+    (_pattern("timeout", "timed out"), "Request timed out - Network or service issue", (
+        "Check your internet connection",
+        "Verify firewall/proxy settings",
+        "Try again in a moment",
+    )),
+    (_pattern("connection refused", "connection reset"),
+     "Connection refused - Cannot reach endpoint", (
+        "Check endpoint URL for typos",
+        "Verify your network connection",
+        "Check if VPN/proxy is required",
+    )),
+    (_pattern("keyvault", "credential"), "Azure authentication issue", (
+        "Login: [cyan]az login[/cyan]",
+        "Check Key Vault permissions: [cyan]az keyvault show --name <vault>[/cyan]",
+        "Verify secret exists: "
+        "[cyan]az keyvault secret show --vault-name <vault> --name <secret>[/cyan]",
+    )),
+)
+
+_DEBUGGING_STEPS = (
+    "Run [cyan]crowelogic doctor run[/cyan] for detailed diagnostics",
+    "Check your configuration: [cyan]cat ~/.crowelogic.toml[/cyan]",
+    "Enable verbose logging if available",
+)
 
 
 def diagnose_connection_error(error: Exception, endpoint: str, provider_name: str) -> None:
@@ -12,71 +81,23 @@ def diagnose_connection_error(error: Exception, endpoint: str, provider_name: st
     
     console.print(f"\n[red]Connection Error:[/red] {error}")
     console.print(f"\n[yellow]Diagnostics:[/yellow]")
-    
-    # Common error patterns
-    if "404" in error_msg or "not found" in error_msg:
-        console.print("  • [dim]404 Not Found - The endpoint path may be incorrect[/dim]")
-        console.print(f"  • Current endpoint: [cyan]{endpoint}[/cyan]")
-        
-        if provider_name == "azure_ai_inference":
-            console.print("  • Expected format: [dim]https://<resource>.cognitiveservices.azure.com[/dim]")
-            console.print("  • The API path is constructed as: [dim]/models/{model}/messages[/dim]")
-        elif provider_name == "azure":
-            console.print("  • Expected format: [dim]https://<resource>.openai.azure.com[/dim]")
-        
-        console.print("\n[yellow]Try:[/yellow]")
-        console.print("  1. Verify your endpoint URL in Azure Portal")
-        console.print("  2. Check that your deployment name matches exactly")
-        console.print("  3. Run: [cyan]az cognitiveservices account show --name <resource>[/cyan]")
-    
-    elif "401" in error_msg or "403" in error_msg or "unauthorized" in error_msg:
-        console.print("  • [dim]Authentication failed - Invalid or missing API key[/dim]")
-        console.print("\n[yellow]Try:[/yellow]")
-        console.print("  1. Verify your API key in Azure Portal → Keys and Endpoint")
-        console.print("  2. Check Key Vault access if using keyvault:// reference")
-        console.print("  3. Ensure you're authenticated: [cyan]az login[/cyan]")
-        console.print("  4. Regenerate keys if compromised")
-    
-    elif "429" in error_msg or "rate limit" in error_msg:
-        console.print("  • [dim]Rate limit exceeded - Too many requests[/dim]")
-        console.print("\n[yellow]Try:[/yellow]")
-        console.print("  1. Wait a few seconds and try again")
-        console.print("  2. Check your quota in Azure Portal")
-        console.print("  3. Consider upgrading your tier")
-    
-    elif "500" in error_msg or "502" in error_msg or "503" in error_msg:
-        console.print("  • [dim]Server error - Azure service may be temporarily unavailable[/dim]")
-        console.print("\n[yellow]Try:[/yellow]")
-        console.print("  1. Wait a moment and retry")
-        console.print("  2. Check Azure Status: [cyan]https://status.azure.com[/cyan]")
-    
-    elif "timeout" in error_msg or "timed out" in error_msg:
-        console.print("  • [dim]Request timed out - Network or service issue[/dim]")
-        console.print("\n[yellow]Try:[/yellow]")
-        console.print("  1. Check your internet connection")
-        console.print("  2. Verify firewall/proxy settings")
-        console.print("  3. Try again in a moment")
-    
-    elif "connection refused" in error_msg or "connection reset" in error_msg:
-        console.print("  • [dim]Connection refused - Cannot reach endpoint[/dim]")
-        console.print("\n[yellow]Try:[/yellow]")
-        console.print("  1. Check endpoint URL for typos")
-        console.print("  2. Verify your network connection")
-        console.print("  3. Check if VPN/proxy is required")
-    
-    elif "keyvault" in error_msg or "credential" in error_msg:
-        console.print("  • [dim]Azure authentication issue[/dim]")
-        console.print("\n[yellow]Try:[/yellow]")
-        console.print("  1. Login: [cyan]az login[/cyan]")
-        console.print("  2. Check Key Vault permissions: [cyan]az keyvault show --name <vault>[/cyan]")
-        console.print("  3. Verify secret exists: [cyan]az keyvault secret show --vault-name <vault> --name <secret>[/cyan]")
-    
+
+    for pattern, summary, steps in _DIAGNOSES:
+        if pattern.search(error_msg):
+            console.print(f"  • [dim]{summary}[/dim]")
+            if pattern is _NOT_FOUND:
+                console.print(f"  • Current endpoint: [cyan]{endpoint}[/cyan]")
+                for hint in _ENDPOINT_HINTS.get(provider_name, ()):
+                    console.print(hint)
+            heading = "Try:"
+            break
     else:
         console.print("  • [dim]Unexpected error[/dim]")
-        console.print("\n[yellow]Debugging steps:[/yellow]")
-        console.print("  1. Run [cyan]crowelogic doctor run[/cyan] for detailed diagnostics")
-        console.print("  2. Check your configuration: [cyan]cat ~/.crowelogic.toml[/cyan]")
-        console.print("  3. Enable verbose logging if available")
+        heading, steps = "Debugging steps:", _DEBUGGING_STEPS
+
+    console.print(f"\n[yellow]{heading}[/yellow]")
+    for number, step in enumerate(steps, 1):
+        console.print(f"  {number}. {step}")
 
 
 def suggest_config_fix(provider: str, error: Exception) -> None:
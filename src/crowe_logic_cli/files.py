@@ -0,0 +1,54 @@
+"""File reading helpers for commands that send file contents to a model."""
+from __future__ import annotations
+
+import functools
+from pathlib import Path
+from typing import Any, Optional
+
+# Rough size of a token when no tokenizer is installed (the same estimate
+# interactive mode uses for streamed usage)
+CHARS_PER_TOKEN = 4
+
+
+def read_head(path: Path, limit: int) -> str:
+    """Read at most ``limit`` characters from a text file.
+
+    Only the needed prefix is read and decoded, so large files cost no more
+    than small ones. Undecodable bytes are replaced rather than raising.
+    """
+    with path.open("r", encoding="utf-8", errors="replace") as f:
+        return f.read(limit)
+
+
+def looks_binary(text: str) -> bool:
+    """Heuristic binary check: decoded text containing NUL characters."""
+    return "\x00" in text
+
+
+@functools.lru_cache(maxsize=1)
+def _token_encoding() -> Optional[Any]:
+    """The cl100k_base tiktoken encoding, or None if it is unavailable."""
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:  # not installed, or its data could not be fetched
+        return None
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut text to at most ``max_tokens`` tokens.
+
+    Counts with tiktoken when it is installed (the "tokens" extra);
+    otherwise keeps ``max_tokens * CHARS_PER_TOKEN`` characters. Text too
+    short to exceed the budget is returned without being encoded.
+    """
+    if len(text) <= max_tokens:
+        return text
+    encoding = _token_encoding()
+    if encoding is None:
+        return text[: max_tokens * CHARS_PER_TOKEN]
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
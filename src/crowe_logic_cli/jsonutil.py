@@ -0,0 +1,42 @@
+"""JSON encoding shared by files, the MCP wire and output, via orjson when available."""
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(
+    obj: Any, indent: Optional[int] = None, default: Optional[Callable[[Any], Any]] = None
+) -> str:
+    """Encode obj as JSON text: compact, or indented by indent spaces.
+
+    The stdlib fallback writes the same text orjson does (compact separators,
+    non-ASCII kept as is), so output doesn't depend on the "fast" extra.
+    orjson only indents by two, so other widths always use the stdlib.
+    """
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option).decode("utf-8")
+    separators = (",", ":") if indent is None else (",", ": ")
+    return json.dumps(
+        obj, indent=indent, separators=separators, ensure_ascii=False, default=default
+    )
+
+
+def dump_line(obj: Any) -> bytes:
+    """Encode obj as one compact UTF-8 JSON line, newline included."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (dumps(obj) + "\n").encode("utf-8")
+
+
+def loads(data: str | bytes | bytearray) -> Any:
+    """Parse JSON text or UTF-8 bytes."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
@@ -22,6 +22,8 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+from crowe_logic_cli.output import get_console
+
 
 class LicenseTier(str, Enum):
     """License tier levels."""
@@ -109,6 +111,11 @@ ENTERPRISE_ONLY_FEATURES = frozenset({
     "role_based_access",
 })
 
+# Derived once at import: features a Pro license covers, and every feature
+# in display order
+PRO_OR_FREE_FEATURES: frozenset[str] = FREE_FEATURES | PRO_FEATURES
+ALL_FEATURES: tuple[str, ...] = tuple(sorted(PRO_OR_FREE_FEATURES | ENTERPRISE_ONLY_FEATURES))
+
 # Usage limits per tier
 TIER_LIMITS: dict[LicenseTier, dict[str, Any]] = {
     LicenseTier.FREE: {
@@ -311,7 +318,7 @@ class LicenseManager:
     def print_status(self, console: Optional[Console] = None) -> None:
         """Print license status to console."""
         if console is None:
-            console = Console()
+            console = get_console()
 
         license_info = self.license
 
@@ -352,8 +359,7 @@ class LicenseManager:
         features_table.add_column("Feature")
         features_table.add_column("Status", justify="center")
 
-        all_features = sorted(FREE_FEATURES | PRO_FEATURES | ENTERPRISE_ONLY_FEATURES)
-        for feature in all_features:
+        for feature in ALL_FEATURES:
             if license_info.has_feature(feature):
                 features_table.add_row(feature, "[green]✓[/green]")
             else:
@@ -390,7 +396,7 @@ def require_feature(feature: str):
             manager = get_license_manager()
             allowed, message = manager.check_feature(feature)
             if not allowed:
-                console = Console()
+                console = get_console()
                 console.print(f"[red]✗ {message}[/red]")
                 raise SystemExit(1)
             return func(*args, **kwargs)
@@ -1,9 +1,9 @@
 """Main entry point for Crowe Logic CLI."""
 import typer
-from rich.console import Console
 from rich.panel import Panel
 
 from . import __version__
+from .output import get_console
 from .cli import (
     chat, interactive, doctor, plugins, agent,
     config, history, research, molecular, quantum,
@@ -15,7 +15,7 @@ app = typer.Typer(
     help="Crowe Logic CLI - Quantum-Enhanced Scientific Reasoning with AICL Multi-Model Orchestration",
     add_completion=True,  # Enable shell completion
 )
-console = Console()
+console = get_console()
 
 # Core commands
 app.add_typer(ask.app, name="ask")
@@ -24,6 +24,9 @@ from ..aicl import (
 from .engine import BaseOrchestrationMode, OrchestrationResult
 from .multi_client import MultiModelClient
 
+# Upper bound on simultaneous provider requests in ParallelMode
+DEFAULT_MAX_CONCURRENCY = 4
+
 
 class DebateMode(BaseOrchestrationMode):
     """
@@ -346,38 +349,60 @@ class ParallelMode(BaseOrchestrationMode):
         system = """Provide your best response to this request.
 Be thorough, accurate, and well-structured."""
 
-        # Execute in parallel
+        # Resolve every model up front so a typo fails before any request is sent
+        for model in models:
+            self.client.get_model(model)
+
+        # Execute in parallel, bounded to avoid provider rate-limit storms
         self.emit_progress("All models working in parallel", 0.3)
+        semaphore = asyncio.Semaphore(kwargs.get("max_concurrency", DEFAULT_MAX_CONCURRENCY))
 
         async def get_response(model_id: str) -> tuple[str, str]:
-            response = await self.client.complete(
-                model_id,
-                [{"role": "user", "content": prompt}],
-                system=system,
-            )
+            async with semaphore:
+                response = await self.client.complete(
+                    model_id,
+                    [{"role": "user", "content": prompt}],
+                    system=system,
+                )
             return model_id, response
 
-        tasks = [get_response(m) for m in models]
-        results = await asyncio.gather(*tasks)
+        gathered = await asyncio.gather(
+            *(get_response(m) for m in models), return_exceptions=True
+        )
 
-        # Record all responses
-        for model_id, response in results:
-            msg = AICLMessage(
-                sender_model=model_id,
-                sender_role=AICLRole.RESPONDER,
-                intent=AICLIntent.RESPONSE,
-                content=response,
-                confidence=0.8,
-            )
+        # Record all responses; one failing model doesn't discard the others
+        results: list[tuple[str, str]] = []
+        for model_id, outcome in zip(models, gathered):
+            if isinstance(outcome, BaseException):
+                msg = AICLMessage(
+                    sender_model=model_id,
+                    sender_role=AICLRole.RESPONDER,
+                    intent=AICLIntent.ERROR,
+                    content=f"Request failed: {outcome}",
+                )
+            else:
+                results.append(outcome)
+                msg = AICLMessage(
+                    sender_model=model_id,
+                    sender_role=AICLRole.RESPONDER,
+                    intent=AICLIntent.RESPONSE,
+                    content=outcome[1],
+                    confidence=0.8,
+                )
             conv.add_message(msg)
             self.emit_message(msg)
 
+        if not results:
+            raise next(o for o in gathered if isinstance(o, BaseException))
+
         self.emit_progress("Evaluating responses", 0.7)
 
-        # Use first model to evaluate and pick best
-        evaluation_prompt = "Evaluate these responses and select the best one. Explain your choice:\n\n"
-        for model_id, response in results:
-            evaluation_prompt += f"=== {model_id} ===\n{response}\n\n"
+        # Use the first responding model to evaluate and pick best
+        evaluator = results[0][0]
+        evaluation_prompt = "".join(
+            ["Evaluate these responses and select the best one. Explain your choice:\n\n"]
+            + [f"=== {model_id} ===\n{response}\n\n" for model_id, response in results]
+        )
 
         evaluator_system = """You are an impartial evaluator. Compare the responses and:
 1. Identify the best response
@@ -390,7 +415,7 @@ REASONING: [why it's best]
 SYNTHESIS: [optional combined best elements]"""
 
         evaluation = await self.client.complete(
-            models[0],
+            evaluator,
             [{"role": "user", "content": evaluation_prompt}],
             system=evaluator_system,
         )
@@ -399,7 +424,7 @@ SYNTHESIS: [optional combined best elements]"""
         best_output = results[0][1]  # TODO: Parse evaluation to get actual best
 
         msg_eval = AICLMessage(
-            sender_model=models[0],
+            sender_model=evaluator,
             sender_role=AICLRole.SYNTHESIZER,
             intent=AICLIntent.SYNTHESIS,
             content=evaluation,
@@ -417,8 +442,8 @@ SYNTHESIS: [optional combined best elements]"""
             conversation=conv,
             final_output=best_output,
             consensus_reached=True,
-            iterations=len(models) + 1,
-            model_contributions={m: 1 for m in models},
+            iterations=len(results) + 1,
+            model_contributions={model_id: 1 for model_id, _ in results},
             quality_score=0.9,
         )
 
@@ -1,16 +1,29 @@
 """Output formatting and clipboard utilities."""
 from __future__ import annotations
 
-import json
 import subprocess
 import sys
+import time
 from dataclasses import asdict, is_dataclass
 from enum import Enum
-from typing import Any, Optional
+from typing import IO, Any, Iterable, List, Optional
 
 from rich.console import Console
-from rich.json import JSON
+from rich.highlighter import JSONHighlighter
 from rich.panel import Panel
+from rich.text import Text
+
+from crowe_logic_cli.jsonutil import dumps
+
+_console: Optional[Console] = None
+
+
+def get_console() -> Console:
+    """Return the Console shared by all CLI commands."""
+    global _console
+    if _console is None:
+        _console = Console()
+    return _console
 
 
 class OutputFormat(str, Enum):
@@ -20,6 +33,103 @@ class OutputFormat(str, Enum):
     MARKDOWN = "markdown"
 
 
+class StreamCoalescer:
+    """Batch streamed text chunks into fewer terminal writes.
+
+    Chunks are buffered and written raw (no Rich markup parsing) once the
+    buffer reaches ``max_chars``, a newline arrives, or ``max_delay`` seconds
+    have passed since the last write. The full text is kept for callers that
+    need it afterwards.
+
+    Usage:
+        with StreamCoalescer(console.file) as out:
+            for chunk in provider.stream(messages):
+                out.feed(chunk)
+        text = out.text
+    """
+
+    def __init__(
+        self,
+        file: Optional[IO[str]] = None,
+        max_chars: int = 64,
+        max_delay: float = 0.05,
+    ) -> None:
+        self.file = file
+        self.max_chars = max_chars
+        self.max_delay = max_delay
+        self._parts: List[str] = []
+        self._pending: List[str] = []
+        self._pending_chars = 0
+        self._last_flush = time.monotonic()
+
+    def feed(self, chunk: str) -> None:
+        """Add a chunk, writing out the buffer if a flush condition is met."""
+        if not chunk:
+            return
+        self._parts.append(chunk)
+        self._pending.append(chunk)
+        self._pending_chars += len(chunk)
+        if (
+            self._pending_chars >= self.max_chars
+            or "\n" in chunk
+            or time.monotonic() - self._last_flush >= self.max_delay
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write any buffered text."""
+        if self._pending:
+            out = self.file if self.file is not None else sys.stdout
+            out.write("".join(self._pending))
+            out.flush()
+            self._pending.clear()
+            self._pending_chars = 0
+        self._last_flush = time.monotonic()
+
+    def close(self) -> str:
+        """Flush remaining text and return everything streamed."""
+        self.flush()
+        return self.text
+
+    @property
+    def text(self) -> str:
+        """All text fed so far."""
+        return "".join(self._parts)
+
+    def __enter__(self) -> "StreamCoalescer":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def print_stream(chunks: Iterable[str], console: Console) -> str:
+    """Print streamed chunks through a StreamCoalescer, then end the line.
+
+    Text goes straight to the console's file, never through Rich rendering.
+    Buffered chunks are written when a newline arrives, once 64 characters
+    are pending, or after 50ms, so short lines usually take one write and
+    long lines are split. Returns the full streamed text.
+    """
+    with StreamCoalescer(console.file) as out:
+        for chunk in chunks:
+            out.feed(chunk)
+    console.print()
+    return out.text
+
+
+def mask_secret(value: str, show_last: int = 4) -> str:
+    """Mask a secret as a fixed run of ``*`` plus its last few characters.
+
+    The mask width does not depend on the secret, so neither its length nor
+    any leading characters are revealed. Values no longer than ``show_last``
+    are masked entirely.
+    """
+    if len(value) <= show_last:
+        return "*" * len(value)
+    return "********" + value[-show_last:]
+
+
 def to_json_serializable(obj: Any) -> Any:
     """Convert an object to JSON-serializable format."""
     if is_dataclass(obj) and not isinstance(obj, type):
@@ -35,6 +145,17 @@ def to_json_serializable(obj: Any) -> Any:
     return obj
 
 
+def _json_text(formatted: str) -> Text:
+    """Highlight already formatted JSON.
+
+    Equivalent to rich's JSON renderable minus its parse and re-dump.
+    """
+    text = JSONHighlighter()(formatted)
+    text.no_wrap = True
+    text.overflow = None
+    return text
+
+
 def format_output(
     data: Any,
     output_format: OutputFormat = OutputFormat.TEXT,
@@ -51,14 +172,12 @@ def format_output(
         Formatted string representation of the data
     """
     if output_format == OutputFormat.JSON:
-        serializable = to_json_serializable(data)
-        return json.dumps(serializable, indent=2, ensure_ascii=False)
+        return dumps(to_json_serializable(data), indent=2, default=str)
 
     if output_format == OutputFormat.MARKDOWN:
         if isinstance(data, str):
             return data
-        serializable = to_json_serializable(data)
-        return f"```json\n{json.dumps(serializable, indent=2, ensure_ascii=False)}\n```"
+        return f"```json\n{dumps(to_json_serializable(data), indent=2, default=str)}\n```"
 
     # TEXT format
     if isinstance(data, str):
@@ -131,16 +250,16 @@ def print_output(
         title: Optional title for panel display
     """
     if console is None:
-        console = Console()
+        console = get_console()
 
     formatted = format_output(data, output_format, console)
 
     if output_format == OutputFormat.JSON:
         # Use Rich's JSON syntax highlighting
         if title:
-            console.print(Panel(JSON(formatted), title=title))
+            console.print(Panel(_json_text(formatted), title=title))
         else:
-            console.print(JSON(formatted))
+            console.print(_json_text(formatted))
     elif title and output_format == OutputFormat.TEXT:
         console.print(Panel(formatted, title=title))
     else:
@@ -8,6 +8,12 @@ Role = Literal["system", "user", "assistant"]
 
 
 class Message(TypedDict):
+    """A chat message in the OpenAI wire format.
+
+    Deliberately a plain dict: the OpenAI-compatible providers send message
+    lists as-is in the request body, and history/cache code serializes them
+    directly, so a tuple or slotted class would need converting on every turn.
+    """
     role: Role
     content: str
 
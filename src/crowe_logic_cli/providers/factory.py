@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools
+
 from crowe_logic_cli.config import AppConfig
 from crowe_logic_cli.providers.base import ChatProvider
 from crowe_logic_cli.providers.azure_openai import AzureOpenAIProvider
@@ -44,3 +46,12 @@ def create_provider(config: AppConfig) -> ChatProvider:
         return OpenAICompatibleProvider(config.openai_compatible)
 
     raise ValueError(f"Unsupported provider: {config.provider}")
+
+
+@functools.lru_cache(maxsize=4)
+def get_shared_provider(config: AppConfig) -> ChatProvider:
+    """Return a provider for config, reusing one created earlier in this process.
+
+    AppConfig is frozen, so equal configs share a provider.
+    """
+    return create_provider(config)
@@ -9,6 +9,8 @@ from typing import Any, Callable, Optional, Sequence, Type, TypeVar
 import httpx
 from rich.console import Console
 
+from crowe_logic_cli.output import get_console
+
 T = TypeVar("T")
 
 # HTTP status codes that should trigger retry
@@ -145,7 +147,7 @@ def with_retry(
     if config is None:
         config = DEFAULT_RETRY_CONFIG
     if console is None:
-        console = Console()
+        console = get_console()
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
@@ -208,7 +210,7 @@ class RetryableClient:
         """
         self.config = config or DEFAULT_RETRY_CONFIG
         self.timeout = timeout
-        self.console = console or Console()
+        self.console = console or get_console()
         self.verbose = verbose
 
     def request(
@@ -12,6 +12,8 @@ from rich.syntax import Syntax
 from rich.table import Table
 from rich.text import Text
 
+from ..output import get_console
+
 
 class DiffView:
     """
@@ -20,7 +22,7 @@ class DiffView:
     """
 
     def __init__(self, console: Console | None = None) -> None:
-        self.console = console or Console()
+        self.console = console or get_console()
 
     def compare_text(
         self,
@@ -142,7 +144,7 @@ class MergeView:
     """
 
     def __init__(self, console: Console | None = None) -> None:
-        self.console = console or Console()
+        self.console = console or get_console()
 
     def find_common(self, texts: list[str]) -> list[str]:
         """Find common lines across all texts."""
@@ -3,7 +3,6 @@
 
 """Live Orchestration Display with Real-Time Updates."""
 
-import asyncio
 from typing import Any, Optional
 
 from rich.console import Console
@@ -16,6 +15,7 @@ from rich.text import Text
 
 from ..aicl import AICLMessage, AICLConversation
 from ..orchestrator import OrchestrationMode
+from ..output import get_console
 from .panels import (
     ModelPanel,
     DebatePanel,
@@ -33,7 +33,7 @@ class LiveOrchestration:
     """
 
     def __init__(self, console: Console | None = None) -> None:
-        self.console = console or Console()
+        self.console = console or get_console()
         self.mode: OrchestrationMode | None = None
         self.models: list[str] = []
         self.messages: list[AICLMessage] = []
@@ -165,32 +165,18 @@ class LiveOrchestration:
         Returns:
             Result of the orchestration
         """
-        result = None
-
-        with Live(self._build_layout(), console=self.console, refresh_per_second=4) as live:
-            async def update_display() -> None:
-                while not self.is_complete:
-                    live.update(self._build_layout())
-                    await asyncio.sleep(0.25)
-
-            # Run both concurrently
-            display_task = asyncio.create_task(update_display())
-
+        # Live's refresh thread rebuilds the layout itself, so no polling
+        # task is needed alongside the orchestration
+        with Live(
+            console=self.console,
+            refresh_per_second=4,
+            get_renderable=self._build_layout,
+        ):
             try:
                 result = await orchestrate_func(*args, **kwargs)
-                self.is_complete = True
                 self.final_output = result.final_output if hasattr(result, 'final_output') else str(result)
             finally:
                 self.is_complete = True
-                await asyncio.sleep(0.1)  # Let display catch up
-                display_task.cancel()
-                try:
-                    await display_task
-                except asyncio.CancelledError:
-                    pass
-
-            # Final update
-            live.update(self._build_layout())
 
         return result
 
@@ -209,7 +195,7 @@ class QuickDisplay:
     """Simple non-live display for quick outputs."""
 
     def __init__(self, console: Console | None = None) -> None:
-        self.console = console or Console()
+        self.console = console or get_console()
 
     def show_message(self, message: AICLMessage) -> None:
         """Display a single AICL message."""
@@ -220,7 +206,7 @@ class QuickDisplay:
                           f"[dim]{message.intent.value}[/] | "
                           f"Confidence: {message.confidence:.0%}")
         self.console.print(f"[{color}]{'─' * 60}[/]")
-        self.console.print(message.content)
+        self.console.print(message.content, markup=False, highlight=False, emoji=False)
 
     def show_result(self, result: Any) -> None:
         """Display orchestration result."""
@@ -0,0 +1,114 @@
+"""Tests for AICL protocol objects and serialization."""
+import json
+from dataclasses import asdict, fields
+
+from crowe_logic_cli import jsonutil
+from crowe_logic_cli.aicl import (
+    AICLConversation,
+    AICLIntent,
+    AICLMessage,
+    AICLRole,
+    AICLSerializer,
+)
+
+
+def _sample_conversation() -> AICLConversation:
+    conv = AICLConversation()
+    conv.context.original_prompt = "Is P = NP?"
+    conv.context.constraints.append("Be concise")
+    conv.context.add_artifact("draft", "print('hi')", "code")
+    conv.add_model("claude", AICLRole.INITIATOR, "anthropic")
+    conv.add_model("gpt", AICLRole.REVIEWER, "openai")
+    conv.add_message(
+        AICLMessage(
+            sender_model="claude",
+            sender_role=AICLRole.INITIATOR,
+            intent=AICLIntent.PROPOSAL,
+            content="Probably not.",
+            reasoning="Decades of failed attempts.",
+            confidence=0.7,
+            code_blocks=[{"language": "python", "code": "print('hi')"}],
+        )
+    )
+    conv.add_message(
+        AICLMessage(
+            sender_model="gpt",
+            sender_role=AICLRole.REVIEWER,
+            intent=AICLIntent.CRITIQUE,
+            content="Not a proof.",
+            confidence=0.9,
+        )
+    )
+    return conv
+
+
+class TestAICLSerializer:
+    """Tests for AICLSerializer."""
+
+    def test_message_to_dict_matches_fields(self):
+        msg = _sample_conversation().messages[0]
+        d = AICLSerializer.message_to_dict(msg)
+        expected = {f.name for f in fields(AICLMessage) if not f.name.startswith("_")}
+        assert set(d) == expected
+        assert d["sender_role"] == "initiator"
+        assert d["intent"] == "proposal"
+
+    def test_context_to_dict_matches_asdict(self):
+        ctx = _sample_conversation().context
+        assert AICLSerializer.context_to_dict(ctx) == asdict(ctx)
+
+    def test_conversation_round_trip(self):
+        conv = _sample_conversation()
+        restored = AICLSerializer.from_json(AICLSerializer.to_json(conv))
+
+        assert restored.id == conv.id
+        assert restored.context == conv.context
+        assert restored.models == conv.models
+        assert len(restored.messages) == 2
+        assert restored.messages[0].sender_role is AICLRole.INITIATOR
+        assert restored.messages[1].intent is AICLIntent.CRITIQUE
+        assert restored.messages[0].to_prompt() == conv.messages[0].to_prompt()
+
+    def test_to_json_without_orjson(self, monkeypatch):
+        conv = _sample_conversation()
+        monkeypatch.setattr(jsonutil, "orjson", None)
+        text = AICLSerializer.to_json(conv)
+        assert json.loads(text)["id"] == conv.id
+        assert AICLSerializer.from_json(text).messages[1].content == "Not a proof."
+
+
+class TestAICLConversation:
+    """Tests for AICLConversation."""
+
+    def test_messages_by_model_and_intent(self):
+        conv = _sample_conversation()
+        assert [m.content for m in conv.get_messages_by_model("gpt")] == ["Not a proof."]
+        assert conv.get_messages_by_model("unknown") == []
+        assert len(conv.get_messages_by_intent(AICLIntent.PROPOSAL)) == 1
+        assert conv.get_messages_by_intent(AICLIntent.SYNTHESIS) == []
+
+    def test_indices_rebuilt_after_deserialization(self):
+        restored = AICLSerializer.from_json(AICLSerializer.to_json(_sample_conversation()))
+        assert len(restored.get_messages_by_model("claude")) == 1
+        assert len(restored.get_messages_by_intent(AICLIntent.CRITIQUE)) == 1
+
+    def test_build_context_for_model(self):
+        conv = _sample_conversation()
+        context = conv.build_context_for_model("gpt")
+        assert "  - gpt (you): reviewer" in context
+        assert "  - claude: initiator" in context
+        assert "  - Be concise" in context
+        assert conv.messages[0].to_prompt() in context
+        assert context.endswith("=== YOUR TURN ===")
+
+
+class TestAICLMessage:
+    """Tests for AICLMessage."""
+
+    def test_to_prompt_is_cached(self):
+        msg = _sample_conversation().messages[0]
+        first = msg.to_prompt()
+        assert first.startswith("[AICL MESSAGE from claude as initiator]")
+        assert "Confidence: 70%" in first
+        assert "```python\nprint('hi')\n```" in first
+        assert msg.to_prompt() is first
@@ -0,0 +1,120 @@
+"""Tests for the response cache."""
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from crowe_logic_cli.cache import LLMCache, cached_stream, model_id
+from crowe_logic_cli.config import AppConfig, OpenAICompatibleConfig
+
+
+MESSAGES = [{"role": "user", "content": "Explain this code."}]
+
+
+class CountingStream:
+    """Provider stream stand-in that counts calls."""
+
+    def __init__(self, chunks: list[str]) -> None:
+        self.chunks = chunks
+        self.calls = 0
+
+    def __call__(self, messages):
+        self.calls += 1
+        yield from self.chunks
+
+
+class TestLLMCache:
+    """Tests for LLMCache."""
+
+    def test_key_is_stable_and_model_sensitive(self) -> None:
+        assert LLMCache.key("m", MESSAGES) == LLMCache.key("m", list(MESSAGES))
+        assert LLMCache.key("m", MESSAGES) != LLMCache.key("other", MESSAGES)
+
+    def test_get_set_and_expiry(self, tmp_path: Path) -> None:
+        cache = LLMCache(tmp_path, ttl=60)
+        cache.set("k", "hello")
+        assert cache.get("k") == "hello"
+        assert cache.get("missing") is None
+
+        entry = tmp_path / "k.json"
+        entry.write_text(json.dumps({"created": time.time() - 120, "text": "old"}))
+        assert cache.get("k") is None
+        assert not entry.exists()
+
+    def test_set_leaves_only_the_entry(self, tmp_path: Path) -> None:
+        cache = LLMCache(tmp_path)
+        cache.set("k", "one")
+        cache.set("k", "two")
+
+        assert [p.name for p in tmp_path.iterdir()] == ["k.json"]
+        assert cache.get("k") == "two"
+
+    def test_model_id_excludes_api_key(self) -> None:
+        config = AppConfig(
+            provider="openai_compatible",
+            openai_compatible=OpenAICompatibleConfig(
+                base_url="http://localhost", api_key="secret", model="llama"
+            ),
+        )
+        ident = model_id(config)
+        assert "llama" in ident
+        assert "secret" not in ident
+
+
+class TestCachedStream:
+    """Tests for cached_stream."""
+
+    def test_disabled_streams_through(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("CROWE_CACHE", raising=False)
+        stream = CountingStream(["a", "b"])
+        cache = LLMCache(tmp_path)
+
+        assert list(cached_stream(stream, MESSAGES, "m", cache=cache)) == ["a", "b"]
+        assert list(cached_stream(stream, MESSAGES, "m", cache=cache)) == ["a", "b"]
+        assert stream.calls == 2
+        assert not list(tmp_path.iterdir())
+
+    def test_hit_skips_provider(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("CROWE_CACHE", "1")
+        stream = CountingStream(["a", "b"])
+        cache = LLMCache(tmp_path)
+
+        assert list(cached_stream(stream, MESSAGES, "m", cache=cache)) == ["a", "b"]
+        assert list(cached_stream(stream, MESSAGES, "m", cache=cache)) == ["ab"]
+        assert stream.calls == 1
+
+    def test_enabled_overrides_environment(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.delenv("CROWE_CACHE", raising=False)
+        stream = CountingStream(["a"])
+        cache = LLMCache(tmp_path)
+
+        list(cached_stream(stream, MESSAGES, "m", cache=cache, enabled=True))
+        assert list(cached_stream(stream, MESSAGES, "m", cache=cache, enabled=True)) == ["a"]
+        assert stream.calls == 1
+
+        monkeypatch.setenv("CROWE_CACHE", "1")
+        list(cached_stream(stream, MESSAGES, "m", cache=cache, enabled=False))
+        assert stream.calls == 2
+
+    def test_sampled_requests_not_cached(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("CROWE_CACHE", "1")
+        stream = CountingStream(["a"])
+        cache = LLMCache(tmp_path)
+
+        list(cached_stream(stream, MESSAGES, "m", temperature=0.7, cache=cache))
+        list(cached_stream(stream, MESSAGES, "m", temperature=0.7, cache=cache))
+        assert stream.calls == 2
+
+    def test_interrupted_stream_not_cached(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("CROWE_CACHE", "1")
+        cache = LLMCache(tmp_path)
+
+        gen = cached_stream(CountingStream(["a", "b"]), MESSAGES, "m", cache=cache)
+        assert next(gen) == "a"
+        gen.close()
+        assert cache.get(LLMCache.key("m", MESSAGES)) is None
@@ -1,15 +1,21 @@
 """Integration tests for CLI commands."""
 from __future__ import annotations
 
+import asyncio
+import io
 import json
 import os
+from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from typer.testing import CliRunner
 
+from crowe_logic_cli.cli.history import load_conversation
+from crowe_logic_cli.config import AppConfig
+from crowe_logic_cli.cost_tracker import CostTracker
 from crowe_logic_cli.main import app
 from crowe_logic_cli.providers.base import ChatResponse, UsageInfo
 
@@ -35,7 +41,7 @@ class TestDoctorCommand:
         os.environ["CROWE_AZURE_API_KEY"] = "super-secret-key-12345"
 
         # Mock the provider's healthcheck to avoid actual API calls
-        with patch("crowe_logic_cli.cli.doctor.create_provider") as mock_factory:
+        with patch("crowe_logic_cli.providers.factory.create_provider") as mock_factory:
             mock_provider = MagicMock()
             mock_provider.name.return_value = "azure"
             mock_provider.healthcheck.side_effect = Exception("Connection failed")
@@ -69,11 +75,81 @@ class TestConfigCommand:
         # Should show wizard title or provider selection
         assert "Configuration" in result.output or "provider" in result.output.lower()
 
+    @pytest.mark.filterwarnings("ignore::getpass.GetPassWarning")
+    def test_config_run_tests_connection_in_process(self, tmp_path: Path) -> None:
+        """Test the wizard's connection test runs doctor without a subprocess."""
+        output = tmp_path / ".crowelogic.toml"
+        wizard_input = "3\nhttps://api.example.com/v1\nmodel-x\nsk-test\ny\n"
+
+        with patch("crowe_logic_cli.cli.doctor.load_config", side_effect=ValueError("Missing")), patch(
+            "subprocess.run"
+        ) as mock_subprocess:
+            result = runner.invoke(app, ["config", "run", "--output", str(output)], input=wizard_input)
+
+        assert 'model = "model-x"' in output.read_text()
+        assert "Connection test failed" in result.output
+        mock_subprocess.assert_not_called()
+
+    @pytest.mark.filterwarnings("ignore::getpass.GetPassWarning")
+    def test_config_run_keeps_existing_file_when_declined(self, tmp_path: Path) -> None:
+        """Test the wizard leaves an existing config alone if overwrite is declined."""
+        output = tmp_path / ".crowelogic.toml"
+        output.write_text("existing\n")
+        wizard_input = "3\nhttps://api.example.com/v1\nmodel-x\nsk-test\nn\n"
+
+        result = runner.invoke(app, ["config", "run", "--output", str(output)], input=wizard_input)
+
+        assert result.exit_code == 1
+        assert "cancelled" in result.output
+        assert output.read_text() == "existing\n"
+
+
+class TestConfigCmdShow:
+    """Test the config show/path commands."""
+
+    def test_show_reads_file_without_resolving(self, tmp_path: Path) -> None:
+        """Test show prints raw file values, masked, without loading the config."""
+        from crowe_logic_cli.cli.config_cmd import app as config_cmd_app
+
+        config_file = tmp_path / ".crowelogic.toml"
+        config_file.write_text(
+            'provider = "azure"\n\n[azure]\n'
+            'endpoint = "https://example.azure.com"\n'
+            'api_key = "super-secret-key-12345"\n'
+        )
+
+        with patch(
+            "crowe_logic_cli.cli.config_cmd._find_config_file", return_value=config_file
+        ), patch("crowe_logic_cli.config.load_config") as load:
+            result = runner.invoke(config_cmd_app, ["show"])
+
+        assert result.exit_code == 0
+        load.assert_not_called()
+        assert "azure.endpoint" in result.output
+        assert "super-secret-key-12345" not in result.output
+        assert "2345" in result.output
+
+    def test_show_resolve_loads_config(self, tmp_path: Path) -> None:
+        """Test show --resolve reports the effective configuration."""
+        from crowe_logic_cli.cli.config_cmd import app as config_cmd_app
+
+        with patch(
+            "crowe_logic_cli.cli.config_cmd._find_config_file", return_value=None
+        ), patch(
+            "crowe_logic_cli.config.load_config",
+            return_value=AppConfig(provider="openai_compatible"),
+        ) as load:
+            result = runner.invoke(config_cmd_app, ["show", "--resolve"])
+
+        assert result.exit_code == 0
+        load.assert_called_once()
+        assert "openai_compatible" in result.output
+
 
 class TestChatCommand:
     """Test the chat command."""
 
-    def test_chat_run_with_mock_provider(self, mock_env_clean: None) -> None:
+    def test_chat_run_with_mock_provider(self, mock_env_clean: None, tmp_path: Path) -> None:
         """Test chat run command with mocked provider."""
         os.environ["CROWE_PROVIDER"] = "azure"
         os.environ["CROWE_AZURE_ENDPOINT"] = "https://test.openai.azure.com"
@@ -84,9 +160,12 @@ class TestChatCommand:
             content="Hello! I'm here to help.",
             usage=UsageInfo(input_tokens=10, output_tokens=5),
         )
+        tracker = CostTracker(data_dir=tmp_path)
 
-        with patch("crowe_logic_cli.cli.chat.create_provider") as mock_factory:
+        with patch("crowe_logic_cli.providers.factory.create_provider") as mock_factory, \
+                patch("crowe_logic_cli.cost_tracker.get_tracker", return_value=tracker):
             mock_provider = MagicMock()
+            mock_provider.name.return_value = "mock"
             mock_provider.chat.return_value = mock_response
             mock_factory.return_value = mock_provider
 
@@ -94,6 +173,30 @@ class TestChatCommand:
 
         assert result.exit_code == 0
         assert "Hello! I'm here to help." in result.output
+        summary = tracker.get_summary()
+        assert (summary.request_count, summary.total_input_tokens) == (1, 10)
+
+    def test_chat_run_shows_answer_before_recording_usage(self, mock_env_clean: None) -> None:
+        """Test usage is recorded only after the response has been printed."""
+        os.environ["CROWE_PROVIDER"] = "azure"
+        os.environ["CROWE_AZURE_ENDPOINT"] = "https://test.openai.azure.com"
+        os.environ["CROWE_AZURE_DEPLOYMENT"] = "gpt-4"
+        os.environ["CROWE_AZURE_API_KEY"] = "test-key"
+
+        mock_response = ChatResponse(
+            content="Answer first.", usage=UsageInfo(input_tokens=10, output_tokens=5)
+        )
+        tracker = MagicMock()
+        tracker.record.side_effect = OSError("disk full")
+
+        with patch("crowe_logic_cli.providers.factory.create_provider") as mock_factory, \
+                patch("crowe_logic_cli.cost_tracker.get_tracker", return_value=tracker):
+            mock_factory.return_value.chat.return_value = mock_response
+            result = runner.invoke(app, ["chat", "run", "Hello!"])
+
+        assert "Answer first." in result.output
+        tracker.record.assert_called_once()
+        assert tracker.record.call_args.kwargs["input_tokens"] == 10
 
     def test_chat_run_with_system_prompt(self, mock_env_clean: None) -> None:
         """Test chat run with custom system prompt."""
@@ -104,7 +207,7 @@ class TestChatCommand:
 
         mock_response = ChatResponse(content="I am a pirate!", usage=None)
 
-        with patch("crowe_logic_cli.cli.chat.create_provider") as mock_factory:
+        with patch("crowe_logic_cli.providers.factory.create_provider") as mock_factory:
             mock_provider = MagicMock()
             mock_provider.chat.return_value = mock_response
             mock_factory.return_value = mock_provider
@@ -118,6 +221,56 @@ class TestChatCommand:
         assert any(msg["role"] == "system" and "pirate" in msg["content"] for msg in call_args)
 
 
+class TestInteractiveCommand:
+    """Test the interactive chat session."""
+
+    def test_streaming_token_estimate_tracks_history(self) -> None:
+        """Test the per-turn input estimate covers every message sent so far."""
+        provider = MagicMock()
+        provider.name.return_value = "mock"
+        provider.chat_stream.side_effect = lambda messages: iter(["r" * 12])
+
+        with patch("crowe_logic_cli.config.load_config"), patch(
+            "crowe_logic_cli.providers.factory.get_shared_provider", return_value=provider
+        ):
+            result = runner.invoke(
+                app,
+                ["interactive", "run", "--system", "s" * 40],
+                input="u" * 8 + "\n" + "u" * 8 + "\n/exit\n",
+            )
+
+        assert result.exit_code == 0
+        # (40 + 8) // 4, then (40 + 8 + 12 + 8) // 4
+        assert "~12 in / ~3 out" in result.output
+        assert "~17 in / ~3 out" in result.output
+
+    def test_max_turns_limits_context_sent(self) -> None:
+        """Test only the system prompt and the latest turns are sent."""
+        sent: list[list] = []
+        provider = MagicMock()
+        provider.name.return_value = "mock"
+
+        def chat_stream(messages):
+            sent.append([m["content"] for m in messages])
+            return iter(["r" * 12])
+
+        provider.chat_stream.side_effect = chat_stream
+
+        with patch("crowe_logic_cli.config.load_config"), patch(
+            "crowe_logic_cli.providers.factory.get_shared_provider", return_value=provider
+        ):
+            result = runner.invoke(
+                app,
+                ["interactive", "run", "--system", "s" * 40, "--max-turns", "1"],
+                input="one\ntwo\n/exit\n",
+            )
+
+        assert result.exit_code == 0
+        assert sent[-1] == ["s" * 40, "two"]
+        # Estimate reflects what was sent: (40 + 3) // 4
+        assert "~10 in / ~3 out" in result.output
+
+
 class TestHistoryCommand:
     """Test history management commands."""
 
@@ -147,6 +300,60 @@ class TestHistoryCommand:
         assert result.exit_code == 0
         assert "my-chat" in result.output
 
+    def test_history_list_counts_jsonl_messages(self, temp_history_dir: Path) -> None:
+        """Test history list reads the JSONL header and counts message lines."""
+        from crowe_logic_cli.cli.history import save_conversation
+
+        messages = [
+            {"role": "user", "content": "Hello!"},
+            {"role": "assistant", "content": "Hi there!"},
+        ]
+        with patch(
+            "crowe_logic_cli.cli.history.get_history_dir", return_value=temp_history_dir
+        ):
+            save_conversation(messages, "jsonl-chat")
+            result = runner.invoke(app, ["history", "list"])
+
+        assert result.exit_code == 0
+        assert "jsonl-chat" in result.output
+        assert " 2 " in result.output
+
+    def test_history_list_orders_by_mtime(self, temp_history_dir: Path) -> None:
+        """Test history list shows the most recently saved conversation first."""
+        older = temp_history_dir / "zz-older.json"
+        newer = temp_history_dir / "aa-newer.json"
+        older.write_text(json.dumps({"timestamp": "bogus", "messages": []}))
+        newer.write_text(json.dumps({"timestamp": "2026-01-12T10:30:00", "messages": []}))
+        old_time = datetime(2025, 6, 1, 12, 0).timestamp()
+        os.utime(older, (old_time, old_time))
+
+        with patch(
+            "crowe_logic_cli.cli.history.get_history_dir", return_value=temp_history_dir
+        ):
+            result = runner.invoke(app, ["history", "list"])
+
+        assert result.exit_code == 0
+        assert result.output.index("aa-newer") < result.output.index("zz-older")
+        # Unparseable timestamps fall back to the file's modification time
+        assert "2025-06-01 12:00" in result.output
+
+    def test_history_list_uses_metadata_sidecar(self, temp_history_dir: Path) -> None:
+        """Test history list takes date and count from the sidecar, not the file."""
+        (temp_history_dir / "chat.jsonl").write_text("not parsed\n")
+        (temp_history_dir / "chat.meta.json").write_text(
+            json.dumps({"timestamp": "2026-03-04T05:06:07", "count": 42})
+        )
+
+        with patch(
+            "crowe_logic_cli.cli.history.get_history_dir", return_value=temp_history_dir
+        ):
+            result = runner.invoke(app, ["history", "list"])
+
+        assert result.exit_code == 0
+        assert "2026-03-04 05:06" in result.output
+        assert "42" in result.output
+        assert "chat.meta" not in result.output
+
     def test_history_load_displays_conversation(
         self, temp_history_dir: Path, sample_conversation: Dict[str, Any]
     ) -> None:
@@ -164,6 +371,26 @@ class TestHistoryCommand:
         assert "Hello!" in result.output
         assert "Hi there!" in result.output
 
+    def test_history_load_shows_markup_verbatim(self, temp_history_dir: Path) -> None:
+        """Test history load prints message text as-is and skips unknown roles."""
+        conversation = {
+            "timestamp": "2026-01-12T10:30:00",
+            "messages": [
+                {"role": "user", "content": "What does [/red] do?"},
+                {"role": "tool", "content": "hidden tool output"},
+            ],
+        }
+        (temp_history_dir / "markup.json").write_text(json.dumps(conversation))
+
+        with patch(
+            "crowe_logic_cli.cli.history.get_history_dir", return_value=temp_history_dir
+        ):
+            result = runner.invoke(app, ["history", "load", "markup"])
+
+        assert result.exit_code == 0
+        assert "What does [/red] do?" in result.output
+        assert "hidden tool output" not in result.output
+
     def test_history_load_not_found(self, temp_history_dir: Path) -> None:
         """Test history load with non-existent conversation."""
         with patch(
@@ -190,6 +417,82 @@ class TestHistoryCommand:
         assert result.exit_code == 0
         assert not conv_file.exists()
 
+    def test_history_resume_stops_streaming_after_not_implemented(
+        self, temp_history_dir: Path, sample_conversation: Dict[str, Any]
+    ) -> None:
+        """Test resume falls back to chat once and stops retrying chat_stream."""
+        (temp_history_dir / "resumed.json").write_text(json.dumps(sample_conversation))
+        provider = MagicMock()
+        provider.chat_stream.side_effect = NotImplementedError
+        provider.chat.return_value = ChatResponse(content="Fallback reply")
+
+        with patch(
+            "crowe_logic_cli.cli.history.get_history_dir", return_value=temp_history_dir
+        ), patch("crowe_logic_cli.config.load_config"), patch(
+            "crowe_logic_cli.providers.factory.get_shared_provider", return_value=provider
+        ):
+            result = runner.invoke(
+                app, ["history", "resume", "resumed"], input="one\ntwo\n/exit\n"
+            )
+
+        assert result.exit_code == 0
+        assert result.output.count("Fallback reply") == 2
+        assert provider.chat_stream.call_count == 1
+        assert provider.chat.call_count == 2
+
+    def test_history_resume_streams_chunks_raw(
+        self, temp_history_dir: Path, sample_conversation: Dict[str, Any]
+    ) -> None:
+        """Test resumed sessions write streamed text as-is and keep the reply."""
+        (temp_history_dir / "streamed.json").write_text(json.dumps(sample_conversation))
+        provider = MagicMock()
+        provider.chat_stream.side_effect = lambda messages: iter(["use [bold]", "x[/bold]"])
+
+        with patch(
+            "crowe_logic_cli.cli.history.get_history_dir", return_value=temp_history_dir
+        ), patch("crowe_logic_cli.config.load_config"), patch(
+            "crowe_logic_cli.providers.factory.get_shared_provider", return_value=provider
+        ):
+            result = runner.invoke(app, ["history", "resume", "streamed"], input="hi\n/exit\n")
+            messages = load_conversation("streamed")
+
+        assert result.exit_code == 0
+        assert "use [bold]x[/bold]" in result.output
+        assert messages[-1] == {"role": "assistant", "content": "use [bold]x[/bold]"}
+
+    def test_history_resume_preview_shows_markup_verbatim(self, temp_history_dir: Path) -> None:
+        """Test the recent-message preview prints saved text literally."""
+        save = [
+            {"role": "user", "content": "what does [red]x[/red] mean?"},
+            {"role": "assistant", "content": "It is Rich [bold]markup[/bold]."},
+        ]
+        (temp_history_dir / "marked.json").write_text(json.dumps({"messages": save}))
+
+        with patch(
+            "crowe_logic_cli.cli.history.get_history_dir", return_value=temp_history_dir
+        ), patch("crowe_logic_cli.config.load_config"), patch(
+            "crowe_logic_cli.providers.factory.get_shared_provider"
+        ):
+            result = runner.invoke(app, ["history", "resume", "marked"], input="/exit\n")
+
+        assert result.exit_code == 0
+        assert "You: what does [red]x[/red] mean?" in result.output
+        assert "Assistant: It is Rich [bold]markup[/bold]." in result.output
+
+    def test_history_delete_removes_metadata(self, temp_history_dir: Path) -> None:
+        """Test history delete also removes the metadata sidecar."""
+        from crowe_logic_cli.cli.history import save_conversation
+
+        with patch(
+            "crowe_logic_cli.cli.history.get_history_dir", return_value=temp_history_dir
+        ):
+            filepath = save_conversation([{"role": "user", "content": "Hi"}], "gone")
+            result = runner.invoke(app, ["history", "delete", "gone"])
+
+        assert result.exit_code == 0
+        assert not filepath.exists()
+        assert list(temp_history_dir.iterdir()) == []
+
 
 class TestPluginsCommand:
     """Test plugin discovery commands."""
@@ -233,6 +536,42 @@ class TestPluginsCommand:
         assert "my-plugin" in result.output
         assert "test-cmd" in result.output.lower() or "Commands" in result.output
 
+    def test_plugins_show_lists_each_category(self, tmp_path: Path) -> None:
+        """Test show lists .md files and subdirectories, ignoring other files."""
+        plugin = tmp_path / "plugins" / "kit"
+        (plugin / "skills" / "refactor").mkdir(parents=True)
+        (plugin / "agents").mkdir()
+        (plugin / "agents" / "reviewer.md").write_text("# Reviewer")
+        (plugin / "agents" / "notes.txt").write_text("ignored")
+        (plugin / "hooks").write_text("not a directory")
+
+        with patch(
+            "crowe_logic_cli.cli.plugins._find_plugins_dir", return_value=tmp_path / "plugins"
+        ):
+            result = runner.invoke(app, ["plugins", "show", "kit"])
+
+        assert result.exit_code == 0
+        assert "reviewer" in result.output
+        assert "refactor" in result.output
+        assert "notes" not in result.output
+        assert "Hooks" not in result.output
+
+    def test_plugins_show_previews_readme_head(self, tmp_path: Path) -> None:
+        """Test show previews only the first ten README lines."""
+        plugin = tmp_path / "plugins" / "kit"
+        plugin.mkdir(parents=True)
+        lines = [f"line {i}" for i in range(1, 13)]
+        (plugin / "README.md").write_bytes("\n".join(lines).encode() + b"\n\xff" * 10_000)
+
+        with patch(
+            "crowe_logic_cli.cli.plugins._find_plugins_dir", return_value=tmp_path / "plugins"
+        ):
+            result = runner.invoke(app, ["plugins", "show", "kit"])
+
+        assert result.exit_code == 0
+        assert "line 10" in result.output
+        assert "line 11" not in result.output
+
 
 class TestAgentCommand:
     """Test agent runner commands."""
@@ -251,6 +590,79 @@ class TestAgentCommand:
         assert result.exit_code == 0
         assert "code-reviewer" in result.output
 
+    def test_agent_list_nested_layouts(self, tmp_path: Path) -> None:
+        """Test agent list finds nested agents and skips unrelated markdown."""
+        agents_dir = tmp_path / "plugins"
+        (agents_dir / "plugin" / "agents").mkdir(parents=True)
+        (agents_dir / "plugin" / "reviewer").mkdir()
+        (agents_dir / "plugin" / "agents" / "nested.md").write_text("# Nested")
+        (agents_dir / "plugin" / "reviewer" / "agent.md").write_text("# Reviewer")
+        (agents_dir / "plugin" / "helper-agent.md").write_text("# Helper")
+        (agents_dir / "plugin" / "README.md").write_text("# Not an agent")
+
+        with patch("crowe_logic_cli.cli.agent.AGENTS_DIRS", [agents_dir]):
+            result = runner.invoke(app, ["agent", "list"])
+
+        assert result.exit_code == 0
+        assert "nested" in result.output
+        assert "reviewer" in result.output
+        assert "helper -" in result.output
+        assert "README" not in result.output
+
+    def test_load_agent_prompt_strips_frontmatter(self, tmp_path: Path) -> None:
+        """Test YAML frontmatter is removed from agent prompts."""
+        from crowe_logic_cli.cli.agent import _load_agent_prompt
+
+        agent = tmp_path / "agent.md"
+        agent.write_text("---\nname: reviewer\n---\n\nYou review code.\n")
+        assert _load_agent_prompt(agent) == "You review code."
+
+        plain = tmp_path / "plain.md"
+        plain.write_text("# Plain agent\n")
+        assert _load_agent_prompt(plain) == "# Plain agent\n"
+
+    def test_agent_run_context_file_checks(self, tmp_path: Path) -> None:
+        """Test agent run rejects missing and oversized context files."""
+        agents_dir = tmp_path / "agents"
+        agents_dir.mkdir()
+        (agents_dir / "helper.md").write_text("# Helper")
+        big = tmp_path / "big.txt"
+        big.write_bytes(b"x" * 16)
+
+        with patch("crowe_logic_cli.cli.agent.AGENTS_DIRS", [agents_dir]), patch(
+            "crowe_logic_cli.cli.agent._agent_index_file",
+            return_value=tmp_path / "agent_index.json",
+        ):
+            result = runner.invoke(
+                app, ["agent", "run", "helper", "hi", "-f", str(tmp_path / "nope.txt")]
+            )
+            assert result.exit_code == 1
+            assert "File not found" in result.output
+
+            with patch("crowe_logic_cli.cli.agent.MAX_FILE_SIZE_BYTES", 8):
+                result = runner.invoke(app, ["agent", "run", "helper", "hi", "-f", str(big)])
+            assert result.exit_code == 1
+            assert "File too large" in result.output
+
+    def test_agent_run_streams_raw_chunks(self, tmp_path: Path) -> None:
+        """Test streamed agent output is written verbatim, without markup parsing."""
+        agents_dir = tmp_path / "agents"
+        agents_dir.mkdir()
+        (agents_dir / "helper.md").write_text("# Helper")
+        provider = MagicMock()
+        provider.chat_stream.return_value = iter(["Use ", "[bold]", " here"])
+
+        with patch("crowe_logic_cli.cli.agent.AGENTS_DIRS", [agents_dir]), patch(
+            "crowe_logic_cli.cli.agent._agent_index_file",
+            return_value=tmp_path / "agent_index.json",
+        ), patch("crowe_logic_cli.config.load_config"), patch(
+            "crowe_logic_cli.providers.factory.get_shared_provider", return_value=provider
+        ):
+            result = runner.invoke(app, ["agent", "run", "helper", "hi"])
+
+        assert result.exit_code == 0
+        assert "Use [bold] here" in result.output
+
     def test_agent_run_not_found(self) -> None:
         """Test agent run with non-existent agent."""
         with patch("crowe_logic_cli.cli.agent.AGENTS_DIRS", []):
@@ -261,6 +673,528 @@ class TestAgentCommand:
         assert result.exit_code == 1
         assert "not found" in result.output.lower()
 
+    def test_find_agent_file_uses_index(self, tmp_path: Path) -> None:
+        """Test agent lookup resolves all naming layouts through the cached index."""
+        from crowe_logic_cli.cli.agent import _find_agent_file, invalidate_agents_cache
+
+        invalidate_agents_cache()
+        agents_dir = tmp_path / "agents"
+        (agents_dir / "reviewer").mkdir(parents=True)
+        (agents_dir / "plugin" / "agents").mkdir(parents=True)
+        (agents_dir / "top.md").write_text("# Top")
+        (agents_dir / "reviewer" / "agent.md").write_text("# Reviewer")
+        (agents_dir / "plugin" / "agents" / "nested.md").write_text("# Nested")
+        (agents_dir / "plugin" / "helper-agent.md").write_text("# Helper")
+        index_file = tmp_path / "cache" / "agent_index.json"
+
+        with patch("crowe_logic_cli.cli.agent.AGENTS_DIRS", [agents_dir]), patch(
+            "crowe_logic_cli.cli.agent._agent_index_file", return_value=index_file
+        ):
+            assert _find_agent_file("top") == agents_dir / "top.md"
+            assert _find_agent_file("reviewer") == agents_dir / "reviewer" / "agent.md"
+            assert _find_agent_file("nested") == agents_dir / "plugin" / "agents" / "nested.md"
+            assert _find_agent_file("helper") == agents_dir / "plugin" / "helper-agent.md"
+            assert index_file.exists()
+
+            # Nested additions don't change the root mtime, but the next
+            # process re-walks once on a miss and finds them
+            (agents_dir / "plugin" / "late.md").write_text("# Late")
+            invalidate_agents_cache()
+            assert _find_agent_file("late") == agents_dir / "plugin" / "late.md"
+            assert _find_agent_file("missing") is None
+            invalidate_agents_cache()
+
+    def test_find_agent_file_misses_walk_each_dir_once(self, tmp_path: Path) -> None:
+        """Test later roots are checked from cache and misses don't re-walk."""
+        from crowe_logic_cli.cli import agent as agent_module
+
+        agents_dir = tmp_path / "agents"
+        plugins_dir = tmp_path / "plugins"
+        agents_dir.mkdir()
+        plugins_dir.mkdir()
+        (plugins_dir / "helper.md").write_text("# Helper")
+        index_file = tmp_path / "cache" / "agent_index.json"
+
+        with patch("crowe_logic_cli.cli.agent.AGENTS_DIRS", [agents_dir, plugins_dir]), patch(
+            "crowe_logic_cli.cli.agent._agent_index_file", return_value=index_file
+        ), patch(
+            "crowe_logic_cli.cli.agent._build_agent_index",
+            wraps=agent_module._build_agent_index,
+        ) as build:
+            agent_module.invalidate_agents_cache()
+            assert agent_module._find_agent_file("helper") == plugins_dir / "helper.md"
+            assert agent_module._find_agent_file("helper") == plugins_dir / "helper.md"
+            assert agent_module._find_agent_file("missing") is None
+            assert agent_module._find_agent_file("other") is None
+            assert build.call_count == 2
+
+            # A cached path that has disappeared forces a re-walk of its directory
+            (plugins_dir / "helper.md").unlink()
+            assert agent_module._find_agent_file("helper") is None
+            assert build.call_count == 3
+            agent_module.invalidate_agents_cache()
+
+    def test_find_agent_file_aliases_and_memo(self, tmp_path: Path) -> None:
+        """Test underscore aliases resolve and the in-process index is reused."""
+        from crowe_logic_cli.cli import agent as agent_module
+
+        agents_dir = tmp_path / "agents"
+        agents_dir.mkdir()
+        (agents_dir / "code-reviewer.md").write_text("# Reviewer")
+        index_file = tmp_path / "cache" / "agent_index.json"
+
+        with patch("crowe_logic_cli.cli.agent.AGENTS_DIRS", [agents_dir]), patch(
+            "crowe_logic_cli.cli.agent._agent_index_file", return_value=index_file
+        ):
+            agent_module.invalidate_agents_cache()
+            assert agent_module._find_agent_file("code_reviewer") == agents_dir / "code-reviewer.md"
+
+            # Second lookup is served from memory without touching the disk cache
+            index_file.unlink()
+            assert agent_module._find_agent_file("code-reviewer") == agents_dir / "code-reviewer.md"
+            assert not index_file.exists()
+            agent_module.invalidate_agents_cache()
+
+
+class TestCodeCommand:
+    """Test code analysis commands."""
+
+    def test_code_explain_rejects_binary_file(self, tmp_path: Path) -> None:
+        """Test code explain refuses to send binary content to the model."""
+        blob = tmp_path / "blob.bin"
+        blob.write_bytes(b"\x00\x01\x02")
+
+        with patch("crowe_logic_cli.providers.factory.create_provider") as mock_factory:
+            result = runner.invoke(app, ["code", "explain", str(blob)])
+
+        assert result.exit_code == 1
+        assert "binary" in result.output
+        mock_factory.assert_not_called()
+
+    def test_code_commands_reuse_provider(self, tmp_path: Path) -> None:
+        """Test the provider is created once and shared across commands."""
+        from crowe_logic_cli.providers.factory import get_shared_provider
+
+        source = tmp_path / "hello.py"
+        source.write_text("print('hi')\n")
+
+        get_shared_provider.cache_clear()
+        try:
+            with patch(
+                "crowe_logic_cli.cli.code.load_config",
+                return_value=AppConfig(provider="openai_compatible"),
+            ), patch("crowe_logic_cli.providers.factory.create_provider") as mock_factory:
+                mock_factory.return_value.stream.return_value = iter(["ok"])
+                first = runner.invoke(app, ["code", "explain", str(source)])
+                mock_factory.return_value.stream.return_value = iter(["ok"])
+                second = runner.invoke(app, ["code", "review", str(source)])
+
+            assert first.exit_code == 0
+            assert second.exit_code == 0
+            mock_factory.assert_called_once()
+        finally:
+            get_shared_provider.cache_clear()
+
+    def test_code_explain_shows_markup_like_names_literally(self, tmp_path: Path) -> None:
+        """Test file names are not interpreted as Rich markup."""
+        from crowe_logic_cli.cli import code as code_module
+
+        source = tmp_path / "[red]x.py"
+        source.write_text("x = [1]\n")
+
+        with patch.object(code_module, "_stream", return_value=iter(["[b]raw[/b]"])):
+            result = runner.invoke(app, ["code", "explain", str(source)])
+
+        assert result.exit_code == 0
+        assert "Code Explanation: [red]x.py" in result.output
+        assert "[b]raw[/b]" in result.output
+
+    def test_code_generate_streams_to_output_file(self, tmp_path: Path) -> None:
+        """Test code generate writes streamed chunks to --output."""
+        from crowe_logic_cli.cli import code as code_module
+
+        target = tmp_path / "out.py"
+
+        with patch.object(code_module, "_stream", return_value=iter(["def f():\n", "    pass\n"])):
+            result = runner.invoke(app, ["code", "generate", "a stub", "--output", str(target)])
+
+        assert result.exit_code == 0
+        assert target.read_text(encoding="utf-8") == "def f():\n    pass\n"
+        assert "Code saved to" in result.output
+
+    def test_code_generate_keeps_output_file_when_stream_fails(self, tmp_path: Path) -> None:
+        """Test a failed stream leaves the existing --output file untouched."""
+        from crowe_logic_cli.cli import code as code_module
+
+        target = tmp_path / "out.py"
+        target.write_text("original\n")
+
+        def failing_stream():
+            yield "partial"
+            raise ConnectionError("dropped")
+
+        with patch.object(code_module, "_stream", return_value=failing_stream()):
+            result = runner.invoke(app, ["code", "generate", "a stub", "--output", str(target)])
+
+        assert result.exit_code != 0
+        assert target.read_text() == "original\n"
+        assert [p.name for p in tmp_path.iterdir()] == ["out.py"]
+
+
+class TestAskCommand:
+    """Test the ask command."""
+
+    def test_ask_sends_all_piped_input(self) -> None:
+        """Test piped input is read once and sent whole, however large."""
+        from crowe_logic_cli.cli import ask as ask_module
+
+        log = "E" * 100_000
+        with patch.object(ask_module, "get_provider_and_stream", return_value=iter(["ok"])) as mock_stream:
+            result = runner.invoke(app, ["ask"], input=log)
+
+        assert result.exit_code == 0
+        assert mock_stream.call_args.args[0] == log
+
+
+class TestAICLCommand:
+    """Test AICL orchestration commands."""
+
+    def test_interactive_shares_engine_across_commands(self) -> None:
+        """Test interactive mode reuses one engine and closes it on exit."""
+        engine = MagicMock()
+        engine.close = AsyncMock()
+
+        mock_debate = AsyncMock()
+
+        with patch("crowe_logic_cli.cli.aicl.get_engine", return_value=engine) as mock_get, patch.dict(
+            "crowe_logic_cli.cli.aicl._COMMANDS", {"/debate": (mock_debate, "topic")}
+        ):
+            result = runner.invoke(
+                app, ["aicl", "interactive"], input="/debate tabs\n/debate spaces\n/quit\n"
+            )
+
+        assert result.exit_code == 0
+        mock_get.assert_called_once()
+        assert [c.args for c in mock_debate.await_args_list] == [
+            (engine, "tabs"),
+            (engine, "spaces"),
+        ]
+        engine.close.assert_awaited_once()
+
+    def test_commands_share_event_loop(self) -> None:
+        """Test separate command runs reuse one event loop, each with a fresh engine."""
+        from crowe_logic_cli.cli import aicl as aicl_module
+
+        loops = []
+
+        async def body(engine: Any) -> None:
+            loops.append(asyncio.get_running_loop())
+
+        engines = [MagicMock(close=AsyncMock()), MagicMock(close=AsyncMock())]
+        with patch("crowe_logic_cli.cli.aicl.get_engine", side_effect=engines):
+            aicl_module._run(body)
+            aicl_module._run(body)
+
+        assert loops[0] is loops[1]
+        for engine in engines:
+            engine.close.assert_awaited_once()
+
+    def test_parallel_compares_first_response_per_model(self) -> None:
+        """Test the comparison skips errors and the evaluator's synthesis."""
+        from crowe_logic_cli.aicl import AICLConversation, AICLIntent, AICLMessage
+        from crowe_logic_cli.cli.aicl import _first_responses
+
+        conv = AICLConversation()
+        for model, intent, content in [
+            ("a", AICLIntent.ERROR, "boom"),
+            ("b", AICLIntent.RESPONSE, "answer b"),
+            ("c", AICLIntent.RESPONSE, "answer c"),
+            ("other", AICLIntent.RESPONSE, "not requested"),
+            ("b", AICLIntent.SYNTHESIS, "evaluation"),
+        ]:
+            conv.add_message(AICLMessage(sender_model=model, intent=intent, content=content))
+
+        assert _first_responses(conv, ["a", "b", "c"]) == {"b": "answer b", "c": "answer c"}
+
+    def test_interactive_ignores_unknown_and_empty_commands(self) -> None:
+        """Test interactive mode only dispatches known commands with an argument."""
+        engine = MagicMock()
+        engine.close = AsyncMock()
+        mock_debate = AsyncMock()
+
+        with patch("crowe_logic_cli.cli.aicl.get_engine", return_value=engine), patch.dict(
+            "crowe_logic_cli.cli.aicl._COMMANDS", {"/debate": (mock_debate, "topic")}
+        ):
+            result = runner.invoke(
+                app, ["aicl", "interactive"], input="/debate\n/unknown x\ndebate x\n/quit\n"
+            )
+
+        assert result.exit_code == 0
+        mock_debate.assert_not_awaited()
+        assert "Missing topic. Usage: /debate <topic>" in result.output
+        assert "Use a command like" in result.output
+
+
+class TestCostsCommand:
+    """Test the costs commands."""
+
+    def test_costs_without_usage_skips_tracker(self) -> None:
+        """Test costs commands short-circuit when nothing has been recorded."""
+        with patch("crowe_logic_cli.cli.costs.has_usage", return_value=False), patch(
+            "crowe_logic_cli.cli.costs.get_tracker"
+        ) as get_tracker:
+            today = runner.invoke(app, ["costs", "today"])
+            summary = runner.invoke(app, ["costs", "summary", "--output", "json"])
+
+        get_tracker.assert_not_called()
+        assert today.exit_code == 0
+        assert "No usage recorded yet" in today.output
+        assert summary.exit_code == 0
+        assert json.loads(summary.output)["request_count"] == 0
+
+
+class TestDomainCommands:
+    """Test the research/molecular/quantum commands."""
+
+    def test_research_summarize_streams_raw_chunks(self, tmp_path: Path) -> None:
+        """Test streamed output is written verbatim, without markup parsing."""
+        paper = tmp_path / "paper.txt"
+        paper.write_text("Abstract")
+        provider = MagicMock()
+        provider.stream.return_value = iter(["See ", "[bold]", " here"])
+
+        with patch(
+            "crowe_logic_cli.config.load_config",
+            return_value=AppConfig(provider="openai_compatible"),
+        ), patch(
+            "crowe_logic_cli.providers.factory.get_shared_provider", return_value=provider
+        ):
+            result = runner.invoke(app, ["research", "summarize", str(paper)])
+
+        assert result.exit_code == 0
+        assert "See [bold] here" in result.output
+
+    def test_research_summarize_sends_only_file_head(self, tmp_path: Path) -> None:
+        """Test only the first 8000 characters of the paper reach the prompt."""
+        paper = tmp_path / "paper.txt"
+        paper.write_text("a" * 8000 + "TAIL")
+        provider = MagicMock()
+        provider.stream.return_value = iter([])
+
+        with patch(
+            "crowe_logic_cli.config.load_config",
+            return_value=AppConfig(provider="openai_compatible"),
+        ), patch(
+            "crowe_logic_cli.providers.factory.get_shared_provider", return_value=provider
+        ):
+            result = runner.invoke(app, ["research", "summarize", str(paper)])
+
+        assert result.exit_code == 0
+        prompt = provider.stream.call_args[0][0][0]["content"]
+        assert "a" * 8000 in prompt
+        assert "TAIL" not in prompt
+
+    def test_quantum_title_shows_user_text_literally(self) -> None:
+        """Test user input echoed in the title panel is not parsed as markup."""
+        provider = MagicMock()
+        provider.stream.return_value = iter(["answer"])
+
+        with patch(
+            "crowe_logic_cli.config.load_config",
+            return_value=AppConfig(provider="openai_compatible"),
+        ), patch(
+            "crowe_logic_cli.providers.factory.get_shared_provider", return_value=provider
+        ):
+            result = runner.invoke(app, ["quantum", "vqe", "[red]H2"])
+
+        assert result.exit_code == 0
+        assert "VQE Analysis: [red]H2" in result.output
+        prompt = provider.stream.call_args[0][0][0]["content"]
+        assert prompt.startswith("Explain how to apply VQE")
+        assert "[red]H2" in prompt
+
+    def test_quantum_algorithm_reuses_saved_answer(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test reference commands answer repeats from the cache unless --no-cache."""
+        monkeypatch.delenv("CROWE_CACHE", raising=False)
+        provider = MagicMock()
+        provider.stream.side_effect = lambda messages: iter(["Grover ", "search"])
+
+        with patch("crowe_logic_cli.cache.Path.home", return_value=tmp_path), patch(
+            "crowe_logic_cli.config.load_config",
+            return_value=AppConfig(provider="openai_compatible"),
+        ), patch(
+            "crowe_logic_cli.providers.factory.get_shared_provider", return_value=provider
+        ):
+            first = runner.invoke(app, ["quantum", "algorithm", "grover"])
+            second = runner.invoke(app, ["quantum", "algorithm", "grover"])
+            assert provider.stream.call_count == 1
+            runner.invoke(app, ["quantum", "algorithm", "grover", "--no-cache"])
+            assert provider.stream.call_count == 2
+
+        assert "Grover search" in first.output
+        assert "Grover search" in second.output
+
+
+class TestSelectCommand:
+    """Test the select (clipboard) commands."""
+
+    def test_select_transform_streams_and_copies_full_result(self) -> None:
+        """Test transform writes chunks raw and copies the joined result."""
+        provider = MagicMock()
+        provider.stream.return_value = iter(["x = ", "[1]", "\n"])
+
+        with patch(
+            "crowe_logic_cli.cli.select.get_clipboard_content", return_value="x=[1]"
+        ), patch(
+            "crowe_logic_cli.cli.select.set_clipboard_content", return_value=True
+        ) as copy, patch(
+            "crowe_logic_cli.config.load_config",
+            return_value=AppConfig(provider="openai_compatible"),
+        ), patch(
+            "crowe_logic_cli.providers.factory.get_shared_provider", return_value=provider
+        ):
+            result = runner.invoke(app, ["select", "transform", "format it", "--copy"])
+
+        assert result.exit_code == 0
+        assert "x = [1]" in result.output
+        copy.assert_called_once_with("x = [1]\n")
+
+    def test_select_diff_output_is_not_parsed_as_markup(self) -> None:
+        """Test model text reaches the terminal verbatim, brackets included."""
+        provider = MagicMock()
+        provider.stream.return_value = iter(["Renamed ", "[bold]x[/bold]", " to y\n"])
+
+        with patch(
+            "crowe_logic_cli.cli.select.get_clipboard_content", return_value="-x\n+y"
+        ), patch(
+            "crowe_logic_cli.config.load_config",
+            return_value=AppConfig(provider="openai_compatible"),
+        ), patch(
+            "crowe_logic_cli.providers.factory.get_shared_provider", return_value=provider
+        ):
+            result = runner.invoke(app, ["select", "diff"])
+
+        assert result.exit_code == 0
+        assert "Renamed [bold]x[/bold] to y" in result.output
+
+    def test_select_clipboard_prefers_pyperclip(self) -> None:
+        """Test pyperclip is used when installed, without a subprocess."""
+        from crowe_logic_cli.cli import select
+
+        clip = MagicMock()
+        clip.paste.return_value = "pasted"
+        with patch.object(select, "pyperclip", clip), patch("subprocess.run") as run:
+            assert select.get_clipboard_content() == "pasted"
+            assert select.set_clipboard_content("it's") is True
+
+        clip.copy.assert_called_once_with("it's")
+        run.assert_not_called()
+
+    def test_select_windows_copy_passes_content_on_stdin(self) -> None:
+        """Test the PowerShell fallback never puts content on the command line."""
+        from crowe_logic_cli.cli import select
+
+        with patch.object(select, "pyperclip", None), patch("sys.platform", "win32"), \
+                patch("subprocess.run") as run:
+            assert select.set_clipboard_content("'; rm -rf / #") is True
+
+        args, kwargs = run.call_args
+        assert "rm -rf" not in " ".join(args[0])
+        assert kwargs["input"] == "'; rm -rf / #"
+
+
+class TestMcpCommand:
+    """Test the MCP stdio server."""
+
+    def test_serve_reuses_one_provider_across_calls(self) -> None:
+        """Test tool calls share one provider and responses go to stdout as JSON."""
+        provider = MagicMock()
+        provider.chat_completion_stream.side_effect = lambda messages: iter(["ok"])
+        call = {
+            "jsonrpc": "2.0",
+            "method": "tools/call",
+            "params": {"name": "code_review", "arguments": {"code": "x = 1"}},
+        }
+        requests = "".join(json.dumps({**call, "id": i}) + "\n" for i in (1, 2))
+
+        with patch("crowe_logic_cli.config.load_config", return_value=MagicMock()), patch(
+            "crowe_logic_cli.providers.factory.create_provider", return_value=provider
+        ) as create:
+            result = runner.invoke(app, ["mcp", "serve"], input=requests)
+
+        assert result.exit_code == 0
+        create.assert_called_once()
+        responses = [
+            json.loads(line) for line in result.stdout.splitlines() if line.startswith("{")
+        ]
+        assert [r["id"] for r in responses] == [1, 2]
+        assert responses[0]["result"]["content"][0]["text"] == "ok"
+
+    def test_serve_skips_malformed_lines_and_keeps_unicode(self) -> None:
+        """Test bad JSON lines are ignored and non-ASCII text is written as UTF-8."""
+        provider = MagicMock()
+        provider.chat_completion_stream.return_value = iter(["café ✓"])
+        call = {
+            "jsonrpc": "2.0", "id": 7, "method": "tools/call",
+            "params": {"name": "quantum_reason", "arguments": {"problem": "π"}},
+        }
+
+        with patch("crowe_logic_cli.config.load_config", return_value=MagicMock()), patch(
+            "crowe_logic_cli.providers.factory.create_provider", return_value=provider
+        ):
+            result = runner.invoke(
+                app, ["mcp", "serve"], input="{not json\n" + json.dumps(call) + "\n"
+            )
+
+        assert result.exit_code == 0
+        responses = [
+            json.loads(line) for line in result.stdout.splitlines() if line.startswith("{")
+        ]
+        assert [r["id"] for r in responses] == [7]
+        assert responses[0]["result"]["content"][0]["text"] == "café ✓"
+        assert "café ✓" in result.stdout  # written as UTF-8, not \u escapes
+        sent = provider.chat_completion_stream.call_args[0][0][0]["content"]
+        assert sent.endswith("π")
+
+    def test_serve_sends_progress_when_token_given(self) -> None:
+        """Test a progress token gets one notification per chunk before the result."""
+        provider = MagicMock()
+        provider.chat_completion_stream.return_value = iter(["a", "b"])
+        call = {
+            "jsonrpc": "2.0", "id": 3, "method": "tools/call",
+            "params": {
+                "name": "code_review",
+                "arguments": {"code": "x"},
+                "_meta": {"progressToken": "tok"},
+            },
+        }
+
+        with patch("crowe_logic_cli.config.load_config", return_value=MagicMock()), patch(
+            "crowe_logic_cli.providers.factory.create_provider", return_value=provider
+        ):
+            result = runner.invoke(app, ["mcp", "serve"], input=json.dumps(call) + "\n")
+
+        messages = [
+            json.loads(line) for line in result.stdout.splitlines() if line.startswith("{")
+        ]
+        assert [m.get("method") for m in messages] == [
+            "notifications/progress", "notifications/progress", None
+        ]
+        assert [m["params"]["progress"] for m in messages[:2]] == [1, 2]
+        assert messages[0]["params"]["progressToken"] == "tok"
+        assert messages[2]["result"]["content"][0]["text"] == "ab"
+
+    def test_read_lines_reassembles_split_messages(self) -> None:
+        """Test messages split across reads are rejoined, including a final unterminated one."""
+        from crowe_logic_cli.cli.mcp import _read_lines
+
+        stream = io.BytesIO(b'{"id": 1}\n{"id": 2}\n\n{"id": 3}')
+        lines = [bytes(line) for line in _read_lines(stream, chunk_size=4)]
+
+        assert lines == [b'{"id": 1}', b'{"id": 2}', b"", b'{"id": 3}']
+
 
 class TestHelpCommands:
     """Test help and usage information."""
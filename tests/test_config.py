@@ -15,9 +15,12 @@ from crowe_logic_cli.config import (
     load_config,
 )
 from crowe_logic_cli.config_file import (
+    tomllib,
     get_config_value,
     load_config_file,
     _find_config_file,
+    home_config_path,
+    write_config_file,
 )
 
 
@@ -136,6 +139,19 @@ class TestOpenAICompatibleConfig:
         with pytest.raises(ValueError, match="Missing required config for openai_compatible"):
             load_config()
 
+    def test_missing_fields_reported_together(self, mock_env_clean: None) -> None:
+        """Test every missing field is named in one error, in declaration order."""
+        os.environ["CROWE_PROVIDER"] = "openai_compatible"
+        os.environ["CROWE_OPENAI_API_KEY"] = "sk-test"
+
+        with pytest.raises(ValueError) as excinfo:
+            load_config()
+
+        assert str(excinfo.value).endswith(
+            "openai_compatible.base_url / CROWE_OPENAI_BASE_URL, "
+            "openai_compatible.model / CROWE_OPENAI_MODEL"
+        )
+
 
 class TestConfigFile:
     """Test config file loading and parsing."""
@@ -171,9 +187,13 @@ class TestConfigFile:
         empty_dir = tmp_path / "empty"
         empty_dir.mkdir()
 
-        with patch("crowe_logic_cli.config_file.Path.cwd", return_value=empty_dir):
-            with patch("crowe_logic_cli.config_file.Path.home", return_value=tmp_path):
-                found = _find_config_file()
+        home_config_path.cache_clear()
+        try:
+            with patch("crowe_logic_cli.config_file.Path.cwd", return_value=empty_dir):
+                with patch("crowe_logic_cli.config_file.Path.home", return_value=tmp_path):
+                    found = _find_config_file()
+        finally:
+            home_config_path.cache_clear()
 
         assert found is None
 
@@ -184,6 +204,97 @@ class TestConfigFile:
 
         assert result == {}
 
+    def test_load_config_file_parses_once_until_changed(
+        self, temp_config_dir: Path, sample_config_toml: str
+    ) -> None:
+        """Test repeated lookups reuse the parsed file until it is rewritten."""
+        config_file = temp_config_dir / ".crowelogic.toml"
+        config_file.write_text(sample_config_toml)
+
+        with patch("crowe_logic_cli.config_file._find_config_file", return_value=config_file), \
+                patch("crowe_logic_cli.config_file.tomllib.load", wraps=tomllib.load) as parse:
+            assert get_config_value("azure.deployment", "CROWE_UNSET_TEST_VAR") == "gpt-4"
+            assert get_config_value("azure.endpoint", "CROWE_UNSET_TEST_VAR")
+            assert parse.call_count == 1
+
+            config_file.write_text(sample_config_toml.replace("gpt-4", "gpt-4o"))
+            assert get_config_value("azure.deployment", "CROWE_UNSET_TEST_VAR") == "gpt-4o"
+            assert parse.call_count == 2
+
+
+class TestWriteConfigFile:
+    """Test exclusive config file creation."""
+
+    def test_creates_private_file(self, tmp_path: Path) -> None:
+        """Test a new config file is written with owner-only permissions."""
+        path = tmp_path / ".crowelogic.toml"
+        write_config_file(path, 'provider = "azure"\n')
+
+        assert path.read_text() == 'provider = "azure"\n'
+        if os.name == "posix":
+            assert path.stat().st_mode & 0o777 == 0o600
+
+    def test_existing_file_requires_overwrite(self, tmp_path: Path) -> None:
+        """Test an existing file is left alone unless overwrite is requested."""
+        path = tmp_path / ".crowelogic.toml"
+        path.write_text("original contents that are longer\n")
+
+        with pytest.raises(FileExistsError):
+            write_config_file(path, "new\n")
+        assert path.read_text() == "original contents that are longer\n"
+
+        write_config_file(path, "new\n", overwrite=True)
+        assert path.read_text() == "new\n"
+
+    def test_overwrite_replaces_file_privately(self, tmp_path: Path) -> None:
+        """Test overwriting swaps in a 0600 file and leaves no temp file behind."""
+        path = tmp_path / ".crowelogic.toml"
+        path.write_text("old\n")
+
+        write_config_file(path, "new\n", overwrite=True)
+
+        assert path.read_text() == "new\n"
+        assert [p.name for p in tmp_path.iterdir()] == [".crowelogic.toml"]
+        if os.name == "posix":
+            assert path.stat().st_mode & 0o777 == 0o600
+
+
+class TestConfigCache:
+    """Test load_config caching."""
+
+    def test_cached_until_env_or_file_changes(
+        self, mock_env_clean: None, temp_config_dir: Path, sample_config_toml: str
+    ) -> None:
+        """Test load_config reuses its result until an input changes."""
+        config_file = temp_config_dir / ".crowelogic.toml"
+        config_file.write_text(sample_config_toml)
+
+        with patch("crowe_logic_cli.config_file._find_config_file", return_value=config_file):
+            first = load_config()
+            assert load_config() is first
+
+            os.environ["CROWE_AZURE_DEPLOYMENT"] = "gpt-4o"
+            second = load_config()
+            assert second.azure is not None
+            assert second.azure.deployment == "gpt-4o"
+
+            del os.environ["CROWE_AZURE_DEPLOYMENT"]
+            config_file.write_text(sample_config_toml.replace("gpt-4", "gpt-35-turbo"))
+            third = load_config()
+            assert third.azure is not None
+            assert third.azure.deployment == "gpt-35-turbo"
+
+    def test_cache_clear_forces_reload(self, mock_env_clean: None) -> None:
+        """Test load_config.cache_clear drops cached results."""
+        os.environ["CROWE_PROVIDER"] = "openai_compatible"
+        os.environ["CROWE_OPENAI_BASE_URL"] = "https://api.openai.com/v1"
+        os.environ["CROWE_OPENAI_API_KEY"] = "sk-test"
+        os.environ["CROWE_OPENAI_MODEL"] = "gpt-4"
+
+        first = load_config()
+        load_config.cache_clear()
+        assert load_config() is not first
+
 
 class TestConfigValue:
     """Test get_config_value precedence."""
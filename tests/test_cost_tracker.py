@@ -1,6 +1,7 @@
 """Tests for cost tracking."""
 import json
 import tempfile
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
@@ -11,6 +12,7 @@ from crowe_logic_cli.cost_tracker import (
     UsageSummary,
     calculate_cost,
     get_model_pricing,
+    has_usage,
 )
 
 
@@ -27,6 +29,10 @@ class TestGetModelPricing:
         pricing = get_model_pricing("gpt-4-0613")
         assert pricing["input"] == 30.00
 
+    def test_partial_match_prefers_longest_name(self):
+        assert get_model_pricing("gpt-4o-mini-2024-07-18")["input"] == 0.15
+        assert get_model_pricing("Azure/GPT-4o-2024-08-06")["input"] == 2.50
+
     def test_default_fallback(self):
         pricing = get_model_pricing("unknown-model-xyz")
         assert pricing["input"] == 3.00  # default
@@ -134,6 +140,26 @@ class TestCostTracker:
         assert "gpt-4" in summary.by_model
         assert "gpt-3.5-turbo" in summary.by_model
 
+    def test_summary_window_and_days(self, tmp_path):
+        now = datetime.now(timezone.utc)
+        records = [
+            UsageRecord((now - timedelta(days=age)).isoformat(), "gpt-4", "azure", 10, 20, 0.01)
+            for age in (0, 0, 3, 40)
+        ]
+        records.append(UsageRecord("not a timestamp", "gpt-4", "azure", 10, 20, 0.01))
+        (tmp_path / "usage.jsonl").write_text(
+            "".join(json.dumps(r.to_dict()) + "\n" for r in records)
+        )
+        tracker = CostTracker(data_dir=tmp_path)
+
+        assert tracker.get_summary().request_count == 4
+        week = tracker.get_summary(days=7)
+        assert week.request_count == 3
+        assert week.by_day[records[0].timestamp[:10]]["count"] == 2
+        assert week.by_model["gpt-4"]["count"] == 3
+        assert week.by_model["gpt-4"]["input_tokens"] == 30
+        assert type(week.by_model) is dict
+
     def test_clear(self, temp_tracker):
         temp_tracker.record("gpt-4", "azure", 100, 200)
         assert temp_tracker.get_summary().request_count == 1
@@ -152,3 +178,103 @@ class TestCostTracker:
 
         assert summary.request_count == 1
         assert summary.total_input_tokens == 100
+
+    def test_record_appends_one_line(self, tmp_path):
+        tracker = CostTracker(data_dir=tmp_path)
+        tracker.record("gpt-4", "azure", 100, 200)
+        tracker.record("gpt-4", "azure", 300, 400)
+
+        lines = (tmp_path / "usage.jsonl").read_text().splitlines()
+        assert [json.loads(line)["input_tokens"] for line in lines] == [100, 300]
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_log_round_trips_with_and_without_orjson(self, tmp_path, monkeypatch, use_orjson):
+        from crowe_logic_cli import jsonutil
+
+        if not use_orjson:
+            monkeypatch.setattr(jsonutil, "orjson", None)
+        elif jsonutil.orjson is None:
+            pytest.skip("orjson not installed")
+
+        CostTracker(data_dir=tmp_path).record("gpt-4", "azure", 100, 200, command="café")
+
+        line = (tmp_path / "usage.jsonl").read_bytes()
+        assert line.endswith(b"}\n") and b", " not in line
+        record = CostTracker(data_dir=tmp_path)._get_records()[0]
+        assert (record.input_tokens, record.command) == (100, "café")
+
+    def test_unserializable_record_leaves_no_log(self, tmp_path):
+        tracker = CostTracker(data_dir=tmp_path)
+        with pytest.raises(TypeError):
+            tracker.record("gpt-4", object(), 100, 200)  # type: ignore[arg-type]
+
+        assert not (tmp_path / "usage.jsonl").exists()
+
+    def test_torn_line_is_skipped(self, tmp_path):
+        CostTracker(data_dir=tmp_path).record("gpt-4", "azure", 100, 200)
+        with open(tmp_path / "usage.jsonl", "a") as f:
+            f.write('{"timestamp": "2026-')
+
+        assert CostTracker(data_dir=tmp_path).get_summary().request_count == 1
+
+    def test_record_after_torn_line_starts_a_new_line(self, tmp_path):
+        CostTracker(data_dir=tmp_path).record("gpt-4", "azure", 100, 200)
+        with open(tmp_path / "usage.jsonl", "a") as f:
+            f.write('{"timestamp": "2026-')
+
+        CostTracker(data_dir=tmp_path).record("gpt-4", "azure", 100, 200)
+
+        assert CostTracker(data_dir=tmp_path).get_summary().request_count == 2
+
+    def test_migrates_legacy_store(self, tmp_path):
+        record = UsageRecord("2026-01-14T12:00:00+00:00", "gpt-4", "azure", 100, 200, 0.015)
+        (tmp_path / "usage.json").write_text(json.dumps({"records": [record.to_dict()]}))
+
+        tracker = CostTracker(data_dir=tmp_path)
+
+        assert tracker.get_summary().total_input_tokens == 100
+        assert not (tmp_path / "usage.json").exists()
+        assert CostTracker(data_dir=tmp_path).get_summary().request_count == 1
+
+    def test_record_does_not_read_the_log(self, tmp_path, monkeypatch):
+        CostTracker(data_dir=tmp_path).record("gpt-4", "azure", 100, 200)
+
+        tracker = CostTracker(data_dir=tmp_path)
+        monkeypatch.setattr(tracker, "_load", lambda: pytest.fail("log was read"))
+        tracker.record("gpt-4", "azure", 300, 400)
+
+        assert CostTracker(data_dir=tmp_path).get_summary().request_count == 2
+
+    def test_summary_reloads_only_when_log_changes(self, tmp_path):
+        tracker = CostTracker(data_dir=tmp_path)
+        tracker.record("gpt-4", "azure", 100, 200)
+        assert tracker.get_summary().request_count == 1
+        records = tracker._records
+
+        tracker.record("gpt-4", "azure", 100, 200)
+        assert tracker.get_summary().request_count == 2
+        assert tracker._records is records
+
+        CostTracker(data_dir=tmp_path).record("gpt-4", "azure", 100, 200)
+        assert tracker.get_summary().request_count == 3
+
+
+class TestHasUsage:
+    """Tests for the cheap has_usage check."""
+
+    def test_missing_store(self, tmp_path):
+        assert has_usage(tmp_path) is False
+
+    def test_empty_and_cleared_store(self, tmp_path):
+        tracker = CostTracker(data_dir=tmp_path)
+        tracker.record("gpt-4", "azure", 100, 200)
+        assert has_usage(tmp_path) is True
+        assert tracker.is_empty() is False
+
+        tracker.clear()
+        assert has_usage(tmp_path) is False
+        assert tracker.is_empty() is True
+
+    def test_corrupt_store(self, tmp_path):
+        (tmp_path / "usage.json").write_text("{not json")
+        assert has_usage(tmp_path) is False
@@ -0,0 +1,40 @@
+"""Tests for connection error diagnostics."""
+from __future__ import annotations
+
+import io
+
+import pytest
+from rich.console import Console
+
+from crowe_logic_cli import diagnostics
+
+
+@pytest.fixture
+def captured(monkeypatch: pytest.MonkeyPatch) -> io.StringIO:
+    out = io.StringIO()
+    monkeypatch.setattr(diagnostics, "console", Console(file=out, width=200))
+    return out
+
+
+class TestDiagnoseConnectionError:
+    """Tests for diagnose_connection_error."""
+
+    def test_first_matching_category_wins(self, captured: io.StringIO) -> None:
+        # "404" is checked before "timeout"
+        diagnostics.diagnose_connection_error(
+            RuntimeError("404 after timeout"), "https://x", "azure"
+        )
+
+        text = captured.getvalue()
+        assert "404 Not Found" in text
+        assert "Current endpoint: https://x" in text
+        assert "openai.azure.com" in text
+        assert "timed out" not in text
+
+    def test_unmatched_error_gets_debugging_steps(self, captured: io.StringIO) -> None:
+        diagnostics.diagnose_connection_error(RuntimeError("boom"), "https://x", "azure")
+
+        text = captured.getvalue()
+        assert "Unexpected error" in text
+        assert "Debugging steps:" in text
+        assert "1. Run crowelogic doctor run" in text
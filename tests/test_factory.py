@@ -9,7 +9,11 @@ from crowe_logic_cli.config import (
     AzureAIInferenceConfig,
     OpenAICompatibleConfig,
 )
-from crowe_logic_cli.providers.factory import create_provider, _is_claude_deployment
+from crowe_logic_cli.providers.factory import (
+    create_provider,
+    get_shared_provider,
+    _is_claude_deployment,
+)
 from crowe_logic_cli.providers.azure_openai import AzureOpenAIProvider
 from crowe_logic_cli.providers.azure_anthropic import AzureAnthropicProvider
 from crowe_logic_cli.providers.azure_ai_inference import AzureAIInferenceProvider
@@ -165,3 +169,21 @@ class TestUnsupportedProvider:
 
         with pytest.raises(ValueError, match="Unsupported provider"):
             create_provider(config)
+
+
+class TestSharedProvider:
+    """Test process-wide provider reuse."""
+
+    def test_equal_configs_share_a_provider(self) -> None:
+        """Test get_shared_provider returns one instance per config value."""
+        def make(model: str) -> AppConfig:
+            return AppConfig(
+                provider="openai_compatible",
+                openai_compatible=OpenAICompatibleConfig(
+                    base_url="https://api.openai.com/v1", model=model, api_key="sk-test"
+                ),
+            )
+
+        first = get_shared_provider(make("gpt-4-turbo"))
+        assert get_shared_provider(make("gpt-4-turbo")) is first
+        assert get_shared_provider(make("gpt-4o")) is not first
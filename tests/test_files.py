@@ -0,0 +1,69 @@
+"""Tests for file reading helpers."""
+from pathlib import Path
+from unittest.mock import patch
+
+from crowe_logic_cli.files import looks_binary, read_head, truncate_to_tokens
+
+
+class TestReadHead:
+    """Tests for read_head."""
+
+    def test_reads_only_prefix(self, tmp_path: Path) -> None:
+        path = tmp_path / "big.py"
+        path.write_text("x" * 10_000)
+        assert read_head(path, 6000) == "x" * 6000
+
+    def test_short_file_returned_whole(self, tmp_path: Path) -> None:
+        path = tmp_path / "small.py"
+        path.write_text("print('hi')\n")
+        assert read_head(path, 6000) == "print('hi')\n"
+
+    def test_limit_counts_characters_not_bytes(self, tmp_path: Path) -> None:
+        path = tmp_path / "paper.txt"
+        path.write_text("é" * 10_000 + "tail", encoding="utf-8")
+        assert read_head(path, 5000) == "é" * 5000
+
+    def test_invalid_utf8_is_replaced(self, tmp_path: Path) -> None:
+        path = tmp_path / "latin1.txt"
+        path.write_bytes(b"caf\xe9")
+        assert read_head(path, 100) == "caf�"
+
+
+class TestLooksBinary:
+    """Tests for looks_binary."""
+
+    def test_text(self) -> None:
+        assert not looks_binary("def main():\n    pass\n")
+
+    def test_nul_bytes(self, tmp_path: Path) -> None:
+        path = tmp_path / "blob.bin"
+        path.write_bytes(b"\x7fELF\x00\x00\x01")
+        assert looks_binary(read_head(path, 100))
+
+
+class _WordEncoding:
+    """Stand-in tokenizer: one token per space-separated word."""
+
+    def encode(self, text: str, disallowed_special: tuple = ()) -> list:
+        return text.split(" ")
+
+    def decode(self, tokens: list) -> str:
+        return " ".join(tokens)
+
+
+class TestTruncateToTokens:
+    """Tests for truncate_to_tokens."""
+
+    def test_short_text_is_not_encoded(self) -> None:
+        with patch("crowe_logic_cli.files._token_encoding") as encoding:
+            assert truncate_to_tokens("tiny", 10) == "tiny"
+        encoding.assert_not_called()
+
+    def test_falls_back_to_characters_without_tokenizer(self) -> None:
+        with patch("crowe_logic_cli.files._token_encoding", return_value=None):
+            assert truncate_to_tokens("é" * 100, 10) == "é" * 40
+
+    def test_cuts_on_token_boundaries(self) -> None:
+        with patch("crowe_logic_cli.files._token_encoding", return_value=_WordEncoding()):
+            assert truncate_to_tokens("alpha beta gamma delta", 2) == "alpha beta"
+            assert truncate_to_tokens("alpha beta gamma", 3) == "alpha beta gamma"
@@ -4,15 +4,17 @@ from __future__ import annotations
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterator
 from unittest.mock import patch
 
 import pytest
 
+from crowe_logic_cli.cli import history
 from crowe_logic_cli.cli.history import (
     get_history_dir,
     save_conversation,
     load_conversation,
+    trim_context,
 )
 from crowe_logic_cli.providers.base import Message
 
@@ -20,6 +22,12 @@ from crowe_logic_cli.providers.base import Message
 class TestHistoryDir:
     """Test history directory management."""
 
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self) -> Iterator[None]:
+        get_history_dir.cache_clear()
+        yield
+        get_history_dir.cache_clear()
+
     def test_get_history_dir_creates_directory(self, tmp_path: Path) -> None:
         """Test that get_history_dir creates the directory if it doesn't exist."""
         home = tmp_path / "home"
@@ -40,6 +48,15 @@ class TestHistoryDir:
 
         assert history_dir == temp_history_dir
 
+    def test_get_history_dir_resolved_once(self, tmp_path: Path) -> None:
+        """Test that the directory is resolved and created only once per process."""
+        with patch("crowe_logic_cli.cli.history.Path.home", return_value=tmp_path) as home:
+            first = get_history_dir()
+            second = get_history_dir()
+
+        assert first is second
+        assert home.call_count == 1
+
 
 class TestSaveConversation:
     """Test conversation saving."""
@@ -58,13 +75,82 @@ class TestSaveConversation:
             filepath = save_conversation(messages, "test-conversation")
 
         assert filepath.exists()
-        assert filepath.name == "test-conversation.json"
+        assert filepath.name == "test-conversation.jsonl"
 
         with open(filepath) as f:
-            data = json.load(f)
+            header, *lines = [json.loads(line) for line in f]
+
+        assert lines == messages
+        assert header["schema"] == "jsonl-v1"
+        assert "timestamp" in header
+
+        meta = json.loads((temp_history_dir / "test-conversation.meta.json").read_text())
+        assert meta["count"] == len(messages)
+        assert "timestamp" in meta
+
+    def test_save_conversation_appends_new_messages(self, temp_history_dir: Path) -> None:
+        """Test that re-saving the same list only appends what was added."""
+        messages: list[Message] = [{"role": "user", "content": "Hello!"}]
+
+        with patch(
+            "crowe_logic_cli.cli.history.get_history_dir", return_value=temp_history_dir
+        ):
+            filepath = save_conversation(messages, "growing")
+            header = filepath.read_text().splitlines()[0]
+
+            messages.append({"role": "assistant", "content": "Hi there!"})
+            with patch.object(history, "dump_line", wraps=history.dump_line) as dump:
+                save_conversation(messages, "growing")
+
+        # One line for the new message, one for the metadata sidecar
+        assert dump.call_count == 2
+        lines = filepath.read_text().splitlines()
+        assert lines[0] == header
+        assert [json.loads(line) for line in lines[1:]] == messages
+
+    def test_save_conversation_rewrites_different_list(self, temp_history_dir: Path) -> None:
+        """Test that saving a new list under an existing name replaces the file."""
+        with patch(
+            "crowe_logic_cli.cli.history.get_history_dir", return_value=temp_history_dir
+        ):
+            save_conversation([{"role": "user", "content": "Old"}], "reused")
+            fresh: list[Message] = [{"role": "user", "content": "New"}]
+            save_conversation(fresh, "reused")
+            loaded = load_conversation("reused")
+
+        assert loaded == fresh
+
+    def test_save_conversation_leaves_no_temp_files(self, temp_history_dir: Path) -> None:
+        """Test that rewrites go through a temp file that is renamed into place."""
+        with patch(
+            "crowe_logic_cli.cli.history.get_history_dir", return_value=temp_history_dir
+        ):
+            save_conversation([{"role": "user", "content": "Old"}], "atomic")
+            save_conversation([{"role": "user", "content": "New"}], "atomic")
+
+        assert sorted(p.name for p in temp_history_dir.iterdir()) == [
+            "atomic.jsonl",
+            "atomic.meta.json",
+        ]
 
-        assert data["messages"] == messages
-        assert "timestamp" in data
+    def test_save_conversation_migrates_legacy_file(
+        self, temp_history_dir: Path, sample_conversation: Dict[str, Any]
+    ) -> None:
+        """Test that resaving a legacy JSON conversation converts it to JSONL."""
+        legacy = temp_history_dir / "legacy.json"
+        legacy.write_text(json.dumps(sample_conversation))
+
+        with patch(
+            "crowe_logic_cli.cli.history.get_history_dir", return_value=temp_history_dir
+        ):
+            messages = load_conversation("legacy")
+            messages.append({"role": "user", "content": "More"})
+            filepath = save_conversation(messages, "legacy")
+            loaded = load_conversation("legacy")
+
+        assert filepath.suffix == ".jsonl"
+        assert not legacy.exists()
+        assert loaded == sample_conversation["messages"] + [{"role": "user", "content": "More"}]
 
     def test_save_conversation_generates_name(self, temp_history_dir: Path) -> None:
         """Test saving a conversation without a name generates timestamp-based name."""
@@ -105,6 +191,32 @@ class TestSaveConversation:
 
         assert filepath.stem == "valid-name_123"
 
+    def test_save_conversation_keeps_unicode_letters(self, temp_history_dir: Path) -> None:
+        """Test that non-ASCII letters and digits survive sanitization."""
+        messages: list[Message] = [{"role": "user", "content": "Test"}]
+
+        with patch(
+            "crowe_logic_cli.cli.history.get_history_dir", return_value=temp_history_dir
+        ):
+            filepath = save_conversation(messages, "Grüße ✓ 名前.v2")
+
+        assert filepath.stem == "Grüße___名前_v2"
+
+    def test_save_conversation_without_orjson(self, temp_history_dir: Path) -> None:
+        """Test the stdlib fallback writes the same compact UTF-8 lines."""
+        messages: list[Message] = [{"role": "user", "content": "Grüße ✓"}]
+
+        with patch(
+            "crowe_logic_cli.cli.history.get_history_dir", return_value=temp_history_dir
+        ), patch("crowe_logic_cli.jsonutil.orjson", None):
+            filepath = save_conversation(messages, "stdlib")
+            loaded = load_conversation("stdlib")
+
+        assert loaded == messages
+        assert filepath.read_text(encoding="utf-8").splitlines()[1] == (
+            '{"role":"user","content":"Grüße ✓"}'
+        )
+
 
 class TestLoadConversation:
     """Test conversation loading."""
@@ -139,6 +251,88 @@ class TestLoadConversation:
 
         assert messages == sample_conversation["messages"]
 
+    def test_load_jsonl_conversation(self, temp_history_dir: Path) -> None:
+        """Test loading a JSONL file skips the header and blank lines."""
+        (temp_history_dir / "lines.jsonl").write_bytes(
+            b'{"timestamp":"2026-01-12T10:30:00","schema":"jsonl-v1"}\n'
+            b'{"role":"user","content":"Hello!"}\n'
+            b"\n"
+            b'{"role":"assistant","content":"Hi!"}\n'
+        )
+        (temp_history_dir / "empty.jsonl").write_bytes(
+            b'{"timestamp":"2026-01-12T10:30:00","schema":"jsonl-v1"}\n'
+        )
+
+        with patch(
+            "crowe_logic_cli.cli.history.get_history_dir", return_value=temp_history_dir
+        ):
+            assert load_conversation("lines") == [
+                {"role": "user", "content": "Hello!"},
+                {"role": "assistant", "content": "Hi!"},
+            ]
+            assert load_conversation("empty") == []
+            assert history._conversation_summary(temp_history_dir / "lines.jsonl") == (
+                "2026-01-12T10:30:00",
+                2,
+            )
+
+    def test_load_skips_torn_trailing_line(self, temp_history_dir: Path) -> None:
+        """Test that a line cut short by an interrupted append is skipped."""
+        conv_file = temp_history_dir / "torn.jsonl"
+        conv_file.write_text(
+            '{"timestamp": "2024-01-15T10:30:00", "schema": "jsonl-v1"}\n'
+            '{"role": "user", "content": "Hello"}\n'
+            '{"role": "assistant", "cont'
+        )
+
+        with patch(
+            "crowe_logic_cli.cli.history.get_history_dir", return_value=temp_history_dir
+        ):
+            loaded = load_conversation("torn")
+
+        assert loaded == [{"role": "user", "content": "Hello"}]
+
+    def test_append_after_torn_line_starts_a_new_line(self, temp_history_dir: Path) -> None:
+        """Test saving after loading a torn file does not extend the torn line."""
+        conv_file = temp_history_dir / "torn.jsonl"
+        conv_file.write_text(
+            '{"timestamp": "2024-01-15T10:30:00", "schema": "jsonl-v1"}\n'
+            '{"role": "user", "content": "Hello"}\n'
+            '{"role": "assistant", "cont'
+        )
+
+        with patch(
+            "crowe_logic_cli.cli.history.get_history_dir", return_value=temp_history_dir
+        ):
+            loaded = load_conversation("torn")
+            loaded.append({"role": "assistant", "content": "Hi"})
+            save_conversation(loaded, "torn")
+            assert load_conversation("torn") == [
+                {"role": "user", "content": "Hello"},
+                {"role": "assistant", "content": "Hi"},
+            ]
+
+    @pytest.mark.parametrize(
+        "name", ["../outside", "sub/convo", "..", "convo.meta", "convo.jsonl", ""]
+    )
+    def test_find_conversation_rejects_other_files(
+        self, tmp_path: Path, name: str
+    ) -> None:
+        """Test names never reach files outside the history dir or sidecars."""
+        history_dir = tmp_path / "history"
+        (history_dir / "sub").mkdir(parents=True)
+        for path in (
+            tmp_path / "outside.json",
+            history_dir / "sub" / "convo.json",
+            history_dir / "convo.meta.json",
+            history_dir / "convo.jsonl",
+        ):
+            path.write_text("{}")
+
+        with patch("crowe_logic_cli.cli.history.get_history_dir", return_value=history_dir):
+            with pytest.raises(FileNotFoundError, match="Conversation not found"):
+                history._find_conversation(name)
+
     def test_load_conversation_not_found(self, temp_history_dir: Path) -> None:
         """Test error when conversation doesn't exist."""
         with patch(
@@ -229,3 +423,44 @@ class TestTimestampParsing:
             date_str = loaded["timestamp"]
 
         assert date_str == "not-a-valid-timestamp"
+
+
+def _turns(n: int, size: int = 10) -> list[Message]:
+    messages: list[Message] = [{"role": "system", "content": "S"}]
+    for i in range(n):
+        messages.append({"role": "user", "content": f"u{i}".ljust(size, ".")})
+        messages.append({"role": "assistant", "content": f"a{i}".ljust(size, ".")})
+    return messages
+
+
+class TestTrimContext:
+    """Test the sliding context window."""
+
+    def test_short_conversation_is_untouched(self) -> None:
+        messages = _turns(3)
+        assert trim_context(messages, max_turns=5) is messages
+
+    def test_keeps_system_and_recent_turns(self) -> None:
+        messages = _turns(5) + [{"role": "user", "content": "latest"}]
+
+        context = trim_context(messages, max_turns=2)
+
+        assert context[0] == messages[0]
+        assert [m["content"] for m in context[1:]] == ["u4........", "a4........", "latest"]
+
+    def test_char_budget_drops_oldest_and_starts_on_user(self) -> None:
+        messages = _turns(4)
+
+        context = trim_context(messages, max_turns=10, max_chars=1 + 30)
+
+        assert context[0]["role"] == "system"
+        assert context[1]["role"] == "user"
+        assert [m["content"][:2] for m in context[1:]] == ["u3", "a3"]
+
+    def test_newest_message_always_kept(self) -> None:
+        messages: list[Message] = [{"role": "user", "content": "x" * 100}]
+        assert trim_context(messages, max_chars=10) == messages
+
+    def test_zero_turns_disables_trimming(self) -> None:
+        messages = _turns(50)
+        assert trim_context(messages, max_turns=0, max_chars=1) is messages
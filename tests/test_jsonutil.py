@@ -0,0 +1,40 @@
+"""Tests for the shared JSON helpers."""
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from crowe_logic_cli import jsonutil
+
+SAMPLE = {"content": "Grüße ✓ 名前", "usage": {"input": 1, "output": 2}, "tags": [], 3: None}
+
+
+@pytest.fixture
+def fast() -> None:
+    if jsonutil.orjson is None:
+        pytest.skip("orjson not installed")
+
+
+class TestFallbackMatchesOrjson:
+    """The stdlib fallback writes the same bytes as orjson."""
+
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_dumps(self, fast: None, monkeypatch: pytest.MonkeyPatch, indent) -> None:
+        expected = jsonutil.dumps(SAMPLE, indent=indent)
+        monkeypatch.setattr(jsonutil, "orjson", None)
+        assert jsonutil.dumps(SAMPLE, indent=indent) == expected
+
+    def test_dump_line(self, fast: None, monkeypatch: pytest.MonkeyPatch) -> None:
+        expected = jsonutil.dump_line(SAMPLE)
+        monkeypatch.setattr(jsonutil, "orjson", None)
+        assert jsonutil.dump_line(SAMPLE) == expected
+
+
+def test_fallback_is_compact_utf8(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(jsonutil, "orjson", None)
+
+    line = jsonutil.dump_line({"a": "é", "b": [1, 2]})
+
+    assert line == '{"a":"é","b":[1,2]}\n'.encode("utf-8")
+    assert jsonutil.loads(line) == json.loads(line)
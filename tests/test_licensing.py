@@ -12,6 +12,8 @@ from crowe_logic_cli.licensing import (
     FREE_FEATURES,
     PRO_FEATURES,
     ENTERPRISE_ONLY_FEATURES,
+    ALL_FEATURES,
+    PRO_OR_FREE_FEATURES,
     TIER_LIMITS,
     get_license_manager,
 )
@@ -103,6 +105,10 @@ class TestFeatureDefinitions:
         assert len(FREE_FEATURES & ENTERPRISE_ONLY_FEATURES) == 0
         assert len(PRO_FEATURES & ENTERPRISE_ONLY_FEATURES) == 0
 
+    def test_derived_feature_sets(self):
+        assert PRO_OR_FREE_FEATURES == FREE_FEATURES | PRO_FEATURES
+        assert list(ALL_FEATURES) == sorted(PRO_OR_FREE_FEATURES | ENTERPRISE_ONLY_FEATURES)
+
 
 class TestTierLimits:
     """Tests for tier limits."""
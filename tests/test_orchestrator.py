@@ -0,0 +1,120 @@
+"""Tests for orchestration modes."""
+from __future__ import annotations
+
+import asyncio
+import io
+from typing import Any, Optional
+
+import pytest
+from rich.console import Console
+
+from crowe_logic_cli.aicl import AICLIntent
+from crowe_logic_cli.orchestrator.engine import OrchestrationEngine, OrchestrationMode
+from crowe_logic_cli.orchestrator.modes import ParallelMode
+from crowe_logic_cli.orchestrator.multi_client import ModelConfig, Provider
+from crowe_logic_cli.ui.live import LiveOrchestration
+
+
+class FakeClient:
+    """Stand-in for MultiModelClient that records concurrency."""
+
+    def __init__(self, failing: tuple[str, ...] = ()) -> None:
+        self.failing = failing
+        self.models = {
+            m: ModelConfig(model_id=m, provider=Provider.OPENAI, display_name=m, api_key="k")
+            for m in ("a", "b", "c")
+        }
+        self.active = 0
+        self.peak = 0
+
+    def get_model(self, model_id: str) -> ModelConfig:
+        if model_id not in self.models:
+            raise ValueError(f"Model {model_id} not registered")
+        return self.models[model_id]
+
+    async def complete(
+        self, model_id: str, messages: list, system: Optional[str] = None, **kwargs: Any
+    ) -> str:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        if model_id in self.failing:
+            raise RuntimeError("boom")
+        return f"answer from {model_id}"
+
+
+def _run_parallel(client: FakeClient, models: list[str], **kwargs: Any):
+    engine = OrchestrationEngine()
+    engine.client = client  # type: ignore[assignment]
+    engine.register_mode(OrchestrationMode.PARALLEL, ParallelMode(client))  # type: ignore[arg-type]
+    return asyncio.run(engine.orchestrate("task", OrchestrationMode.PARALLEL, models, **kwargs))
+
+
+def _run_parallel_with_display(display: LiveOrchestration, client: FakeClient, models: list[str]):
+    engine = OrchestrationEngine()
+    engine.client = client  # type: ignore[assignment]
+    engine.register_mode(OrchestrationMode.PARALLEL, ParallelMode(client))  # type: ignore[arg-type]
+    return asyncio.run(display.run_with_display(
+        engine.orchestrate,
+        "task",
+        OrchestrationMode.PARALLEL,
+        models,
+        on_message=display.on_message,
+        on_progress=display.on_progress,
+    ))
+
+
+class TestParallelMode:
+    """Tests for ParallelMode."""
+
+    def test_requests_run_concurrently_within_limit(self) -> None:
+        client = FakeClient()
+        result = _run_parallel(client, ["a", "b", "c"], max_concurrency=2)
+
+        assert client.peak == 2
+        assert result.final_output == "answer from a"
+        assert result.model_contributions == {"a": 1, "b": 1, "c": 1}
+
+    def test_failed_model_is_recorded_not_fatal(self) -> None:
+        client = FakeClient(failing=("a",))
+        result = _run_parallel(client, ["a", "b"])
+
+        errors = result.conversation.get_messages_by_intent(AICLIntent.ERROR)
+        assert [m.sender_model for m in errors] == ["a"]
+        assert result.final_output == "answer from b"
+        assert result.model_contributions == {"b": 1}
+
+    def test_all_models_failing_raises(self) -> None:
+        with pytest.raises(RuntimeError):
+            _run_parallel(FakeClient(failing=("a", "b")), ["a", "b"])
+
+    def test_unregistered_model_fails_before_requests(self) -> None:
+        client = FakeClient()
+        with pytest.raises(ValueError):
+            _run_parallel(client, ["a", "missing"])
+        assert client.peak == 0
+
+
+class TestLiveOrchestration:
+    """Tests for the live orchestration display."""
+
+    def test_run_with_display_returns_result(self) -> None:
+        display = LiveOrchestration(Console(file=io.StringIO(), width=100))
+        display.setup(OrchestrationMode.PARALLEL, ["a", "b"])
+
+        result = _run_parallel_with_display(display, FakeClient(), ["a", "b"])
+
+        assert result.final_output == "answer from a"
+        assert display.final_output == "answer from a"
+        assert display.is_complete
+        assert len(display.messages) == 3
+
+    def test_run_with_display_completes_on_error(self) -> None:
+        display = LiveOrchestration(Console(file=io.StringIO(), width=100))
+        display.setup(OrchestrationMode.PARALLEL, ["a"])
+
+        with pytest.raises(RuntimeError):
+            _run_parallel_with_display(display, FakeClient(failing=("a",)), ["a"])
+        assert display.is_complete
+
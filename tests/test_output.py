@@ -1,13 +1,22 @@
 """Tests for output formatting and clipboard utilities."""
+import io
 import json
 from dataclasses import dataclass
+from unittest.mock import patch
 
 import pytest
+from rich.console import Console
 
+from crowe_logic_cli import jsonutil
 from crowe_logic_cli.output import (
     OutputFormat,
+    StreamCoalescer,
     copy_to_clipboard,
     format_output,
+    get_console,
+    mask_secret,
+    print_output,
+    print_stream,
     to_json_serializable,
 )
 
@@ -64,6 +73,18 @@ class TestFormatOutput:
         result = format_output(data, OutputFormat.JSON)
         assert json.loads(result) == data
 
+    def test_json_format_matches_stdlib_layout(self, monkeypatch):
+        data = {"content": "héllo [b]", "usage": {"input": 1, "output": 2}, "tags": []}
+        fast = format_output(data, OutputFormat.JSON)
+        monkeypatch.setattr(jsonutil, "orjson", None)
+        assert format_output(data, OutputFormat.JSON) == fast
+        assert fast == json.dumps(data, indent=2, ensure_ascii=False)
+
+    def test_print_output_json_highlights_without_reformatting(self):
+        buf = io.StringIO()
+        print_output({"a": [1, 2]}, OutputFormat.JSON, console=Console(file=buf))
+        assert buf.getvalue() == json.dumps({"a": [1, 2]}, indent=2) + "\n"
+
     def test_markdown_format_string(self):
         result = format_output("hello", OutputFormat.MARKDOWN)
         assert result == "hello"
@@ -83,3 +104,89 @@ class TestCopyToClipboard:
         # Actual clipboard access may not work in CI
         result = copy_to_clipboard("test")
         assert isinstance(result, bool)
+
+
+class TestStreamCoalescer:
+    """Tests for StreamCoalescer and print_stream."""
+
+    def test_batches_small_chunks(self):
+        class CountingIO(io.StringIO):
+            writes = 0
+
+            def write(self, s):
+                CountingIO.writes += 1
+                return super().write(s)
+
+        buf = CountingIO()
+        out = StreamCoalescer(buf, max_chars=10, max_delay=60)
+        for ch in "abcdefghijklmnopqrstuvwxyz":
+            out.feed(ch)
+        assert out.close() == "abcdefghijklmnopqrstuvwxyz"
+        assert buf.getvalue() == "abcdefghijklmnopqrstuvwxyz"
+        assert CountingIO.writes == 3
+
+    def test_flushes_on_newline(self):
+        buf = io.StringIO()
+        out = StreamCoalescer(buf, max_chars=1000, max_delay=60)
+        out.feed("line\n")
+        assert buf.getvalue() == "line\n"
+        out.feed("tail")
+        assert buf.getvalue() == "line\n"
+        out.close()
+        assert buf.getvalue() == "line\ntail"
+
+    def test_print_stream_flushes_on_newline_and_size(self):
+        writes = []
+
+        class RecordingIO(io.StringIO):
+            def write(self, s):
+                writes.append(s)
+                return super().write(s)
+
+        console = Console(file=RecordingIO())
+        # Freeze the clock so the 50ms timer can't add writes on a slow machine
+        with patch("time.monotonic", return_value=0.0):
+            print_stream(iter(["fir", "st\n", "a" * 40, "b" * 40, "c\n"]), console)
+        # A short line goes out in one write; a line past 64 chars is split
+        assert writes == ["first\n", "a" * 40 + "b" * 40, "c\n", "\n"]
+
+    def test_print_stream_writes_raw_text(self):
+        buf = io.StringIO()
+        console = Console(file=buf)
+        text = print_stream(iter(["[bold]", "hi"]), console)
+        assert text == "[bold]hi"
+        assert buf.getvalue() == "[bold]hi\n"
+
+
+class TestMaskSecret:
+    """Tests for mask_secret."""
+
+    def test_fixed_width_mask_hides_length_and_prefix(self):
+        assert mask_secret("abcdefghij") == "********ghij"
+        assert mask_secret("x" * 40 + "wxyz") == "********wxyz"
+
+    def test_short_value_fully_masked(self):
+        assert mask_secret("abcd") == "****"
+        assert mask_secret("") == ""
+
+
+class TestGetConsole:
+    """Tests for the shared console."""
+
+    def test_cli_modules_share_one_console(self):
+        from crowe_logic_cli.cli import ask, code
+
+        assert get_console() is get_console()
+        assert ask.console is code.console is get_console()
+
+    def test_library_defaults_use_shared_console(self):
+        from crowe_logic_cli import diagnostics, main
+        from crowe_logic_cli.retry import RetryableClient
+        from crowe_logic_cli.ui.diff import DiffView
+        from crowe_logic_cli.ui.live import LiveOrchestration
+
+        shared = get_console()
+        assert main.console is diagnostics.console is shared
+        assert DiffView().console is shared
+        assert LiveOrchestration().console is shared
+        assert RetryableClient().console is shared